@@ -1,5 +1,7 @@
 
+import os
 import json
+import asyncio
 import binascii
 import aiohttp
 
@@ -13,37 +15,129 @@ class RPC():
         self.app = app
         self.utils = utils
 
-    async def _rpc_call(self, method, params):
+        self.session = None
+        self.rpc_config = None
+        self.config_mtime = None
+        self.url = None
+        self.auth = None
+
+
+    def get_rpc_config(self):
+        config_path = self.utils.get_config_path()
         try:
+            mtime = os.stat(config_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self.rpc_config is None or mtime != self.config_mtime:
             rpcuser, rpcpassword, rpcport = self.utils.get_rpc_config()
-            url = f"http://localhost:{rpcport}/"
-            auth = aiohttp.BasicAuth(rpcuser, rpcpassword)
+            self.auth = aiohttp.BasicAuth(rpcuser, rpcpassword)
+            self.url = f"http://localhost:{rpcport}/"
+            self.rpc_config = (rpcuser, rpcpassword, rpcport)
+            self.config_mtime = mtime
+        return self.rpc_config
+
+
+    def get_session(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        if loop is not self.app.loop:
+            return None
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=8,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+
+    async def close(self):
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+
+    async def _rpc_call(self, method, params):
+        try:
+            self.get_rpc_config()
             payload = {
                 "jsonrpc": "1.0",
                 "id": "curltest",
                 "method": method,
                 "params": params,
             }
-            async with aiohttp.ClientSession(auth=auth) as session:
-                async with session.post(url, json=payload) as response:
-                    text = await response.text()
-                    try:
-                        data = json.loads(text)
-                    except json.JSONDecodeError:
-                        return None, text.strip()
+            data, error = await self._post(payload)
+            if error is not None:
+                return None, error
 
-                    error = data.get("error")
-                    if error:
-                        code = error.get("code")
-                        message = error.get("message", "").strip()
-                        if code == -28:
-                            return None, message
-                        return None, message
+            error = data.get("error")
+            if error:
+                message = error.get("message", "").strip()
+                return None, message
 
-                    return data.get("result"), None
+            return data.get("result"), None
 
         except Exception as e:
             return None, str(e).strip()
+
+
+    async def batch(self, calls):
+        if not calls:
+            return []
+        try:
+            self.get_rpc_config()
+            payload = [
+                {
+                    "jsonrpc": "1.0",
+                    "id": index,
+                    "method": method,
+                    "params": params,
+                }
+                for index, (method, params) in enumerate(calls)
+            ]
+            data, error = await self._post(payload)
+            if error is not None:
+                return [(None, error)] * len(calls)
+
+            if not isinstance(data, list):
+                error = data.get("error") or {}
+                message = error.get("message", "").strip()
+                return [(None, message)] * len(calls)
+
+            results = [(None, "No response")] * len(calls)
+            for item in data:
+                index = item.get("id")
+                if not isinstance(index, int) or not 0 <= index < len(calls):
+                    continue
+                error = item.get("error")
+                if error:
+                    results[index] = (None, error.get("message", "").strip())
+                else:
+                    results[index] = (item.get("result"), None)
+            return results
+
+        except Exception as e:
+            return [(None, str(e).strip())] * len(calls)
+
+
+    async def _post(self, payload):
+        session = self.get_session()
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._send(session, payload)
+        return await self._send(session, payload)
+
+
+    async def _send(self, session, payload):
+        async with session.post(self.url, json=payload, auth=self.auth) as response:
+            text = await response.text()
+            try:
+                return json.loads(text), None
+            except json.JSONDecodeError:
+                return None, text.strip()
         
         
     async def stopNode(self):
@@ -166,12 +260,6 @@ class RPC():
             [f"{txid}"]
         )
     
-    async def getBlock(self, block):
-        return await self._rpc_call(
-            "getblock",
-            [f"{block}", 2]
-        )
-    
     async def listTransactions(self, count, tx_from):
         return await self._rpc_call(
             "listtransactions",
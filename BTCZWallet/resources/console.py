@@ -603,6 +603,7 @@ class Console(Window):
                 " → applogs :   Open the application logs directory\n"
                 " → capture :   captures the application current visual state\n"
                 " → record start/stop :   Record the current application window as an animated GIF (10 FPS)\n"
+                " → verify :   Re-verify the checksums of the node binaries and Zk params\n"
                 "================================================\n"
                 " → merge <address> : ! Merge all transparent balances from your wallet into a single address\n"
                 "                     Usage: merge <address>\n"
@@ -627,6 +628,17 @@ class Console(Window):
         elif value == "capture":
             self.create_app_screenshot()
 
+        elif value == "verify":
+            self.info_shell("Verifying binaries and Zk params...")
+            results = await self.utils.verify_files()
+            for file_name, valid in results:
+                if valid is None:
+                    self.error_shell(f"{file_name} : missing")
+                elif valid:
+                    self.info_shell(f"{file_name} : OK")
+                else:
+                    self.error_shell(f"{file_name} : checksum mismatch")
+
         elif value.startswith("record"):
             parts = value.split()
             if len(parts) < 2:
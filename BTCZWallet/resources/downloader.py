@@ -0,0 +1,305 @@
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+
+import aiohttp
+
+from .manifest import BLOCK_SIZE, combine_digests
+
+
+CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+class Downloader():
+    def __init__(
+        self,
+        app:'App',
+        connector = None,
+        ssl = None,
+        segments = 4,
+        segment_size = 8 * 1024 * 1024,
+        buffer_size = 1024 * 1024,
+        chunk_size = 64 * 1024,
+        progress_interval = 0.25,
+        rate_limit = 0,
+        retries = 5,
+        manifest = None
+    ):
+        super().__init__()
+
+        self.app = app
+        self.connector = connector
+        self.ssl = ssl
+        self.segments = segments
+        self.segment_size = segment_size
+        self.buffer_size = buffer_size
+        self.chunk_size = chunk_size
+        self.progress_interval = progress_interval
+        self.rate_limit = rate_limit
+        self.retries = retries
+        self.manifest = manifest
+        self.block_size = manifest.block_size if manifest else BLOCK_SIZE
+
+        self.tokens = 0
+        self.refilled = time.monotonic()
+        self.reported = 0
+        self.saved = 0
+
+
+    async def download(self, url, destination, progress = None, expected = None):
+        part_path = destination + ".part"
+        state_path = destination + ".part.json"
+        async with self.session() as session:
+            size, ranges = await self.probe(session, url)
+            if expected and size and size != expected[0]:
+                raise aiohttp.ClientPayloadError(
+                    f"Unexpected size for {os.path.basename(destination)} ({size} of {expected[0]} bytes)"
+                )
+            ranges = ranges and size > 0
+            state = None
+            if ranges and os.path.exists(part_path):
+                state = self.load_state(state_path, url, size, expected)
+            if state is None:
+                if ranges and not expected:
+                    segments = self.split(size)
+                else:
+                    segments = [[0, size - 1 if size else None, 0]]
+                state = {"url": url, "size": size, "segments": segments, "blocks": {}, "checksum": bool(expected)}
+                with open(part_path, "wb") as file:
+                    if size:
+                        file.truncate(size)
+            self.save_state(state_path, state)
+
+            downloaded = sum(segment[2] for segment in state["segments"])
+            if downloaded:
+                self.app.console.info_log(
+                    f"Resuming {os.path.basename(destination)} at {downloaded * 100 // size}%"
+                )
+            counter = {"downloaded": downloaded, "checksum": None}
+            self.reported = 0
+            tasks = [
+                asyncio.create_task(
+                    self.fetch_segment(session, url, part_path, state_path, state, segment, ranges, counter, progress)
+                )
+                for segment in state["segments"]
+                if segment[1] is None or segment[0] + segment[2] <= segment[1]
+            ]
+            try:
+                await asyncio.gather(*tasks)
+                if size and counter["downloaded"] != size:
+                    raise aiohttp.ClientPayloadError(
+                        f"Incomplete download ({counter['downloaded']} of {size} bytes)"
+                    )
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                self.save_state(state_path, state)
+                raise
+
+        if expected and counter["checksum"] != expected[1]:
+            os.remove(part_path)
+            if os.path.exists(state_path):
+                os.remove(state_path)
+            raise aiohttp.ClientPayloadError(f"Checksum mismatch for {os.path.basename(destination)}")
+        digest = self.file_digest(state, counter["downloaded"])
+        os.replace(part_path, destination)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        if self.manifest:
+            if expected:
+                digest = expected[1]
+            elif digest is None:
+                digest = self.manifest.hash_file(destination)
+            self.manifest.record(destination, digest)
+        if progress:
+            progress(counter["downloaded"], size)
+        return destination
+
+
+    def session(self):
+        connector = self.connector() if self.connector else None
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+    async def remote_size(self, url):
+        async with self.session() as session:
+            size, _ = await self.probe(session, url)
+        return size
+
+
+    async def probe(self, session, url):
+        async with session.get(url, headers={"Range": "bytes=0-0"}, ssl=self.ssl) as response:
+            response.raise_for_status()
+            if response.status == 206:
+                match = CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+                if match and match.group(3) != "*":
+                    return int(match.group(3)), True
+            return int(response.headers.get("Content-Length", 0)), False
+
+
+    def split(self, size):
+        count = max(1, min(self.segments, -(-size // self.segment_size)))
+        length = -(-size // count)
+        length = -(-length // self.block_size) * self.block_size
+        return [
+            [start, min(start + length, size) - 1, 0]
+            for start in range(0, size, length)
+        ]
+
+
+    def load_state(self, state_path, url, size, expected = None):
+        try:
+            with open(state_path, "r") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if state.get("url") != url or state.get("size") != size:
+            return None
+        if state.get("block_size") != self.block_size or "blocks" not in state:
+            return None
+        if state.get("checksum") != bool(expected):
+            return None
+        return state
+
+
+    def save_state(self, state_path, state, force = True):
+        now = time.monotonic()
+        if not force and now - self.saved < 1:
+            return
+        self.saved = now
+        state["block_size"] = self.block_size
+        temp_path = state_path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump(state, file)
+        os.replace(temp_path, state_path)
+
+
+    async def fetch_segment(self, session, url, part_path, state_path, state, segment, ranges, counter, progress):
+        attempt = 0
+        hasher = self.resume_hash(part_path, segment)
+        checksum = self.resume_checksum(part_path, segment) if state.get("checksum") else None
+        while True:
+            start, end, done = segment
+            headers = {}
+            if ranges:
+                headers["Range"] = f"bytes={start + done}-{end}"
+            try:
+                async with session.get(url, headers=headers, ssl=self.ssl) as response:
+                    response.raise_for_status()
+                    if ranges and response.status != 206:
+                        raise aiohttp.ClientPayloadError("Server ignored the range request")
+                    with open(part_path, "r+b") as file:
+                        file.seek(start + done)
+                        buffer = bytearray()
+                        try:
+                            async for chunk in response.content.iter_chunked(self.chunk_size):
+                                await self.throttle(len(chunk))
+                                buffer += chunk
+                                if len(buffer) >= self.buffer_size:
+                                    hasher = self.flush(file, buffer, segment, counter, hasher, state["blocks"], checksum)
+                                    self.save_state(state_path, state, False)
+                                self.report(progress, counter["downloaded"] + len(buffer), state["size"])
+                        finally:
+                            hasher = self.flush(file, buffer, segment, counter, hasher, state["blocks"], checksum)
+                if end is None or segment[0] + segment[2] > end:
+                    position = segment[0] + segment[2]
+                    if position % self.block_size:
+                        state["blocks"][str(position // self.block_size)] = hasher.hexdigest()
+                    if checksum:
+                        counter["checksum"] = checksum.hexdigest()
+                    return
+                raise aiohttp.ClientPayloadError("Segment ended early")
+            except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as e:
+                if not ranges:
+                    raise
+                if segment[2] > done:
+                    attempt = 0
+                attempt += 1
+                if attempt > self.retries:
+                    raise
+                self.save_state(state_path, state)
+                self.app.console.warning_log(f"Download interrupted ({e}), retrying in {attempt * 2}s...")
+                await asyncio.sleep(attempt * 2)
+
+
+    def resume_hash(self, part_path, segment):
+        hasher = hashlib.sha256()
+        position = segment[0] + segment[2]
+        offset = position % self.block_size
+        if offset:
+            with open(part_path, "rb") as file:
+                file.seek(position - offset)
+                hasher.update(file.read(offset))
+        return hasher
+
+
+    def resume_checksum(self, part_path, segment):
+        checksum = hashlib.sha256()
+        remaining = segment[0] + segment[2]
+        if remaining:
+            with open(part_path, "rb") as file:
+                while remaining:
+                    data = file.read(min(remaining, self.buffer_size))
+                    if not data:
+                        break
+                    checksum.update(data)
+                    remaining -= len(data)
+        return checksum
+
+
+    def flush(self, file, buffer, segment, counter, hasher, blocks, checksum = None):
+        if not buffer:
+            return hasher
+        file.write(buffer)
+        if checksum:
+            checksum.update(buffer)
+        position = segment[0] + segment[2]
+        offset = 0
+        while offset < len(buffer):
+            take = min(self.block_size - position % self.block_size, len(buffer) - offset)
+            hasher.update(buffer[offset:offset + take])
+            offset += take
+            position += take
+            if position % self.block_size == 0:
+                blocks[str(position // self.block_size - 1)] = hasher.hexdigest()
+                hasher = hashlib.sha256()
+        segment[2] += len(buffer)
+        counter["downloaded"] += len(buffer)
+        buffer.clear()
+        return hasher
+
+
+    def file_digest(self, state, size):
+        count = -(-size // self.block_size)
+        try:
+            digests = [bytes.fromhex(state["blocks"][str(index)]) for index in range(count)]
+        except KeyError:
+            return None
+        return combine_digests(digests)
+
+
+    async def throttle(self, size):
+        if not self.rate_limit:
+            return
+        now = time.monotonic()
+        self.tokens = min(self.rate_limit, self.tokens + (now - self.refilled) * self.rate_limit)
+        self.refilled = now
+        self.tokens -= size
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate_limit)
+
+
+    def report(self, progress, downloaded, size):
+        if not progress:
+            return
+        now = time.monotonic()
+        if now - self.reported < self.progress_interval:
+            return
+        self.reported = now
+        progress(downloaded, size)
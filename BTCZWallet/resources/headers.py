@@ -0,0 +1,100 @@
+
+from collections import OrderedDict
+
+from toga import App
+
+from .storage import StorageTxs
+
+
+class BlockHeaders():
+    def __init__(self, app:App, main, size = 4096):
+        super().__init__()
+
+        self.app = app
+        self.main = main
+
+        self.size = size
+        self.depth = 6
+        self.hashes = OrderedDict()
+        self.heights = OrderedDict()
+
+        self.storage = StorageTxs(self.app)
+
+
+    def remember(self, header, deep):
+        self.hashes[header["hash"]] = header
+        self.hashes.move_to_end(header["hash"])
+        if deep:
+            self.heights[header["height"]] = header
+            self.heights.move_to_end(header["height"])
+        for cache in (self.hashes, self.heights):
+            while len(cache) > self.size:
+                cache.popitem(last=False)
+
+
+    def lookup(self, block):
+        cache = self.heights if isinstance(block, int) else self.hashes
+        header = cache.get(block)
+        if header:
+            cache.move_to_end(block)
+        return header
+
+
+    async def get_header(self, block):
+        headers = await self.get_headers([block])
+        return headers.get(block)
+
+
+    async def get_headers(self, blocks):
+        headers = {}
+        missing = []
+        for block in dict.fromkeys(blocks):
+            header = self.lookup(block)
+            if header:
+                headers[block] = header
+            else:
+                missing.append(block)
+        if not missing:
+            return headers
+
+        for blockhash, height, time in await self.storage.aio.get_headers(missing):
+            header = {"hash": blockhash, "height": height, "time": time}
+            self.remember(header, True)
+            for block in (blockhash, height):
+                if block in missing:
+                    headers[block] = header
+
+        pending = {}
+        heights = [block for block in missing if isinstance(block, int) and block not in headers]
+        if heights:
+            results = await self.main.scheduler.fetch(
+                [("getblockhash", [height]) for height in heights]
+            )
+            for height, (blockhash, _) in zip(heights, results):
+                if blockhash:
+                    pending.setdefault(blockhash, []).append(height)
+        for block in missing:
+            if isinstance(block, str) and block not in headers:
+                pending.setdefault(block, []).append(block)
+
+        hashes = list(pending)
+        deep_headers = []
+        for index in range(0, len(hashes), 100):
+            chunk = hashes[index:index + 100]
+            results = await self.main.scheduler.fetch(
+                [("getblockheader", [blockhash, True]) for blockhash in chunk]
+            )
+            for blockhash, (result, _) in zip(chunk, results):
+                if not result or result.get("confirmations", -1) < 0:
+                    continue
+                header = {"hash": result["hash"], "height": result["height"], "time": result["time"]}
+                deep = result["confirmations"] >= self.depth
+                self.remember(header, deep)
+                if deep:
+                    deep_headers.append((header["hash"], header["height"], header["time"]))
+                for block in pending[blockhash]:
+                    headers[block] = header
+
+        if deep_headers:
+            await self.storage.aio.insert_headers(deep_headers)
+        return headers
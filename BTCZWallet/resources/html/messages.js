@@ -448,21 +448,32 @@ function addMessage(userType, username, content, timestamp, edited_timestamp, am
   chatContainer.appendChild(message);
 }
 
-function insertMessage(index, userType, username, content, timestamp, edited_timestamp, amount = 0, repliedUsername = null ,repliedMessage = null) {
-  const message = _createMessageElement(userType, username, content, timestamp, edited_timestamp, amount, true, repliedUsername, repliedMessage);
-  const messages = chatContainer.querySelectorAll('.message');
+function _createMessagesFragment(messages) {
+  const fragment = document.createDocumentFragment();
+  for (const args of messages) {
+    const [userType, username, content, timestamp, edited_timestamp, amount = 0, repliedUsername = null, repliedMessage = null] = args;
+    fragment.appendChild(
+      _createMessageElement(userType, username, content, timestamp, edited_timestamp, amount, true, repliedUsername, repliedMessage)
+    );
+  }
+  return fragment;
+}
+
+function addMessages(messages) {
+  chatContainer.appendChild(_createMessagesFragment(messages));
+}
+
+function insertMessages(messages) {
+  const fragment = _createMessagesFragment(messages);
+  const firstMessage = chatContainer.querySelector('.message');
 
   const oldScrollTop = chatContainer.scrollTop;
   const oldScrollHeight = chatContainer.scrollHeight;
 
-  if (messages.length === 0) {
-    chatContainer.appendChild(message);
-  } else if (index <= 0) {
-    chatContainer.insertBefore(message, messages[0]);
-  } else if (index >= messages.length) {
-    chatContainer.appendChild(message);
+  if (firstMessage) {
+    chatContainer.insertBefore(fragment, firstMessage);
   } else {
-    chatContainer.insertBefore(message, messages[index]);
+    chatContainer.appendChild(fragment);
   }
 
   const newScrollHeight = chatContainer.scrollHeight;
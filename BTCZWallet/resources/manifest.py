@@ -0,0 +1,156 @@
+
+import os
+import json
+import mmap
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def combine_digests(digests):
+    return hashlib.sha256(b"".join(digests)).hexdigest()
+
+
+class VerificationManifest():
+    def __init__(self, app:'App', workers = 4, block_size = BLOCK_SIZE):
+        super().__init__()
+
+        self.app = app
+        self.app_data = self.app.paths.data
+        self.workers = workers
+        self.block_size = block_size
+
+        self.manifest_path = os.path.join(str(self.app_data), 'manifest.json')
+        self.lock = threading.RLock()
+        self.entries = {}
+        self.load_manifest()
+
+
+    def load_manifest(self):
+        with self.lock:
+            try:
+                with open(self.manifest_path, 'r') as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                return
+            if not isinstance(entries, dict) or entries.get("block_size") != self.block_size:
+                return
+            files = entries.get("files", {})
+            self.entries = {path: entry for path, entry in files.items() if os.path.exists(path)}
+            if len(self.entries) != len(files):
+                self.save_manifest()
+
+
+    def save_manifest(self):
+        with self.lock:
+            temp_path = self.manifest_path + ".tmp"
+            try:
+                with open(temp_path, 'w') as f:
+                    json.dump({"block_size": self.block_size, "files": self.entries}, f, indent=4)
+                os.replace(temp_path, self.manifest_path)
+            except OSError as e:
+                self.app.console.error_log(f"Error saving manifest: {e}")
+
+
+    def key(self, path):
+        return os.path.normcase(os.path.abspath(str(path)))
+
+
+    def check(self, path, expected = None):
+        with self.lock:
+            entry = self.entries.get(self.key(path))
+        if entry is None:
+            return None
+        if expected and entry["sha256"] != expected[1]:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size != entry["size"]:
+            return False
+        if stat.st_mtime_ns == entry["mtime"]:
+            return True
+        return None
+
+
+    def record(self, path, digest):
+        stat = os.stat(path)
+        with self.lock:
+            self.entries[self.key(path)] = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "sha256": digest
+            }
+            self.save_manifest()
+
+
+    def forget(self, path):
+        with self.lock:
+            if self.entries.pop(self.key(path), None) is not None:
+                self.save_manifest()
+
+
+    def hash_file(self, path):
+        size = os.path.getsize(path)
+        if not size:
+            return combine_digests([])
+        count = -(-size // self.block_size)
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                def hash_block(index):
+                    start = index * self.block_size
+                    with memoryview(data) as view:
+                        with view[start:start + self.block_size] as block:
+                            return hashlib.sha256(block).digest()
+                with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                    digests = list(pool.map(hash_block, range(count)))
+        return combine_digests(digests)
+
+
+    def checksum_file(self, path):
+        checksum = hashlib.sha256()
+        if not os.path.getsize(path):
+            return checksum.hexdigest()
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                with memoryview(data) as view:
+                    for start in range(0, len(view), self.block_size):
+                        with view[start:start + self.block_size] as block:
+                            checksum.update(block)
+        return checksum.hexdigest()
+
+
+    def verify(self, path, force = None, expected = None, size = None):
+        if not os.path.exists(path):
+            return None
+        if size and os.path.getsize(path) != size:
+            self.forget(path)
+            self.app.console.error_log(f"Size mismatch : {path}")
+            return False
+        if not force:
+            valid = self.check(path, expected)
+            if valid is not None:
+                return valid
+        if expected:
+            size, sha256 = expected
+            if os.path.getsize(path) != size or self.checksum_file(path) != sha256:
+                self.forget(path)
+                self.app.console.error_log(f"Checksum mismatch : {path}")
+                return False
+            self.record(path, sha256)
+            return True
+        with self.lock:
+            entry = self.entries.get(self.key(path))
+        if entry is None and not size:
+            self.app.console.warning_log(f"Unverified file : {path}")
+            return False
+        digest = self.hash_file(path)
+        if entry and entry["sha256"] != digest:
+            self.app.console.error_log(f"Checksum mismatch : {path}")
+            return False
+        self.record(path, digest)
+        return True
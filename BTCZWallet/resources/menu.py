@@ -29,10 +29,13 @@ from .receive import Receive
 from .send import Send
 from .messages import Messages, EditUser
 from .mining import Mining
-from .storage import StorageMessages, StorageAddresses
+from .storage import StorageMessages, StorageAddresses, StorageEngine
 from .network import Peer, AddNode, TorConfig
 from .mobile import Mobile
 from .server import MobileServer
+from .scheduler import NodeScheduler
+from .headers import BlockHeaders
+from .operations import OperationTracker
 
 
 user32 = ctypes.windll.user32
@@ -83,6 +86,9 @@ class Menu(Window):
         self.app.console.main = self
         self._impl.native.Owner = self.app.console._impl.native
 
+        self.scheduler = NodeScheduler(self.app, self, rpc)
+        self.headers = BlockHeaders(self.app, self)
+        self.operations = OperationTracker(self.app, self)
         self.storage = StorageMessages(self.app)
         self.addresses_storage = StorageAddresses(self.app)
         self.statusbar = AppStatusBar(self.app, self, settings, utils, units, rpc, tr, font)
@@ -164,6 +170,7 @@ class Menu(Window):
         self.content = self.main_box
 
         self.statusbar.run_statusbar_tasks()
+        self.scheduler.start()
         self.insert_menu_buttons()
 
 
@@ -331,7 +338,7 @@ class Menu(Window):
         await asyncio.sleep(1)
         self.app.loop.create_task(self.message_page.gather_unread_memos())
         await asyncio.sleep(1)
-        self.app.loop.create_task(self.count_unread_messages())
+        self.scheduler.subscribe([], None, self.count_unread_messages, ("table:unread_messages",))
 
 
     def add_actions_cmds(self):
@@ -395,6 +402,7 @@ class Menu(Window):
         else:
             self.toolbar.hide_balances_cmd.checked = True
             self.settings.update_settings("hidden_balances", True)
+        self.scheduler.notify("balances_visibility")
         self.transactions_page.reload_transactions()
 
 
@@ -540,25 +548,21 @@ class Menu(Window):
             )
 
 
-    async def count_unread_messages(self):
+    def count_unread_messages(self):
         text = self.tr.text("messages_button")
-        while True:
-            unread_messages = self.storage.get_unread_messages()
-            if unread_messages:
-                count = len(unread_messages)
-                if count > 99:
-                    count = "99+"
-                self.message_button.text = f"{text} [{count}]"
-            else:
-                self.message_button.text = text
-            if self.message_button_toggle:
-                icon = "images/messages_a.png"
-            else:
-                icon = "images/messages_i.png"
-            message_icon = self.menu_icon(icon)
-            self.message_button._impl.native.Image = Drawing.Image.FromFile(message_icon)
-
-            await asyncio.sleep(5)
+        count = self.storage.get_unread_count()
+        if count:
+            if count > 99:
+                count = "99+"
+            self.message_button.text = f"{text} [{count}]"
+        else:
+            self.message_button.text = text
+        if self.message_button_toggle:
+            icon = "images/messages_a.png"
+        else:
+            icon = "images/messages_i.png"
+        message_icon = self.menu_icon(icon)
+        self.message_button._impl.native.Image = Drawing.Image.FromFile(message_icon)
 
 
     def clean_unread_messages(self):
@@ -669,6 +673,9 @@ class Menu(Window):
                 self.home_page.clear_cache()
                 self.notify.hide()
                 self.notify.dispose()
+                self.scheduler.stop()
+                await self.rpc.close()
+                StorageEngine.close_all()
                 self.app.exit()
 
 
@@ -814,6 +821,7 @@ class Menu(Window):
         self.message_button.style.background_color = YELLOW
         self.pages.add(self.message_page)
         self.message_page.insert_widgets()
+        self.scheduler.notify("messages")
     
     def message_button_mouse_enter(self, sender, event):
         if self.message_button_toggle:
@@ -577,7 +577,14 @@ class Contact(Box):
                 self.unread_messages
             )
         self.insert_contact_menustrip()
-        self.app.loop.create_task(self.update_contact())
+        self.subscription = self.main.scheduler.subscribe(
+            [], None, self.update_contact,
+            (
+                "messages",
+                f"table:contacts:{self.contact_id}", "table:contacts:*",
+                f"table:unread_messages:{self.contact_id}", "table:unread_messages:*"
+            )
+        )
 
 
     def insert_contact_menustrip(self):
@@ -615,29 +622,24 @@ class Contact(Box):
         self.username_label._impl.native.ContextMenuStrip = context_menu
 
 
-    async def update_contact(self):
-        while True:
-            if not self.main.message_button_toggle:
-                await asyncio.sleep(1)
-                continue
-            username = self.storage.get_contact_username(self.contact_id)
-            if username:
-                if username[0] != self.username:
-                    self.username_label.text = username[0]
-                    self.username = username[0]
-            unread_messages = self.storage.get_unread_messages(self.contact_id)
-            if unread_messages:
-                unread_count = len(unread_messages)
-                if unread_count > self.unread_count:
-                    self.unread_messages.text = unread_count
-                    self.unread_messages.style.visibility = VISIBLE
-                    self.unread_count = unread_count
-            else:
-                self.unread_messages.text = ""
-                self.unread_messages.style.visibility = HIDDEN
-                self.unread_count = 0
-
-            await asyncio.sleep(3)
+    def update_contact(self):
+        if not self.main.message_button_toggle:
+            return
+        username = self.storage.get_contact_username(self.contact_id)
+        if username:
+            if username[0] != self.username:
+                self.username_label.text = username[0]
+                self.username = username[0]
+        unread_count = self.storage.get_unread_count(self.contact_id)
+        if unread_count:
+            if unread_count > self.unread_count:
+                self.unread_messages.text = unread_count
+                self.unread_messages.style.visibility = VISIBLE
+                self.unread_count = unread_count
+        else:
+            self.unread_messages.text = ""
+            self.unread_messages.style.visibility = HIDDEN
+            self.unread_count = 0
 
 
     def copy_contact_address(self):
@@ -656,12 +658,13 @@ class Contact(Box):
                         self.chat.contact_info_box.clear()
                         self.chat.clear_chat()
                         self.chat.restore()
-                        self.chat.last_message_timestamp = None
+                        self.chat.history_cursor = None
                         self.chat.last_unread_timestamp = None
                         self.chat.selected_contact_toggle = None
             if result is True:
                 self.storage.ban(self.address, self.username)
                 self.storage.delete_contact(self.address)
+                self.main.scheduler.unsubscribe(self.subscription)
                 self.chat.contacts_box.remove(self)
                 self.main.mobile_server.broker.push("update_contacts")
                 self.main.info_dialog(
@@ -837,30 +840,20 @@ class Pending(Box):
     async def send_memo(self, address, toaddress, amount, txfee, memo, id):
         operation, _= await self.rpc.SendMemo(address, toaddress, amount, txfee, memo)
         if operation:
-            transaction_status, _= await self.rpc.z_getOperationStatus(operation)
-            if isinstance(transaction_status, list) and transaction_status:
-                status = transaction_status[0].get('status')
-                if status == "executing" or status =="success":
-                    await asyncio.sleep(1)
-                    while True:
-                        transaction_result, _= await self.rpc.z_getOperationResult(operation)
-                        if isinstance(transaction_result, list) and transaction_result:
-                            result = transaction_result[0].get('result', {})
-                            txid = result.get('txid')
-                            self.storage.tx(txid)
-                            self.storage.delete_pending(self.address)
-                            self.storage.add_contact(self.category, id, self.contact_id, self.username, self.address)
-                            self.pending_window.pending_list_box.remove(self)
-                            self.pending_window.info_dialog(
-                                title="New Contact Added",
-                                message="The contact has been successfully stored in the list."
-                            )
-                            self.pending_window._impl.native.Enabled = True
-                            self.main.mobile_server.broker.push("update_contacts")
-                            return
-                        await asyncio.sleep(3)
-                else:
-                    self.pending_window._impl.native.Enabled = True
+            result = await self.main.operations.track(operation, "contact")
+            if result["status"] == "success":
+                self.storage.tx(result["txid"])
+                self.storage.delete_pending(self.address)
+                self.storage.add_contact(self.category, id, self.contact_id, self.username, self.address)
+                self.pending_window.pending_list_box.remove(self)
+                self.pending_window.info_dialog(
+                    title="New Contact Added",
+                    message="The contact has been successfully stored in the list."
+                )
+                self.pending_window._impl.native.Enabled = True
+                self.main.mobile_server.broker.push("update_contacts")
+            else:
+                self.pending_window._impl.native.Enabled = True
         else:
             self.pending_window._impl.native.Enabled = True
 
@@ -1198,27 +1191,17 @@ class NewContact(Window):
     async def send_memo(self, address, toaddress, amount, txfee, memo, id):
         operation, _= await self.rpc.SendMemo(address, toaddress, amount, txfee, memo)
         if operation:
-            transaction_status, _= await self.rpc.z_getOperationStatus(operation)
-            if isinstance(transaction_status, list) and transaction_status:
-                status = transaction_status[0].get('status')
-                if status == "executing" or status =="success":
-                    await asyncio.sleep(1)
-                    while True:
-                        transaction_result, _= await self.rpc.z_getOperationResult(operation)
-                        if isinstance(transaction_result, list) and transaction_result:
-                            result = transaction_result[0].get('result', {})
-                            txid = result.get('txid')
-                            self.storage.tx(txid)
-                            self.storage.add_request(id, toaddress)
-                            self.info_dialog(
-                                title="Request sent",
-                                message="The request has been sent successfully to the address."
-                            )
-                            self.close()
-                            return
-                        await asyncio.sleep(3)
-                else:
-                    self._impl.native.Enabled = True
+            result = await self.main.operations.track(operation, "request")
+            if result["status"] == "success":
+                self.storage.tx(result["txid"])
+                self.storage.add_request(id, toaddress)
+                self.info_dialog(
+                    title="Request sent",
+                    message="The request has been sent successfully to the address."
+                )
+                self.close()
+            else:
+                self._impl.native.Enabled = True
         else:
             self._impl.native.Enabled = True
 
@@ -1538,9 +1521,16 @@ class Chat(Box):
         self.editing_message = None
         self.message_timestamp = None
         self.replied_timestamp = None
-        self.messages = []
-        self.unread_messages = []
+        self.messages = set()
+        self.unread_messages = set()
+        self.messages_cursor = 0
+        self.unread_cursor = 0
+        self.history_cursor = None
+        self.history_end = None
+        self.history_size = 20
         self.processed_timestamps = set()
+        self.memo_txids = set()
+        self.messages_subscription = None
 
         self.app = app
         self.main = main
@@ -1958,9 +1948,13 @@ class Chat(Box):
 
 
     def run_tasks(self):
-        self.app.loop.create_task(self.update_messages_balance())
-        self.app.loop.create_task(self.waiting_new_memos())
-        self.app.loop.create_task(self.update_contacts_list())
+        self.app.console.event_log(f"✔: Update messages balance")
+        self.main.scheduler.subscribe([], 60, self.update_messages_balance, ("block", "wallet", "messages"))
+        self.app.console.event_log(f"✔: Gather memos")
+        self.main.scheduler.subscribe([], 60, self.waiting_new_memos, ("block", "wallet"))
+        self.app.console.event_log(f"✔: Contacts list")
+        self.contacts = []
+        self.main.scheduler.subscribe([], None, self.update_contacts_list, ("messages", "table:contacts"))
         self.load_pending_list()
 
 
@@ -1977,52 +1971,69 @@ class Chat(Box):
 
 
     async def update_messages_balance(self):
-        self.app.console.event_log(f"✔: Update messages balance")
-        while True:
-            if not self.main.message_button_toggle:
-                await asyncio.sleep(1)
-                continue
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-            address = self.storage.get_identity("address")
-            if address:
-                balance, _= await self.rpc.z_getBalance(address[0])
-                if balance:
-                    text = self.tr.text("address_balance")
-                    balance = self.units.format_balance(balance)
-                    if self.rtl:
-                        balance = self.units.arabic_digits(balance)
-                    self.address_balance.text = f"{text} {balance}"
-            
-            await asyncio.sleep(5)
+        if not self.main.message_button_toggle:
+            return
+        address = self.storage.get_identity("address")
+        if address:
+            balance, _= await self.main.scheduler.call("z_getbalance", [address[0]], 5)
+            if balance:
+                text = self.tr.text("address_balance")
+                balance = self.units.format_balance(balance)
+                if self.rtl:
+                    balance = self.units.arabic_digits(balance)
+                self.address_balance.text = f"{text} {balance}"
             
 
     async def waiting_new_memos(self):
-        self.app.console.event_log(f"✔: Gather memos")
-        while True:
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-            address = self.storage.get_identity("address")
-            if address:
-                listunspent, _= await self.rpc.z_listUnspent(address[0], 0)
-                if listunspent:
-                    self.count_list_unspent(listunspent)
-                    list_txs = self.storage.get_txs()
-                    for data in listunspent:
-                        txid = data['txid']
-                        if txid not in list_txs:
-                            await self.unhexlify_memo(data)
-                            
-                    if len(listunspent) >= 20:
-                        total_balance,_ = await self.rpc.z_getBalance(address[0])
-                        merge_fee = Decimal('0.0002')
-                        txfee = Decimal('0.0001')
-                        amount = Decimal(total_balance) - merge_fee
-                        await self.merge_utxos(address[0], amount, txfee)
-
-            await asyncio.sleep(5)
+        address = self.storage.get_identity("address")
+        if address:
+            listunspent, _= await self.main.scheduler.call("z_listunspent", [0, 9999999, True, [address[0]]], 5)
+            if listunspent:
+                self.count_list_unspent(listunspent)
+                memos = self.get_new_memos(listunspent)
+                if memos:
+                    self.process_memos(memos)
+                        
+                if len(listunspent) >= 20:
+                    total_balance,_ = await self.main.scheduler.call("z_getbalance", [address[0]], 5)
+                    merge_fee = Decimal('0.0002')
+                    txfee = Decimal('0.0001')
+                    amount = Decimal(total_balance) - merge_fee
+                    await self.merge_utxos(address[0], amount, txfee)
+
+
+    def get_new_memos(self, listunspent):
+        txids = {data['txid'] for data in listunspent} - self.memo_txids
+        if txids:
+            self.memo_txids.update(self.storage.get_existing_txs(txids))
+        return [data for data in listunspent if data['txid'] not in self.memo_txids]
+
+
+    def store_memo_txids(self, txids):
+        self.storage.insert_txs(txids)
+        self.memo_txids.update(txids)
+
+
+    def decode_memo(self, memo):
+        try:
+            decoded_memo = binascii.unhexlify(memo)
+            form = decoded_memo.decode('utf-8')
+            clean_form = form.rstrip('\x00')
+            form_dict = json.loads(clean_form)
+            if isinstance(form_dict, dict):
+                return form_dict
+        except (binascii.Error, UnicodeDecodeError, json.decoder.JSONDecodeError):
+            pass
+        return None
+
+
+    def process_memos(self, memos):
+        forms = [(data, self.decode_memo(data['memo'])) for data in memos]
+        with self.storage.transaction():
+            for data, form in forms:
+                if form:
+                    self.unhexlify_memo(form, data['amount'])
+            self.store_memo_txids({data['txid'] for data in memos})
 
 
     def count_list_unspent(self, listunspent):
@@ -2040,53 +2051,29 @@ class Chat(Box):
         memo = "merge"
         operation, _= await self.rpc.SendMemo(address, address, amount, txfee, memo)
         if operation:
-            transaction_status, _= await self.rpc.z_getOperationStatus(operation)
-            if isinstance(transaction_status, list) and transaction_status:
-                status = transaction_status[0].get('status')
-                if status == "executing" or status =="success":
-                    await asyncio.sleep(1)
-                    while True:
-                        transaction_result, _= await self.rpc.z_getOperationResult(operation)
-                        if isinstance(transaction_result, list) and transaction_result:
-                            status = transaction_result[0].get('status')
-                            result = transaction_result[0].get('result', {})
-                            if status == "failed":
-                                    return
-                            txid = result.get('txid')
-                            self.storage.tx(txid)
-                            return
-                        await asyncio.sleep(3)
-
-
-    async def unhexlify_memo(self, data):
-        memo = data['memo']
-        amount = data['amount']
-        txid = data['txid']
+            result = await self.main.operations.track(operation, "merge")
+            if result["status"] == "success":
+                self.storage.tx(result["txid"])
+
+
+    def unhexlify_memo(self, form, amount):
         try:
-            decoded_memo = binascii.unhexlify(memo)
-            form = decoded_memo.decode('utf-8')
-            clean_form = form.rstrip('\x00')
-            form_dict = json.loads(clean_form)
-            form_type = form_dict.get('type')
+            form_type = form.get('type')
 
             if form_type == "identity":
-                self.get_identity(form_dict)
+                self.get_identity(form)
 
             elif form_type == "message":
-                self.get_message(form_dict, amount)
+                self.get_message(form, amount)
             
             elif form_type == "edit":
-                self.edit_message(form_dict)
+                self.edit_message(form)
 
             elif form_type == "request":
-                self.get_request(form_dict)
-
-            self.storage.tx(txid)
+                self.get_request(form)
 
-        except (binascii.Error, json.decoder.JSONDecodeError):
-            self.storage.tx(txid)
-        except Exception:
-            self.storage.tx(txid)
+        except Exception as e:
+            self.app.console.error_log(f"Memo error: {e}")
 
 
     def get_identity(self, form):
@@ -2272,16 +2259,21 @@ class Chat(Box):
         self.output_box.control.CoreWebView2.ExecuteScriptAsync(js_code)
 
 
-    def control_insert_message(
-            self, index: int, user_type: str, username: str, content: str, timestamp: str,
-            edited_timestamp: str, amount, repliedusername = None, repliedcontent = None
-        ):
+    def control_add_messages(self, messages):
         if not self.output_box.control.CoreWebView2:
             print("[WARN] WebView2 not ready yet")
             return
-        args = [index, user_type, username, content, timestamp, edited_timestamp, amount, repliedusername, repliedcontent]
-        js_args = json.dumps(args, ensure_ascii=False)
-        js_code = f"insertMessage(...{js_args});"
+        js_args = json.dumps(messages, ensure_ascii=False)
+        js_code = f"addMessages({js_args});"
+        self.output_box.control.CoreWebView2.ExecuteScriptAsync(js_code)
+
+
+    def control_insert_messages(self, messages):
+        if not self.output_box.control.CoreWebView2:
+            print("[WARN] WebView2 not ready yet")
+            return
+        js_args = json.dumps(messages, ensure_ascii=False)
+        js_code = f"insertMessages({js_args});"
         self.output_box.control.CoreWebView2.ExecuteScriptAsync(js_code)
 
 
@@ -2365,43 +2357,38 @@ class Chat(Box):
 
             
 
-    async def update_contacts_list(self):
-        self.app.console.event_log(f"✔: Contacts list")
-        self.contacts = []
-        while True:
-            if not self.main.message_button_toggle:
-                await asyncio.sleep(1)
-                continue
-            contacts = self.storage.get_contacts()
-            if contacts:
-                for data in contacts:
-                    try:
-                        contact_id = data[2]
-                        address = data[4]
-                        if contact_id not in self.contacts:
-                            contact = Contact(
-                                data, self.app, self, self.main, self.utils, self.units, self.rpc, self.settings, self.tr, self.font
-                            )
-                            contact._impl.native.Click += lambda sender, event, contact_id=contact_id, address=address:self.contact_click(
-                                sender, event, contact_id, address)
-                            contact.category_icon._impl.native.Click += lambda sender, event, contact_id=contact_id, address=address:self.contact_click(
-                                sender, event, contact_id, address)
-                            contact.username_label._impl.native.Click += lambda sender, event, contact_id=contact_id, address=address:self.contact_click(
-                                sender, event, contact_id, address)
-                            contact.unread_messages._impl.native.Click += lambda sender, event, contact_id=contact_id, address=address:self.contact_click(
-                                sender, event, contact_id, address)
-                            
-                            self.contacts_box.add(
-                                contact
-                            )
-                            self.contacts.append(contact_id)
-                    except IndexError:
-                        print(f"Skipping contact due to missing data: {data}")
-                        continue
-                    except Exception as e:
-                        print(f"Unexpected error: {e}, data: {data}")
-                        continue
-            await asyncio.sleep(5)
+    def update_contacts_list(self):
+        if not self.main.message_button_toggle:
+            return
+        contacts = self.storage.get_contacts()
+        if contacts:
+            for data in contacts:
+                try:
+                    contact_id = data[2]
+                    address = data[4]
+                    if contact_id not in self.contacts:
+                        contact = Contact(
+                            data, self.app, self, self.main, self.utils, self.units, self.rpc, self.settings, self.tr, self.font
+                        )
+                        contact._impl.native.Click += lambda sender, event, contact_id=contact_id, address=address:self.contact_click(
+                            sender, event, contact_id, address)
+                        contact.category_icon._impl.native.Click += lambda sender, event, contact_id=contact_id, address=address:self.contact_click(
+                            sender, event, contact_id, address)
+                        contact.username_label._impl.native.Click += lambda sender, event, contact_id=contact_id, address=address:self.contact_click(
+                            sender, event, contact_id, address)
+                        contact.unread_messages._impl.native.Click += lambda sender, event, contact_id=contact_id, address=address:self.contact_click(
+                            sender, event, contact_id, address)
+                        
+                        self.contacts_box.add(
+                            contact
+                        )
+                        self.contacts.append(contact_id)
+                except IndexError:
+                    print(f"Skipping contact due to missing data: {data}")
+                    continue
+                except Exception as e:
+                    print(f"Unexpected error: {e}, data: {data}")
+                    continue
 
 
     def load_pending_list(self):
@@ -2430,7 +2417,7 @@ class Chat(Box):
         self.message_input.value = ""
         self.contact_info_box.clear()
         self.edit_toggle = None
-        self.last_message_timestamp = None
+        self.history_cursor = None
         self.last_unread_timestamp = None
         self.selected_contact_toggle = True
         self.processed_timestamps.clear()
@@ -2496,144 +2483,107 @@ class Chat(Box):
 
 
     async def load_messages(self):
-        self.messages = self.storage.get_messages(self.contact_id)
-        if self.messages:
-            messages = sorted(self.messages, key=lambda x: x[3], reverse=True)
-            recent_messages = messages[:20]
-            self.last_message_timestamp = recent_messages[-1][3]
-            for data in recent_messages:
-                author, message, amount, timestamp, edited, replied = data
-                content_js = message.replace("\n", "\\n").replace('"', '\\"')
-                amount = self.units.format_balance(amount)
-                message_time = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                edited_time = ""
-                if edited:
-                    try:
-                        edited_time = datetime.fromtimestamp(edited).strftime('%Y-%m-%d %H:%M:%S')
-                    except Exception:
-                        pass
-                if author != "you":
-                    user_type = "user"
-                    username = author
-                else:
-                    user_type = author
-                    username = "You"
-                replied_user = None
-                replied_msg_js = None
-                if replied:
-                    replied_data = self.storage.get_message(timestamp=replied)
-                    if replied_data:
-                        replied_user, replied_msg = replied_data
-                        if replied_user == "you":
-                            replied_user = "You"
-                        replied_msg_js = replied_msg.replace("\n", "\\n").replace('"', '\\"')
-                self.processed_timestamps.add(timestamp)
-                self.control_insert_message(0, user_type, username, content_js, message_time, edited_time, amount, replied_user, replied_msg_js)
-                self.scroll_to_bottom()
-
-        self.unread_messages = self.storage.get_unread_messages(self.contact_id)
-        if self.unread_messages:
+        self.messages = set()
+        self.unread_messages = set()
+        self.history_cursor = None
+        self.history_end = None
+        self.messages_cursor = self.storage.get_messages_cursor()
+        self.unread_cursor = self.storage.get_messages_cursor(True)
+        self.load_history_page()
+        self.scroll_to_bottom()
+
+        unread_messages = self.storage.get_messages_since(self.contact_id, 0, True)
+        if unread_messages:
             self.show_unread_label()
-            unread_messages = sorted(self.unread_messages, key=lambda x: x[3], reverse=False)
+            unread_messages = sorted(unread_messages, key=lambda x: x[3])
+            batch = []
             for data in unread_messages:
-                author, message, amount, timestamp, edited, replied = data
-                content_js = message.replace("\n", "\\n").replace('"', '\\"')
-                amount = self.units.format_balance(amount)
-                message_time = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                edited_time = ""
-                if edited:
-                    try:
-                        edited_time = datetime.fromtimestamp(edited).strftime('%Y-%m-%d %H:%M:%S')
-                    except Exception:
-                        pass
-                if author != "you":
-                    user_type = "user"
-                    username = author
-                else:
-                    user_type = author
-                    username = "You"
-                replied_user = None
-                replied_msg_js = None
-                if replied:
-                    replied_data = self.storage.get_message(timestamp=replied)
-                    if replied_data:
-                        replied_user, replied_msg = replied_data
-                        if replied_user == "you":
-                            replied_user = "You"
-                        replied_msg_js = replied_msg.replace("\n", "\\n").replace('"', '\\"')
-                self.processed_timestamps.add(timestamp)
-                self.control_add_message(user_type, username, content_js, message_time, edited_time, amount, replied_user, replied_msg_js)
+                self.processed_timestamps.add(data[3])
+                self.unread_messages.add((data[0], data[3]))
+                batch.append(self.format_message(data))
+            self.control_add_messages(batch)
 
         await asyncio.sleep(1)
         self.loading_toggle = None
-        self.app.loop.create_task(self.update_current_messages(self.contact_id))
-
-
-    async def update_current_messages(self, contact_id):
-        self.messages = self.storage.get_messages(self.contact_id)
-        self.unread_messages = self.storage.get_unread_messages(self.contact_id)
-        while True:
-            if self.contact_id != contact_id:
-                return
-            messages = self.storage.get_messages(self.contact_id)
-            if messages:
-                for data in messages:
-                    if data not in self.messages:
-                        author, message, amount, timestamp, edited, replied = data
-                        if not edited:
-                            content_js = message.replace("\n", "\\n").replace('"', '\\"')
-                            amount = self.units.format_balance(amount)
-                            message_time = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                            if author != "you":
-                                user_type = "user"
-                                username = author
-                            else:
-                                user_type = author
-                                username = "You"
-                            replied_user = None
-                            replied_msg_js = None
-                            if replied:
-                                replied_data = self.storage.get_message(timestamp=replied)
-                                if replied_data:
-                                    replied_user, replied_msg = replied_data
-                                    if replied_user == "you":
-                                        replied_user = "You"
-                                    replied_msg_js = replied_msg.replace("\n", "\\n").replace('"', '\\"')
-                            self.processed_timestamps.add(timestamp)
-                            self.messages.append(data)
-                            self.control_add_message(user_type, username, content_js, message_time, "", amount, replied_user, replied_msg_js)
-                            self.scroll_to_bottom()
-
-            unread_messages = self.storage.get_unread_messages(self.contact_id)
-            if unread_messages:
-                self.show_unread_label()
-                for data in unread_messages:
-                    if data not in self.unread_messages:
-                        author, message, amount, timestamp, edited, replied = data
-                        if not edited:
-                            amount = self.units.format_balance(amount)
-                            content_js = message.replace("\n", "\\n").replace('"', '\\"')
-                            message_time = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                            if author != "you":
-                                user_type = "user"
-                                username = author
-                            else:
-                                user_type = author
-                                username = "You"
-                            replied_user = None
-                            replied_msg_js = None
-                            if replied:
-                                replied_data = self.storage.get_message(timestamp=replied)
-                                if replied_data:
-                                    replied_user, replied_msg = replied_data
-                                    if replied_user == "you":
-                                        replied_user = "You"
-                                    replied_msg_js = replied_msg.replace("\n", "\\n").replace('"', '\\"')
-                            self.processed_timestamps.add(timestamp)
-                            self.unread_messages.append(data)
-                            self.control_add_message(user_type, username, content_js, message_time, "", amount, replied_user, replied_msg_js)
-                
-            await asyncio.sleep(3)
+        contact_id = self.contact_id
+        self.main.scheduler.unsubscribe(self.messages_subscription)
+        self.messages_subscription = self.main.scheduler.subscribe(
+            [], 3, lambda: self.update_current_messages(contact_id)
+        )
+
+
+    def update_current_messages(self, contact_id):
+        if self.contact_id != contact_id:
+            self.main.scheduler.unsubscribe(self.messages_subscription)
+            return
+        messages = self.storage.get_messages_since(contact_id, self.messages_cursor)
+        for data in messages:
+            self.messages_cursor = data[8]
+            if self.add_new_message(data, self.messages):
+                self.scroll_to_bottom()
+
+        unread_messages = self.storage.get_messages_since(contact_id, self.unread_cursor, True)
+        if unread_messages:
+            self.show_unread_label()
+            for data in unread_messages:
+                self.unread_cursor = data[8]
+                self.add_new_message(data, self.unread_messages)
+
+
+    def add_new_message(self, data, displayed):
+        author, _, _, timestamp, edited, _, _, _, _ = data
+        if edited or (author, timestamp) in displayed:
+            return None
+        self.processed_timestamps.add(timestamp)
+        displayed.add((author, timestamp))
+        self.control_add_message(*self.format_message(data))
+        return True
+
+
+    def format_message(self, data):
+        author, message, amount, timestamp, edited, replied, replied_user, replied_msg, _ = data
+        content_js = message.replace("\n", "\\n").replace('"', '\\"')
+        amount = self.units.format_balance(amount)
+        message_time = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+        edited_time = ""
+        if edited:
+            try:
+                edited_time = datetime.fromtimestamp(edited).strftime('%Y-%m-%d %H:%M:%S')
+            except Exception:
+                pass
+        if author != "you":
+            user_type = "user"
+            username = author
+        else:
+            user_type = author
+            username = "You"
+        replied_msg_js = None
+        if replied and replied_msg is not None:
+            if replied_user == "you":
+                replied_user = "You"
+            replied_msg_js = replied_msg.replace("\n", "\\n").replace('"', '\\"')
+        else:
+            replied_user = None
+        return [user_type, username, content_js, message_time, edited_time, amount, replied_user, replied_msg_js]
+
+
+    def load_history_page(self):
+        messages = self.storage.get_messages_page(self.contact_id, self.history_size, self.history_cursor)
+        if len(messages) < self.history_size:
+            self.history_end = True
+        if not messages:
+            return
+        self.history_cursor = (messages[-1][3], messages[-1][8])
+        batch = []
+        for data in reversed(messages):
+            key = (data[0], data[3])
+            if key in self.messages:
+                continue
+            self.processed_timestamps.add(data[3])
+            self.messages.add(key)
+            batch.append(self.format_message(data))
+        if batch:
+            self.control_insert_messages(batch)
 
 
     def clean_unread_messages(self):
@@ -2647,49 +2597,15 @@ class Chat(Box):
                 edited = data[4]
                 replied = data[5]
                 self.storage.message(self.contact_id, author, text, amount, timestamp, edited, replied)
-                self.messages.append(data)
+                self.messages.add((author, timestamp))
             self.storage.delete_unread(self.contact_id)
             self.hide_unread_label()
 
 
     async def load_old_messages(self):
-        messages = self.storage.get_messages(self.contact_id)
-        messages = sorted(messages, key=lambda x: x[3], reverse=True)
-        last_loaded_message_timestamp = self.last_message_timestamp
-        try:
-            last_loaded_index = next(i for i, m in enumerate(messages) if m[3] == last_loaded_message_timestamp)
-        except StopIteration:
+        if self.history_end or not self.history_cursor:
             return
-        older_messages = messages[last_loaded_index + 1 : last_loaded_index + 11]
-        if older_messages:
-            self.last_message_timestamp = older_messages[-1][3]
-            for data in older_messages:
-                author, message, amount, timestamp, edited, replied = data
-                content_js = message.replace("\n", "\\n").replace('"', '\\"')
-                amount = self.units.format_balance(amount)
-                message_time = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                edited_time = ""
-                if edited:
-                    try:
-                        edited_time = datetime.fromtimestamp(edited).strftime('%Y-%m-%d %H:%M:%S')
-                    except Exception:
-                        pass
-                if author != "you":
-                    user_type = "user"
-                    username = author
-                else:
-                    user_type = author
-                    username = "You"
-                replied_user = None
-                replied_msg_js = None
-                if replied:
-                    replied_data = self.storage.get_message(timestamp=replied)
-                    if replied_data:
-                        replied_user, replied_msg = replied_data
-                        if replied_user == "you":
-                            replied_user = "You"
-                        replied_msg_js = replied_msg.replace("\n", "\\n").replace('"', '\\"')
-                self.control_insert_message(0, user_type, username, content_js, message_time, edited_time, amount, replied_user, replied_msg_js)
+        self.load_history_page()
 
 
     def update_pending_list(self):
@@ -2835,42 +2751,31 @@ class Chat(Box):
         operation, _= await self.rpc.SendMemo(address, self.user_address, amount, txfee, memo)
         if operation:
             self.app.console.info_log(f"Operation : {operation}")
-            transaction_status, _= await self.rpc.z_getOperationStatus(operation)
-            if isinstance(transaction_status, list) and transaction_status:
-                status = transaction_status[0].get('status')
-                if status == "executing" or status =="success":
-                    await asyncio.sleep(1)
-                    while True:
-                        transaction_result, _= await self.rpc.z_getOperationResult(operation)
-                        if isinstance(transaction_result, list) and transaction_result:
-                            data = author, text, amount, timestamp, None, replied
-                            self.messages.append(data)
-                            self.cancel_reply()
-                            self.control_message_sent(timestamp)
-                            self.reply_toggle = None
-                            self.message_input.value = ""
-                            result = transaction_result[0].get('result', {})
-                            txid = result.get('txid')
-                            self.storage.tx(txid)
-                            self.storage.message(self.contact_id, author, text, amount, timestamp, None, replied)
-                            self.send_button._impl.native.Focus()
-                            self.fee_input.value = "0.00020000"
-                            self.character_count.style.color = GRAY
-                            self.enable_send_button()
-                            await asyncio.sleep(0.2)
-                            self.message_input.focus()
-                            self.main.mobile_server.broker.push("update_messages")
-                            return
-                        await asyncio.sleep(3)
-                else:
-                    self.control_message_failed(timestamp)
-                    self.main.error_dialog(
-                        title="Failed",
-                        message="Sending message was failed, verify your balance"
-                    )
-                    if self.reply_toggle:
-                        self.enable_cancel_reply()
-                    self.enable_send_button()
+            result = await self.main.operations.track(operation, "message")
+            if result["status"] == "success":
+                self.messages.add((author, timestamp))
+                self.cancel_reply()
+                self.control_message_sent(timestamp)
+                self.reply_toggle = None
+                self.message_input.value = ""
+                self.storage.tx(result["txid"])
+                self.storage.message(self.contact_id, author, text, amount, timestamp, None, replied)
+                self.send_button._impl.native.Focus()
+                self.fee_input.value = "0.00020000"
+                self.character_count.style.color = GRAY
+                self.enable_send_button()
+                await asyncio.sleep(0.2)
+                self.message_input.focus()
+                self.main.mobile_server.broker.push("update_messages")
+            else:
+                self.control_message_failed(timestamp)
+                self.main.error_dialog(
+                    title="Failed",
+                    message="Sending message was failed, verify your balance"
+                )
+                if self.reply_toggle:
+                    self.enable_cancel_reply()
+                self.enable_send_button()
         else:
             self.control_message_failed(timestamp)
             if self.reply_toggle:
@@ -2898,41 +2803,29 @@ class Chat(Box):
         operation, _= await self.rpc.SendMemo(address, self.user_address, amount, txfee, memo)
         if operation:
             self.app.console.info_log(f"Operation : {operation}")
-            transaction_status, _= await self.rpc.z_getOperationStatus(operation)
-            if isinstance(transaction_status, list) and transaction_status:
-                status = transaction_status[0].get('status')
-                if status == "executing" or status =="success":
-                    await asyncio.sleep(1)
-                    while True:
-                        transaction_result, _= await self.rpc.z_getOperationResult(operation)
-                        if isinstance(transaction_result, list) and transaction_result:
-                            self.message_input.value = ""
-                            result = transaction_result[0].get('result', {})
-                            txid = result.get('txid')
-                            self.storage.tx(txid)
-                            data = author, text, amount, self.message_timestamp, edit_timestamp, None
-                            self.messages.append(data)
-                            self.storage.update_message(self.contact_id, text, self.message_timestamp, edit_timestamp)
-                            timestamp_str = datetime.fromtimestamp(self.message_timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                            edited_timestamp_str = datetime.fromtimestamp(edit_timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                            self.cancel_edit()
-                            self.control_edit_message(timestamp_str, text, edited_timestamp_str)
-                            self.edit_toggle = None
-                            self.send_button._impl.native.Focus()
-                            self.character_count.style.color = GRAY
-                            self.enable_send_button()
-                            await asyncio.sleep(0.2)
-                            self.message_input.focus()
-                            return
-                        await asyncio.sleep(3)
-                else:
-                    self.main.error_dialog(
-                        title="Failed",
-                        message="Editing message was failed, verify your balance"
-                    )
-                    if self.edit_toggle:
-                        self.enable_cancel_edit()
-                    self.enable_send_button()
+            result = await self.main.operations.track(operation, "edit")
+            if result["status"] == "success":
+                self.message_input.value = ""
+                self.storage.tx(result["txid"])
+                self.storage.update_message(self.contact_id, text, self.message_timestamp, edit_timestamp)
+                timestamp_str = datetime.fromtimestamp(self.message_timestamp).strftime('%Y-%m-%d %H:%M:%S')
+                edited_timestamp_str = datetime.fromtimestamp(edit_timestamp).strftime('%Y-%m-%d %H:%M:%S')
+                self.cancel_edit()
+                self.control_edit_message(timestamp_str, text, edited_timestamp_str)
+                self.edit_toggle = None
+                self.send_button._impl.native.Focus()
+                self.character_count.style.color = GRAY
+                self.enable_send_button()
+                await asyncio.sleep(0.2)
+                self.message_input.focus()
+            else:
+                self.main.error_dialog(
+                    title="Failed",
+                    message="Editing message was failed, verify your balance"
+                )
+                if self.edit_toggle:
+                    self.enable_cancel_edit()
+                self.enable_send_button()
         else:
             if self.edit_toggle:
                 self.enable_cancel_edit()
@@ -3182,13 +3075,11 @@ class Messages(Box):
         if data:
             address = self.storage.get_identity("address")
             if address:
-                listunspent, _= await self.rpc.z_listUnspent(address[0], 0)
+                listunspent, _= await self.main.scheduler.call("z_listunspent", [0, 9999999, True, [address[0]]])
                 if listunspent:
-                    list_txs = self.storage.get_txs()
-                    for data in listunspent:
-                        txid = data['txid']
-                        if txid not in list_txs:
-                            await self.unhexlify_memo(data)
+                    memos = self.chat.get_new_memos(listunspent)
+                    if memos:
+                        self.process_memos(memos)
 
                     if self.request_count > 0:
                         if self.settings.notification_messages():
@@ -3206,33 +3097,37 @@ class Messages(Box):
                     self.chat.run_tasks()
 
 
-    async def unhexlify_memo(self, data):
-        memo = data['memo']
-        amount = data['amount']
-        txid = data['txid']
+    def process_memos(self, memos):
+        forms = [(data, self.chat.decode_memo(data['memo'])) for data in memos]
+        txids = set()
+        with self.storage.transaction():
+            for data, form in forms:
+                if self.unhexlify_memo(form, data['amount']):
+                    txids.add(data['txid'])
+            self.chat.store_memo_txids(txids)
+
+
+    def unhexlify_memo(self, form, amount):
+        if not form:
+            return True
         try:
-            decoded_memo = binascii.unhexlify(memo)
-            form = decoded_memo.decode('utf-8')
-            clean_form = form.rstrip('\x00')
-            form_dict = json.loads(clean_form)
-            form_type = form_dict.get('type')
+            form_type = form.get('type')
 
             if form_type == "message":
-                await self.get_message(form_dict, amount)
-                self.storage.tx(txid)
+                self.get_message(form, amount)
                 self.message_count += 1
+                return True
             elif form_type == "request":
-                await self.get_request(form_dict)
-                self.storage.tx(txid)
+                self.get_request(form)
                 self.request_count += 1
+                return True
 
-        except (binascii.Error, json.decoder.JSONDecodeError) as e:
-            self.storage.tx(txid)
-        except Exception as e:
-            self.storage.tx(txid)
+        except Exception:
+            return True
+        return None
 
 
-    async def get_message(self, form, amount):
+    def get_message(self, form, amount):
         replied = None
         id = form.get('id')
         author = form.get('username')
@@ -3247,7 +3142,7 @@ class Messages(Box):
         self.chat.processed_timestamps.add(timestamp)
 
 
-    async def get_request(self, form):
+    def get_request(self, form):
         category = form.get('category')
         id = form.get('id')
         username = form.get('username')
@@ -644,8 +644,12 @@ class Mining(Box):
                         response.raise_for_status()
                         mining_data = await response.json()
                         if mining_data:
-                            blockchaininfo,_ = await self.rpc.getBlockchainInfo()
-                            networksol,_ = await self.rpc.getNetworkSolps()
+                            (blockchaininfo,_), (networksol,_) = await self.rpc.batch(
+                                [
+                                    ("getblockchaininfo", []),
+                                    ("getnetworksolps", [])
+                                ]
+                            )
                             total_share = mining_data.get("totalShares") or sum(miner.get("accepted", 0) for miner in mining_data.get("miners", []))
                             balance = mining_data.get("balance", 0)
                             immature_bal = mining_data.get("immature", mining_data.get("unpaid", 0))
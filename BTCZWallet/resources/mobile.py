@@ -718,6 +718,8 @@ class Mobile(Window):
         self.font = font
 
         self.server = server
+        self.updating_status = None
+        self.updating_devices = None
         self.mobile_storage = StorageMobile(self.app)
         self.txs_storage = StorageTxs(self.app)
         self.addresses_storage = StorageAddresses(self.app)
@@ -854,9 +856,11 @@ class Mobile(Window):
                     self.mobile_port = port_line.split()[1].split(":")[1] if port_line else ""
                     self.start_server.enabled = True
                     
-        self.app.loop.create_task(self.updating_devices_status())
+        self.updating_status = self.main.scheduler.subscribe([], 30, self.updating_devices_status)
         self.app.loop.create_task(self.load_devices_list())
-        self.app.loop.create_task(self.updating_devices_list())
+        self.updating_devices = self.main.scheduler.subscribe(
+            [], 30, self.updating_devices_list, ("mobile", "table:mobile_devices", "table:addresses")
+        )
 
 
     async def load_devices_list(self):
@@ -872,77 +876,62 @@ class Mobile(Window):
         self.main_box.add(self.devices_list)
 
 
-    async def updating_devices_list(self):
+    def updating_devices_list(self):
         ONLINE_TIMEOUT = 180
 
-        while True:
-            if not self.main.mobile_toggle:
-                return
-            now = int(datetime.now(timezone.utc).timestamp())
-            devices_list = self.mobile_storage.get_devices()
-            connected_devices = self.server.broker.connected_count()
-            self.devices_label.text = f"Devices : {len(devices_list)}"
-            self.connected_label.text = f"Connected : {connected_devices}"
-            if devices_list:
-                for device in devices_list:
-                    device_id = device[0]
-                    device_timestamp = device[5]
-
-                    is_online = False
-                    if device_timestamp:
-                        is_online = (now - device_timestamp) <= ONLINE_TIMEOUT
-
-                    taddress, zaddress = self.mobile_storage.get_device_addresses(device_id)
-                    tbalance = self.addresses_storage.get_address_balance(taddress)
-                    zbalance = self.addresses_storage.get_address_balance(zaddress)
-
-                    if device_id not in self.devices_data:
-                        device_secret = self.mobile_storage.get_secret(device_id)
-                        device_info = Device(
-                            self.app, self, self.utils, self.font, device, device_secret[0]
-                        )
-                        device_info.status = None
-                        self.devices_data[device_id] = device_info
-                        self.devices_list.add(device_info)
-                        existing_device = device_info
-                        existing_device.status = None
-                    else:
-                        existing_device = self.devices_data[device_id]
-
-                    if is_online:
-                        existing_device.device_icon.image = "images/device_on.png"
-                    else:
-                        existing_device.device_icon.image = "images/device_off.png"
-
-                    if device_timestamp:
-                        ts_str = datetime.fromtimestamp(device_timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                        existing_device.device_last_connected._impl.native.Text = (f"Recent Request : {ts_str}")
-                    try:
-                        existing_device.transparent_balance.text = (f"T : {self.units.format_balance(tbalance)}")
-                        existing_device.shielded_balance.text = (f"Z : {self.units.format_balance(zbalance)}")
-                    except Exception:
-                        pass
-
-            await asyncio.sleep(3)
-
-
-
-    async def updating_devices_status(self):
-        while True:
-            if not self.main.mobile_toggle:
-                return
-            devices_list = self.mobile_storage.get_devices()
-            if devices_list:
-                now = int(datetime.now(timezone.utc).timestamp())
-                for device in devices_list:
-                    device_id = device[0]
-                    device_status = device[4]
-                    device_timestamp = device[5]
-                    if device_status and device_status == "on":
-                        if device_timestamp and now - device_timestamp > 60:
-                            self.mobile_storage.update_device_status(device_id, "off")
-            
-            await asyncio.sleep(3)
+        if not self.main.mobile_toggle:
+            return
+        now = int(datetime.now(timezone.utc).timestamp())
+        devices_list = self.mobile_storage.get_devices()
+        connected_devices = self.server.broker.connected_count()
+        self.devices_label.text = f"Devices : {len(devices_list)}"
+        self.connected_label.text = f"Connected : {connected_devices}"
+        if devices_list:
+            for device in devices_list:
+                device_id = device[0]
+                device_timestamp = device[5]
+
+                is_online = False
+                if device_timestamp:
+                    is_online = (now - device_timestamp) <= ONLINE_TIMEOUT
+
+                taddress, zaddress = self.mobile_storage.get_device_addresses(device_id)
+                tbalance = self.addresses_storage.get_address_balance(taddress)
+                zbalance = self.addresses_storage.get_address_balance(zaddress)
+
+                if device_id not in self.devices_data:
+                    device_secret = self.mobile_storage.get_secret(device_id)
+                    device_info = Device(
+                        self.app, self, self.utils, self.font, device, device_secret[0]
+                    )
+                    device_info.status = None
+                    self.devices_data[device_id] = device_info
+                    self.devices_list.add(device_info)
+                    existing_device = device_info
+                    existing_device.status = None
+                else:
+                    existing_device = self.devices_data[device_id]
+
+                if is_online:
+                    existing_device.device_icon.image = "images/device_on.png"
+                else:
+                    existing_device.device_icon.image = "images/device_off.png"
+
+                if device_timestamp:
+                    ts_str = datetime.fromtimestamp(device_timestamp).strftime('%Y-%m-%d %H:%M:%S')
+                    existing_device.device_last_connected._impl.native.Text = (f"Recent Request : {ts_str}")
+                try:
+                    existing_device.transparent_balance.text = (f"T : {self.units.format_balance(tbalance)}")
+                    existing_device.shielded_balance.text = (f"Z : {self.units.format_balance(zbalance)}")
+                except Exception:
+                    pass
+
+
+    def updating_devices_status(self):
+        if not self.main.mobile_toggle:
+            return
+        now = int(datetime.now(timezone.utc).timestamp())
+        self.mobile_storage.update_devices_offline(now - 60)
 
 
     def add_new_device(self, button):
@@ -955,7 +944,7 @@ class Mobile(Window):
         add_window._impl.native.ShowDialog(self._impl.native)
 
 
-    def start_mobile_server(self, button):         
+    async def start_mobile_server(self, button):         
         self.start_server.enabled = False
         host = "127.0.0.1"
         port = self.mobile_port      
@@ -966,7 +955,7 @@ class Mobile(Window):
         self.server.addresses_storage = self.addresses_storage
         self.server.messages_storage = self.messages_storage
 
-        result = self.server.start()
+        result = await self.server.start()
         if result is True:
             self.notify.show()
             self.notify.send_note(
@@ -982,8 +971,8 @@ class Mobile(Window):
         self.start_server.enabled = True
 
 
-    def stop_mobile_server(self, button):
-        self.server.stop()
+    async def stop_mobile_server(self, button):
+        await self.server.stop()
         self.notify.hide()
         self.update_host_button("stop")
         self.server.host = None
@@ -1044,5 +1033,7 @@ class Mobile(Window):
 
     def close_mobile_window(self, widget):
         self.main.mobile_toggle = None
+        self.main.scheduler.unsubscribe(self.updating_status)
+        self.main.scheduler.unsubscribe(self.updating_devices)
         self.close()
         self.app.current_window = self.main
\ No newline at end of file
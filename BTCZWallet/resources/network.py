@@ -1125,6 +1125,7 @@ class Peer(Window):
 
         self.peers_list = []
         self.node_map = {}
+        self.updating_peers = None
 
         self.main = main
 
@@ -1288,42 +1289,38 @@ class Peer(Window):
                     self.add_peer(node)
         self.main_box.add(self.main_scroll)
         self.show()
-        self.app.loop.create_task(self.updating_peers_list())
-
+        self.updating_peers = self.main.scheduler.subscribe(
+            [("getpeerinfo", [])], 5, self.updating_peers_list
+        )
 
-    async def updating_peers_list(self):
-        while True:
-            if not self.main.peer_toggle:
-                return
-            if self.main.import_key_toggle:
-                self.main.peer_toggle = None
-                self.close()
-                return
 
-            peerinfo, _ = await self.rpc.getPeerinfo()
-            if peerinfo:
-                current_addresses = set()
-                node_by_address = {}
+    def updating_peers_list(self, results):
+        if not self.main.peer_toggle:
+            self.main.scheduler.unsubscribe(self.updating_peers)
+            return
 
-                for node in peerinfo:
-                    address = node.get('addr')
-                    current_addresses.add(address)
-                    node_by_address[address] = node
+        peerinfo, _ = results[0]
+        if peerinfo:
+            current_addresses = set()
+            node_by_address = {}
 
-                    if address not in self.peers_list:
-                        self.peers_list.append(address)
-                        self.add_peer(node)
+            for node in peerinfo:
+                address = node.get('addr')
+                current_addresses.add(address)
+                node_by_address[address] = node
 
-                for address in list(self.peers_list):
-                    if address not in current_addresses:
-                        self.remove_peer({'addr': address})
-                        self.peers_list.remove(address)
-                    else:
-                        self.update_peer(node_by_address[address])
+                if address not in self.peers_list:
+                    self.peers_list.append(address)
+                    self.add_peer(node)
 
-                current_addresses.clear()
+            for address in list(self.peers_list):
+                if address not in current_addresses:
+                    self.remove_peer({'addr': address})
+                    self.peers_list.remove(address)
+                else:
+                    self.update_peer(node_by_address[address])
 
-            await asyncio.sleep(5)
+            current_addresses.clear()
 
 
     def add_peer(self, node):
@@ -1385,4 +1382,5 @@ class Peer(Window):
 
     def close_peers_window(self, widget):
         self.main.peer_toggle = None
+        self.main.scheduler.unsubscribe(self.updating_peers)
         self.close()
\ No newline at end of file
@@ -2,6 +2,8 @@
 from toga import App, Window
 from ..framework import NotifyIcon, Command, FormState, TextBox
 
+from .storage import StorageEngine
+
 
 class Notify(NotifyIcon):
     def __init__(self, app:App, main:Window, settings, utils, rpc, tr, font):
@@ -89,8 +91,12 @@ class Notify(NotifyIcon):
                 self.main.notify.hide()
                 self.main.notify.dispose()
                 if self.main.mobile_server.server_status:
+                    await self.main.mobile_server.stop()
                     self.main.notifymobile.hide()
                     self.main.notifymobile.dispose()
+                self.main.scheduler.stop()
+                await self.rpc.close()
+                StorageEngine.close_all()
                 self.app.exit()
 
         if self.main.mining_page.mining_status:
@@ -0,0 +1,118 @@
+
+import json
+import time
+
+from toga import App
+
+from .storage import StorageTxs
+
+
+class OperationTracker():
+    def __init__(self, app:App, main, interval = 2):
+        super().__init__()
+
+        self.app = app
+        self.main = main
+
+        self.interval = interval
+        self.expiry = 600
+        self.retention = 86400
+        self.pending = {}
+        self.futures = {}
+        self.callbacks = {}
+
+        self.storage = StorageTxs(self.app)
+        self.storage.delete_operations(int(time.time()) - self.retention)
+        for opid, kind, data, _, _, _, timestamp in self.storage.get_pending_operations():
+            self.pending[opid] = {
+                "kind": kind,
+                "data": json.loads(data) if data else None,
+                "timestamp": timestamp
+            }
+
+        self.main.scheduler.subscribe([], self.interval, self.poll, ["operations"])
+
+
+    def register(self, kind, callback):
+        self.callbacks[kind] = callback
+
+
+    def track(self, opid, kind = None, data = None):
+        timestamp = int(time.time())
+        self.pending[opid] = {"kind": kind, "data": data, "timestamp": timestamp}
+        self.storage.insert_operation(opid, kind, json.dumps(data) if data is not None else None, timestamp)
+        future = self.futures.get(opid)
+        if future is None:
+            future = self.app.loop.create_future()
+            self.futures[opid] = future
+        self.main.scheduler.notify("operations")
+        return future
+
+
+    def get(self, opid):
+        operation = self.storage.get_operation(opid)
+        if not operation:
+            return None
+        opid, kind, data, status, txid, error, timestamp = operation
+        return {
+            "id": opid,
+            "kind": kind,
+            "data": json.loads(data) if data else None,
+            "status": status,
+            "txid": txid,
+            "error": error,
+            "timestamp": timestamp
+        }
+
+
+    async def poll(self):
+        if not self.pending:
+            return
+        opids = list(self.pending)
+        statuses, _ = await self.main.scheduler.call("z_getoperationstatus", [opids])
+        if not isinstance(statuses, list):
+            return
+        found = {operation.get("id"): operation for operation in statuses}
+        now = int(time.time())
+        finished = []
+        for opid in opids:
+            operation = found.get(opid)
+            if operation is None:
+                if now - self.pending[opid]["timestamp"] > self.expiry:
+                    self.finish(opid, "unknown", None, "Operation not found")
+                continue
+            status = operation.get("status")
+            if status not in ("success", "failed", "cancelled"):
+                continue
+            txid = (operation.get("result") or {}).get("txid")
+            error = (operation.get("error") or {}).get("message")
+            finished.append(opid)
+            self.finish(opid, status, txid, error)
+        if finished:
+            await self.main.scheduler.call("z_getoperationresult", [finished])
+
+
+    def finish(self, opid, status, txid, error):
+        operation = self.pending.pop(opid)
+        self.storage.update_operation(opid, status, txid, error)
+        result = {
+            "id": opid,
+            "kind": operation["kind"],
+            "data": operation["data"],
+            "status": status,
+            "txid": txid,
+            "error": error
+        }
+        if status == "success":
+            self.app.console.info_log(f"Operation {opid} : {txid}")
+        else:
+            self.app.console.error_log(f"Operation {opid} {status} : {error}")
+        future = self.futures.pop(opid, None)
+        if future and not future.done():
+            future.set_result(result)
+        callback = self.callbacks.get(operation["kind"])
+        if callback:
+            try:
+                callback(result)
+            except Exception as e:
+                self.app.console.error_log(f"Operation {opid} : {e}")
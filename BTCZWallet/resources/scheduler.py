@@ -0,0 +1,210 @@
+
+import asyncio
+import inspect
+import json
+import math
+import time
+
+from toga import App
+
+from .storage import StorageEngine
+
+
+class NodeScheduler():
+    def __init__(self, app:App, main, rpc):
+        super().__init__()
+
+        self.app = app
+        self.main = main
+        self.rpc = rpc
+
+        self.running = None
+        self.tick = 1
+        self.expiry = 60
+        self.pruned = 0
+        self.cache = {}
+        self.inflight = {}
+        self.subscriptions = []
+
+        StorageEngine.subscribe(None, self.storage_changed)
+
+
+    def _key(self, method, params):
+        return method, json.dumps(params, sort_keys=True)
+
+
+    def subscribe(self, calls, interval, callback, events = None):
+        subscription = {
+            "calls": [(method, list(params)) for method, params in calls],
+            "interval": interval,
+            "callback": callback,
+            "events": set(events or ()),
+            "next": 0,
+            "task": None
+        }
+        self.subscriptions.append(subscription)
+        return subscription
+
+
+    def unsubscribe(self, subscription):
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+
+
+    def notify(self, event):
+        for subscription in self.subscriptions:
+            if event in subscription["events"]:
+                subscription["next"] = 0
+                for method, params in subscription["calls"]:
+                    self.cache.pop(self._key(method, params), None)
+
+
+    def storage_changed(self, table, operation, keys):
+        if self.app.loop.is_closed():
+            return
+        events = [f"table:{table}"]
+        if keys is None:
+            events.append(f"table:{table}:*")
+        else:
+            events.extend(f"table:{table}:{key}" for key in keys)
+        for event in events:
+            self.app.loop.call_soon_threadsafe(self.notify, event)
+
+
+    def snapshot(self, method, params = None):
+        entry = self.cache.get(self._key(method, params or []))
+        if entry:
+            return entry[1], entry[2]
+        return None, None
+
+
+    async def call(self, method, params = None, max_age = 0):
+        results = await self.fetch([(method, params or [])], max_age)
+        return results[0]
+
+
+    async def fetch(self, calls, max_age = 0):
+        now = time.monotonic()
+        keys = [self._key(method, params) for method, params in calls]
+        cached = {}
+        waiters = {}
+        pending = {}
+        for key, (method, params) in zip(keys, calls):
+            if key in waiters or key in cached:
+                continue
+            entry = self.cache.get(key)
+            if entry and now - entry[0] <= max_age:
+                cached[key] = (entry[1], entry[2])
+                continue
+            if key in self.inflight:
+                waiters[key] = self.inflight[key]
+            else:
+                future = self.app.loop.create_future()
+                self.inflight[key] = future
+                waiters[key] = future
+                pending[key] = (method, params)
+
+        if pending:
+            results = None
+            try:
+                results = await self.rpc.batch(list(pending.values()))
+            finally:
+                fetched = time.monotonic()
+                for index, key in enumerate(pending):
+                    future = self.inflight.pop(key, None)
+                    if results is None:
+                        result = (None, "Cancelled")
+                    else:
+                        result = results[index]
+                        self.cache[key] = (fetched, result[0], result[1])
+                    if future and not future.done():
+                        future.set_result(result)
+
+        for key, future in waiters.items():
+            if key not in pending:
+                await asyncio.shield(future)
+
+        return [
+            cached[key] if key in cached else waiters[key].result()
+            for key in keys
+        ]
+
+
+    def prune(self, now):
+        expired = [key for key, entry in self.cache.items() if now - entry[0] > self.expiry]
+        for key in expired:
+            del self.cache[key]
+        self.pruned = now
+
+
+    def start(self):
+        if not self.running:
+            self.running = True
+            self.app.loop.create_task(self.run())
+
+
+    def stop(self):
+        self.running = None
+
+
+    async def run(self):
+        self.app.console.event_log(f"✔: Node scheduler")
+        while self.running:
+            if self.main.import_key_toggle:
+                await asyncio.sleep(1)
+                continue
+            try:
+                await self.run_due()
+            except Exception as e:
+                self.app.console.error_log(f"Node scheduler : {e}")
+            await asyncio.sleep(self.tick)
+
+
+    async def run_due(self):
+        now = time.monotonic()
+        if now - self.pruned > self.expiry:
+            self.prune(now)
+        due = [
+            subscription for subscription in self.subscriptions
+            if subscription["next"] <= now
+            and (subscription["task"] is None or subscription["task"].done())
+        ]
+        if not due:
+            return
+        calls = []
+        scheduled = []
+        for subscription in due:
+            scheduled.append(subscription["next"])
+            if subscription["interval"] is None:
+                subscription["next"] = math.inf
+            else:
+                subscription["next"] = now + subscription["interval"]
+            calls.extend(subscription["calls"])
+        results = []
+        if calls:
+            try:
+                results = await self.fetch(calls, self.tick)
+            except Exception:
+                for subscription, previous in zip(due, scheduled):
+                    subscription["next"] = min(subscription["next"], previous)
+                raise
+        index = 0
+        for subscription in due:
+            count = len(subscription["calls"])
+            subscription_results = results[index:index + count]
+            index += count
+            subscription["task"] = self.app.loop.create_task(
+                self.dispatch(subscription, subscription_results)
+            )
+
+
+    async def dispatch(self, subscription, results):
+        try:
+            if subscription["calls"]:
+                result = subscription["callback"](results)
+            else:
+                result = subscription["callback"]()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.app.console.error_log(f"{e}")
@@ -206,36 +206,15 @@ class CashOut(Window):
             operation, _= await self.rpc.z_sendMany(self.uaddress, self.destination_address, self.amount, self.txfee)
             if operation:
                 self.app.console.info_log(f"Operation: {operation}")
-                transaction_status, _= await self.rpc.z_getOperationStatus(operation)
-                if isinstance(transaction_status, list) and transaction_status:
-                    status = transaction_status[0].get('status')
-                    if status == "failed":
-                        self.operation_status.text = self.tr.text("send_failed")
-                    elif status == "executing":
-                        self.operation_status.text = self.tr.text("send_executing")
-                    if status == "executing" or status =="success":
-                        await asyncio.sleep(1)
-                        while True:
-                            transaction_result, _= await self.rpc.z_getOperationResult(operation)
-                            if isinstance(transaction_result, list) and transaction_result:
-                                status = transaction_result[0].get('status')
-                                result = transaction_result[0].get('result', {})
-                                txid = result.get('txid')
-                                if status == "failed":
-                                    self.operation_status.text = self.tr.text("send_failed")
-                                    self.enable_send()
-                                    return
-                                elif status == "executing":
-                                    self.operation_status.text = self.tr.text("send_executing")
-                                elif status == "success":
-                                    self.app.console.info_log(f"TX: {txid}")
-                                if self.uaddress.startswith('z'):
-                                    self.store_shielded_transaction(self.uaddress, txid, self.amount, self.txfee)
-                                self.app.loop.create_task(self.show_success_result())
-                                return
-                            await asyncio.sleep(3)
-                    else:
-                        self.enable_send()
+                self.operation_status.text = self.tr.text("send_executing")
+                result = await self.main.operations.track(operation, "send")
+                if result["status"] != "success":
+                    self.operation_status.text = self.tr.text("send_failed")
+                    self.enable_send()
+                    return
+                if self.uaddress.startswith('z'):
+                    self.store_shielded_transaction(self.uaddress, result["txid"], self.amount, self.txfee)
+                self.app.loop.create_task(self.show_success_result())
             else:
                 self.enable_send()
         except Exception as e:
@@ -248,37 +227,15 @@ class CashOut(Window):
             operation, _= await self.rpc.z_sendToManyAddresses(self.uaddress, self.destination_addresses)
             if operation:
                 self.app.console.info_log(f"Operation: {operation}")
-                transaction_status, _= await self.rpc.z_getOperationStatus(operation)
-                if isinstance(transaction_status, list) and transaction_status:
-                    status = transaction_status[0].get('status')
-                    if status == "failed":
-                        self.operation_status.text = self.tr.text("send_failed")
-                    elif status == "executing":
-                        self.operation_status.text = self.tr.text("send_executing")
-                    self.operation_status.text = status
-                    if status == "executing" or status =="success":
-                        await asyncio.sleep(1)
-                        while True:
-                            transaction_result, _= await self.rpc.z_getOperationResult(operation)
-                            if isinstance(transaction_result, list) and transaction_result:
-                                status = transaction_status[0].get('status')
-                                result = transaction_result[0].get('result', {})
-                                txid = result.get('txid')
-                                if status == "failed":
-                                    self.operation_status.text = self.tr.text("send_failed")
-                                    self.enable_send()
-                                    return
-                                elif status == "executing":
-                                    self.operation_status.text = self.tr.text("send_executing")
-                                elif status == "success":
-                                    self.app.console.info_log(f"TX: {txid}")
-                                if self.uaddress.startswith('z'):
-                                    self.store_shielded_transaction(self.uaddress, txid, self.total_amount, 0.0001)
-                                self.app.loop.create_task(self.show_success_result())
-                                return
-                            await asyncio.sleep(3)
-                    else:
-                        self.enable_send()
+                self.operation_status.text = self.tr.text("send_executing")
+                result = await self.main.operations.track(operation, "send")
+                if result["status"] != "success":
+                    self.operation_status.text = self.tr.text("send_failed")
+                    self.enable_send()
+                    return
+                if self.uaddress.startswith('z'):
+                    self.store_shielded_transaction(self.uaddress, result["txid"], self.total_amount, 0.0001)
+                self.app.loop.create_task(self.show_success_result())
             else:
                 self.enable_send()
         except Exception as e:
@@ -929,7 +886,8 @@ class Send(Box):
             self.send_toggle = True
             self.insert_menustrip()
             self.transparent_button_click(None, None)
-            asyncio.create_task(self.update_address_balance())
+            self.format_balance = 0
+            self.main.scheduler.subscribe([], None, self.update_address_balance, ("table:addresses",))
         
 
     def insert_menustrip(self):
@@ -1231,31 +1189,23 @@ class Send(Box):
             self.address_balance.text = self.tr.text("address_balance_value")
 
 
-    async def update_address_balance(self):
-        self.format_balance = 0
-        while True:
-            if not self.send_toggle:
-                await asyncio.sleep(1)
-                continue
-            if self.address_selection.value is None:
-                self.address_balance.text = self.tr.text("address_balance_value")
-                await asyncio.sleep(1)
-                continue
-            selected_address = self.address_selection.value.select_address
-            balance = self.addresses_storage.get_address_balance(selected_address)
-            if float(balance) > 0:
-                self.address_balance.style.color = WHITE
-                self.format_balance = self.units.format_balance(float(balance))
-                if self.rtl:
-                    format_balance = self.units.arabic_digits(str(self.format_balance))
-                else:
-                    format_balance = self.format_balance
-                self.address_balance.text = format_balance    
+    def update_address_balance(self):
+        if self.address_selection.value is None:
+            self.address_balance.text = self.tr.text("address_balance_value")
+            return
+        selected_address = self.address_selection.value.select_address
+        balance = self.addresses_storage.get_address_balance(selected_address)
+        if balance and float(balance) > 0:
+            self.address_balance.style.color = WHITE
+            self.format_balance = self.units.format_balance(float(balance))
+            if self.rtl:
+                format_balance = self.units.arabic_digits(str(self.format_balance))
             else:
-                self.address_balance.style.color = GRAY
-                self.address_balance.text = self.tr.text("address_balance_value")
-
-            await asyncio.sleep(3)
+                format_balance = self.format_balance
+            self.address_balance.text = format_balance    
+        else:
+            self.address_balance.style.color = GRAY
+            self.address_balance.text = self.tr.text("address_balance_value")
 
 
     async def single_option_on_change(self, switch):
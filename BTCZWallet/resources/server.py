@@ -1,41 +1,108 @@
 
 import asyncio
 import json
+import math
 import time
 from datetime import datetime, timedelta, timezone
 import hmac
 import hashlib
-from threading import Thread, Event
-from flask import Flask, request, jsonify, stream_with_context, Response
-from werkzeug.serving import make_server
-import socket
-from threading import Lock
-from collections import deque
+import inspect
+from threading import Lock, Condition
+from aiohttp import web
+from flask import Flask, request, jsonify
+from collections import deque, OrderedDict
 
 from toga import App
 from ..framework import Sys
 
 
-def get_secret(id, storage):
-    secret = storage.get_secret(id)
-    if secret:
-        return secret[0]
+class DeviceRegistry:
+    def __init__(self, storage, units):
+        self.storage = storage
+        self.units = units
+        self.lock = Lock()
+        self.revision = None
+        self.devices = {}
+
+    def load(self):
+        revision = self.storage.devices_revision
+        if revision != self.revision:
+            with self.lock:
+                if revision != self.revision:
+                    devices = {}
+                    for device_id, secret in self.storage.get_device_secrets():
+                        devices[device_id] = (secret, self.units.get_secret_box(secret))
+                    self.devices = devices
+                    self.revision = revision
+        return self.devices
+
+    def get(self, device_id):
+        return self.load().get(device_id)
+
+    def __contains__(self, device_id):
+        return device_id in self.load()
+
+
+class RequestGuard:
+    def __init__(self, rate = 5, burst = 20, window = 35, size = 16384):
+        self.rate = rate
+        self.burst = burst
+        self.window = window
+        self.size = size
+        self.lock = Lock()
+        self.buckets = {}
+        self.signatures = OrderedDict()
+
+    def limit(self, device_id):
+        now = time.monotonic()
+        with self.lock:
+            tokens, updated = self.buckets.get(device_id, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                self.buckets[device_id] = (tokens, now)
+                return math.ceil((1 - tokens) / self.rate)
+            self.buckets[device_id] = (tokens - 1, now)
+            return 0
+
+    def replayed(self, signature):
+        now = time.monotonic()
+        with self.lock:
+            while self.signatures:
+                expiry = next(iter(self.signatures.values()))
+                if expiry > now and len(self.signatures) < self.size:
+                    break
+                self.signatures.popitem(last=False)
+            if signature in self.signatures:
+                return True
+            self.signatures[signature] = now + self.window
+            return False
+
+    def clear(self):
+        with self.lock:
+            self.buckets.clear()
+            self.signatures.clear()
+
+
+def get_secret(id, devices):
+    device = devices.get(id)
+    if device:
+        return device[0]
     return None
 
 
-def encrypt_data(id, storage, units, data):
-    secret = get_secret(id, storage)
-    encrypted = units.encrypt_data(secret, data)
+def encrypt_data(id, devices, units, data, compress = False):
+    _, box = devices.get(id)
+    encrypted = units.box_encrypt(box, data, compress)
     return encrypted
 
 
-def decrypt_data(id, storage, units, data):
-    secret = get_secret(id, storage)
-    decrypted = units.decrypt_data(secret, data)
+def decrypt_data(id, devices, units, data):
+    _, box = devices.get(id)
+    decrypted = units.box_decrypt(box, data)
     return decrypted
 
 
-def verify_signature(list_ids, storage, units = None):
+def verify_signature(devices, guard, units = None):
     id = request.headers.get('Authorization')
     timestamp = request.headers.get('X-Timestamp')
     signature = request.headers.get('X-Signature')
@@ -43,7 +110,7 @@ def verify_signature(list_ids, storage, units = None):
     if not id or not timestamp or not signature:
         return False, (jsonify({'error': 'Missing headers'}), 400)
 
-    if id not in list_ids:
+    if id not in devices:
         return False, (jsonify({'error': 'Unauthorized'}), 401)
 
     try:
@@ -58,12 +125,10 @@ def verify_signature(list_ids, storage, units = None):
         return False, (jsonify({'error': 'Invalid timestamp'}), 400)
 
     try:
-        secret = get_secret(id, storage)
-
         if "data" in request.args:
             ciphertext_b64 = request.args.get("data")
             try:
-                plaintext_json = decrypt_data(id, storage, units, ciphertext_b64)
+                plaintext_json = decrypt_data(id, devices, units, ciphertext_b64)
                 body = json.loads(plaintext_json)
             except Exception as e:
                 return False, (jsonify({"error": "Decryption failed"}), 400)
@@ -72,7 +137,7 @@ def verify_signature(list_ids, storage, units = None):
             body = request.args.to_dict(flat=True)
         else:
             body = {}
-        secret = get_secret(id, storage)
+        secret = get_secret(id, devices)
         message = f"{timestamp}.{json.dumps(body, separators=(',', ':'), sort_keys=True)}"
         expected_signature = hmac.new(
             secret.encode(),
@@ -83,6 +148,13 @@ def verify_signature(list_ids, storage, units = None):
         if not hmac.compare_digest(expected_signature, signature):
             return False, (jsonify({'error': 'Invalid signature'}), 403)
 
+        retry_after = guard.limit(id)
+        if retry_after:
+            return False, (jsonify({'error': 'Too many requests'}), 429, {'Retry-After': str(retry_after)})
+
+        if guard.replayed(signature):
+            return False, (jsonify({'error': 'Request replayed'}), 403)
+
     except Exception as e:
         print(f"Signature verification error: {e}")
         return False, (jsonify({'error': 'Signature verification failed'}), 500)
@@ -90,66 +162,117 @@ def verify_signature(list_ids, storage, units = None):
     return True, None
 
 
-class ServerThread(Thread):
-    def __init__(self, app:App, flask, host, port, event):
-        Thread.__init__(self, daemon=True)
-
-        self.app = app
-        self.flask = flask
-        self.host = host
-        self.port = port
-        self.event = event
+class SSEBroker:
+    def __init__(self, size = 256):
+        self.listeners = {}
+        self.events = deque(maxlen=size)
+        self.last_id = 0
+        self.closed = None
+        self.lock = Lock()
+        self.condition = Condition(self.lock)
 
-    def run(self):
-        try:
-            self.http_server = make_server(
-                self.host,
-                self.port,
-                self.flask,
-                threaded=True
-            )
-            self.event.set()
-            self.http_server.serve_forever()
-        except socket.gaierror as e:
-            print(f"Error: DNS resolution failed for host {self.host}. Error: {e}")
-        except Exception as e:
-            print(e)
-
-    def shutdown(self):
-        if self.http_server:
-            try:
-                self.event.clear()
-                self.http_server.shutdown()
-                self.http_server.server_close()
-            except Exception as e:
-                print(e)
+        self.pushed = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.max_depth = 0
 
+    def open(self):
+        with self.lock:
+            self.closed = None
 
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.wake()
+            self.listeners.clear()
 
-class SSEBroker:
-    def __init__(self):
-        self.listeners = {}
-        self.lock = Lock()
+    def wake(self):
+        self.condition.notify_all()
+        for listener in self.listeners.values():
+            if listener["waker"]:
+                listener["waker"]()
 
-    def listen(self, mobile_id):
-        q = deque()
+    def listen(self, mobile_id, last_event_id = None):
         with self.lock:
-            self.listeners[mobile_id] = q
-        return q
+            cursor = self.last_id
+            if last_event_id is not None and last_event_id <= self.last_id:
+                cursor = max(last_event_id, self.last_id - len(self.events))
+            listener = {"id": mobile_id, "cursor": cursor, "waker": None}
+            previous = self.listeners.get(mobile_id)
+            self.listeners[mobile_id] = listener
+            if previous and previous["waker"]:
+                previous["waker"]()
+            return listener
 
     def push(self, action: str):
+        with self.condition:
+            self.last_id += 1
+            self.events.append((self.last_id, action))
+            self.pushed += 1
+            self.wake()
+
+    def wait(self, listener, timeout = 15):
+        with self.condition:
+            self.condition.wait_for(
+                lambda: self.is_stale(listener) or listener["cursor"] < self.last_id,
+                timeout
+            )
+            if self.is_stale(listener):
+                return None
+            count = min(self.last_id - listener["cursor"], len(self.events))
+            listener["cursor"] = self.last_id
+            if not count:
+                return []
+            self.max_depth = max(self.max_depth, count)
+            latest = {}
+            for event_id, action in list(self.events)[-count:]:
+                latest.pop(action, None)
+                latest[action] = event_id
+            self.coalesced += count - len(latest)
+            self.delivered += len(latest)
+            return [(event_id, action) for action, event_id in latest.items()]
+
+    async def wait_async(self, listener, timeout = 15):
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
         with self.lock:
-            for q in self.listeners.values():
-                q.append(action)
+            if self.is_stale(listener) or listener["cursor"] < self.last_id:
+                event.set()
+            else:
+                listener["waker"] = lambda: loop.call_soon_threadsafe(event.set)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            listener["waker"] = None
+        return self.wait(listener, 0)
+
+    def is_stale(self, listener):
+        return self.closed or self.listeners.get(listener["id"]) is not listener
 
-    def remove(self, mobile_id):
+    def remove(self, listener):
         with self.lock:
-            self.listeners.pop(mobile_id, None)
+            if self.listeners.get(listener["id"]) is listener:
+                self.listeners.pop(listener["id"])
 
     def connected_count(self) -> int:
         with self.lock:
             return len(self.listeners)
 
+    def stats(self):
+        with self.lock:
+            depths = [self.last_id - listener["cursor"] for listener in self.listeners.values()]
+            return {
+                "listeners": len(depths),
+                "buffered": len(self.events),
+                "depth": max(depths, default=0),
+                "max_depth": self.max_depth,
+                "pushed": self.pushed,
+                "delivered": self.delivered,
+                "coalesced": self.coalesced
+            }
+
 
 class MobileServer():
     def __init__(
@@ -181,6 +304,7 @@ class MobileServer():
         self.app = app
         self.main = main
         self.server_status = None
+        self.runner = None
         self.current_blocks = None
         self.read_messages = []
         self.unread_messages = []
@@ -192,11 +316,16 @@ class MobileServer():
         )
 
         self.broker = SSEBroker()
+        self.devices = DeviceRegistry(self.mobile_storage, self.units)
+        self.guard = RequestGuard()
+        self.last_seen = {}
+        self.last_seen_interval = 30
+        self.transactions_limit = 500
 
+        self.main.operations.register("mobile", self.complete_tx)
         self.add_rules()
 
     def add_rules(self):
-        self.flask.add_url_rule("/stream", "stream", self.stream)
         self.flask.add_url_rule('/status', 'status', self.handle_status)
         self.flask.add_url_rule('/addresses', 'addresses', self.handle_addresses)
         self.flask.add_url_rule('/book', 'book', self.handle_book)
@@ -207,58 +336,104 @@ class MobileServer():
         self.flask.add_url_rule('/cashout', 'cashout', self.handle_cashout)
         self.flask.add_url_rule('/contacts', 'contacts', self.handle_contacts)
         self.flask.add_url_rule('/messages', 'messages', self.handle_messages)
-        self.flask.before_request(self.log_request)
-
-
-    def log_request(self):
-        self.app.add_background_task(self.get_request_log)
+        self.flask.add_url_rule('/operations', 'operations', self.handle_operations)
+
+
+    def create_web_app(self):
+        web_app = web.Application()
+        web_app.router.add_get("/stream", self.stream)
+        for rule in self.flask.url_map.iter_rules():
+            if rule.endpoint == "static":
+                continue
+            web_app.router.add_get(rule.rule, self.web_handler(rule.endpoint))
+        return web_app
+
+
+    def web_handler(self, endpoint):
+        view = self.flask.view_functions[endpoint]
+        if not inspect.iscoroutinefunction(view):
+            def call_view(web_request):
+                with self.request_context(web_request):
+                    return self.web_response(view())
+            async def sync_handler(web_request):
+                return await self.app.loop.run_in_executor(None, call_view, web_request)
+            return sync_handler
+        async def handler(web_request):
+            with self.request_context(web_request):
+                result = await view()
+                return self.web_response(result)
+        return handler
+
+
+    def request_context(self, web_request):
+        self.app.console.server_log(
+            f"[MOBILE]{web_request.remote} {web_request.method} {web_request.path}"
+        )
+        return self.flask.test_request_context(
+            web_request.path,
+            method=web_request.method,
+            query_string=web_request.query_string,
+            headers=list(web_request.headers.items()),
+            environ_base={"REMOTE_ADDR": web_request.remote or ""}
+        )
 
-    def get_request_log(self, widget):
-        if request.method == 'GET':
-            if request.args:
-                self.app.console.server_log(f"[MOBILE]Request Data: {dict(request.form)}")
 
-            self.app.console.server_log(
-                f"[MOBILE]{request.remote_addr} {request.method} {request.path}"
-            )
+    def web_response(self, result):
+        response = self.flask.make_response(result)
+        headers = {
+            key: value for key, value in response.headers.items()
+            if key.lower() != "content-length"
+        }
+        return web.Response(
+            body=response.get_data(),
+            status=response.status_code,
+            headers=headers
+        )
 
 
-    def stream(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage)
-        if not valid:
-            return response
-        self.update_device_status()
-        mobile_id = request.headers.get('Authorization')
-        q = self.broker.listen(mobile_id)
-        def event_stream():
+    async def stream(self, web_request):
+        with self.request_context(web_request):
+            valid, response = verify_signature(self.devices, self.guard)
+            if not valid:
+                return self.web_response(response)
+            self.update_device_status()
+            mobile_id = request.headers.get('Authorization')
             try:
-                last_ping = time.time()
-                while True:
-                    if q:
-                        action = q.popleft()
-                        yield f"data: {action}\n\n"
-                    else:
-                        now = time.time()
-                        if now - last_ping >= 15:
-                            yield ": ping\n\n"
-                            last_ping = now
-                        time.sleep(0.1)
-            finally:
-                self.broker.remove(mobile_id)
-        return Response(
-            stream_with_context(event_stream()),
-            mimetype="text/event-stream",
+                last_event_id = int(request.headers.get('Last-Event-ID', ''))
+            except ValueError:
+                last_event_id = None
+        listener = self.broker.listen(mobile_id, last_event_id)
+        self.main.scheduler.notify("mobile")
+        response = web.StreamResponse(
             headers={
+                "Content-Type": "text/event-stream",
                 "Cache-Control": "no-cache",
                 "X-Accel-Buffering": "no"
             }
         )
+        try:
+            await response.prepare(web_request)
+            while True:
+                events = await self.broker.wait_async(listener, 15)
+                if events is None:
+                    break
+                if not events:
+                    await response.write(b": ping\n\n")
+                    continue
+                data = "".join(
+                    f"id: {event_id}\ndata: {action}\n\n" for event_id, action in events
+                )
+                await response.write(data.encode())
+        except ConnectionResetError:
+            pass
+        finally:
+            self.broker.remove(listener)
+            self.main.scheduler.notify("mobile")
+        return response
     
 
     def handle_status(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage)
+        valid, response = verify_signature(self.devices, self.guard)
         if not valid:
             return response
         self.update_device_status()
@@ -274,14 +449,13 @@ class MobileServer():
         }
 
         mobile_id = request.headers.get("Authorization")
-        encrypted_data = encrypt_data(mobile_id, self.mobile_storage, self.units, json.dumps(data))
+        encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(data))
 
         return jsonify({"data": encrypted_data}), 200
     
 
     def handle_addresses(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage)
+        valid, response = verify_signature(self.devices, self.guard)
         if not valid:
             return response
         self.update_device_status()
@@ -291,14 +465,13 @@ class MobileServer():
             'transparent': taddress,
             'shielded': zaddress
         }
-        encrypted_data = encrypt_data(mobile_id, self.mobile_storage, self.units, json.dumps(data))
+        encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(data))
 
         return jsonify({"data": encrypted_data}), 200
     
     
     async def handle_book(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage, self.units)
+        valid, response = verify_signature(self.devices, self.guard, self.units)
         if not valid:
             return response
         self.update_device_status()
@@ -306,7 +479,7 @@ class MobileServer():
         mobile_id = request.headers.get('Authorization')
 
         encrypted_data = request.args.get("data")
-        decrypted_json = decrypt_data(mobile_id, self.mobile_storage, self.units, encrypted_data)
+        decrypted_json = decrypt_data(mobile_id, self.devices, self.units, encrypted_data)
         params = json.loads(decrypted_json)
 
         if "get" in params:
@@ -318,7 +491,7 @@ class MobileServer():
                     "address": data[1]
                 }
                 result.append(book_dict)
-            encrypted_data = encrypt_data(mobile_id, self.mobile_storage, self.units, json.dumps(result))
+            encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(result))
             return jsonify({"data": encrypted_data})
         
         elif "name" in params:
@@ -343,8 +516,7 @@ class MobileServer():
     
 
     def handle_mining(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage)
+        valid, response = verify_signature(self.devices, self.guard)
         if not valid:
             return response
         if not self.main.mining_page.mining_status:
@@ -366,55 +538,88 @@ class MobileServer():
                 "solutions": stats[9],
                 "reward": stats[10],
             }
-            encrypted_data = encrypt_data(mobile_id, self.mobile_storage, self.units, json.dumps(mining_dict))
+            encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(mining_dict))
             return jsonify({"data": encrypted_data}), 200
 
         return jsonify({"error": "No mining stats found"}), 404
     
 
-    def handle_transactions(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage)
+    async def handle_transactions(self):
+        valid, response = verify_signature(self.devices, self.guard, self.units)
         if not valid:
             return response
         self.update_device_status()
-        transactions_data = []
-        result = []
         mobile_id = request.headers.get('Authorization')
-        addresses = self.mobile_storage.get_device_addresses(mobile_id)
-        for address in addresses:
-            address_data = self.txs_storage.get_mobile_transactions(address)
-            for data in address_data:
-                transactions_data.append(data)
-
-        if transactions_data:
-            for data in transactions_data:
-                tx_dict = {
-                    "type": data[0],
-                    "category": data[1],
-                    "address": data[2],
-                    "txid": data[3],
-                    "amount": data[4],
-                    "blocks": data[5],
-                    "fee": data[6],
-                    "timestamp": data[7]
-                }
-                result.append(tx_dict)
-                
-        encrypted_data = encrypt_data(mobile_id, self.mobile_storage, self.units, json.dumps(result))
-        return jsonify({"data": encrypted_data}), 200
-    
+        addresses = self.mobile_storage.get_device_addresses(mobile_id) or []
+
+        encrypted_data = request.args.get("data")
+        if not encrypted_data:
+            result = [
+                self.transaction_dict(data)
+                for data in await self.txs_storage.aio.get_mobile_transactions(addresses)
+            ]
+            encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(result))
+            return jsonify({"data": encrypted_data}), 200
+
+        decrypted_json = decrypt_data(mobile_id, self.devices, self.units, encrypted_data)
+        params = json.loads(decrypted_json)
+        try:
+            since = params.get("since")
+            if since is not None:
+                revision, rowid = since
+                since = (int(revision), int(rowid))
+            limit = min(max(int(params.get("limit", self.transactions_limit)), 1), self.transactions_limit)
+        except (TypeError, ValueError):
+            return jsonify({"error": "Invalid parameters"}), 400
+        compress = params.get("compress") == "zlib"
+
+        revision = await self.txs_storage.aio.get_transactions_revision()
+        etag = hashlib.sha1(
+            f"{mobile_id}:{':'.join(address or '' for address in addresses)}:{revision}:{since}:{limit}:{compress}".encode()
+        ).hexdigest()
+        etag = f'"{etag[:20]}"'
+        if request.headers.get('If-None-Match') == etag:
+            return "", 304, {"ETag": etag}
+
+        transactions = await self.txs_storage.aio.get_mobile_transactions(addresses, limit + 1, since)
+        more = len(transactions) > limit
+        transactions = transactions[:limit]
+        if transactions:
+            since = (transactions[-1][8], transactions[-1][9])
+        result = {
+            "transactions": [self.transaction_dict(data) for data in transactions],
+            "since": since,
+            "more": more
+        }
+        encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(result), compress)
+        response = {"data": encrypted_data}
+        if compress:
+            response["encoding"] = "zlib"
+        return jsonify(response), 200, {"ETag": etag}
+
+
+    def transaction_dict(self, data):
+        return {
+            "type": data[0],
+            "category": data[1],
+            "address": data[2],
+            "txid": data[3],
+            "amount": data[4],
+            "blocks": data[5],
+            "fee": data[6],
+            "timestamp": data[7]
+        }
+
 
     async def handle_cashout(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage, self.units)
+        valid, response = verify_signature(self.devices, self.guard, self.units)
         if not valid:
             return response
         self.update_device_status()
         mobile_id = request.headers.get('Authorization')
 
         encrypted_data = request.args.get("data")
-        decrypted_json = decrypt_data(mobile_id, self.mobile_storage, self.units, encrypted_data)
+        decrypted_json = decrypt_data(mobile_id, self.devices, self.units, encrypted_data)
         get_params = json.loads(decrypted_json)
 
         required_params = ["type", "address", "amount", "fee"]
@@ -450,8 +655,7 @@ class MobileServer():
     
 
     async def handle_contacts(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage, self.units)
+        valid, response = verify_signature(self.devices, self.guard, self.units)
         if not valid:
             return response
         self.update_device_status()
@@ -459,7 +663,7 @@ class MobileServer():
         mobile_id = request.headers.get('Authorization')
 
         encrypted_data = request.args.get("data")
-        decrypted_json = decrypt_data(mobile_id, self.mobile_storage, self.units, encrypted_data)
+        decrypted_json = decrypt_data(mobile_id, self.devices, self.units, encrypted_data)
         params = json.loads(decrypted_json)
 
         if "get" in params:
@@ -494,7 +698,7 @@ class MobileServer():
                     }
                     result.append(pending_dict)
                     
-            encrypted_data = encrypt_data(mobile_id, self.mobile_storage, self.units, json.dumps(result))
+            encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(result))
             return jsonify({"data": encrypted_data}), 200
         
         elif "request" in params:
@@ -565,8 +769,7 @@ class MobileServer():
         
 
     async def handle_messages(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage, self.units)
+        valid, response = verify_signature(self.devices, self.guard, self.units)
         if not valid:
             return response
         self.update_device_status()
@@ -574,7 +777,7 @@ class MobileServer():
         mobile_id = request.headers.get('Authorization')
 
         encrypted_data = request.args.get("data")
-        decrypted_json = decrypt_data(mobile_id, self.mobile_storage, self.units, encrypted_data)
+        decrypted_json = decrypt_data(mobile_id, self.devices, self.units, encrypted_data)
         params = json.loads(decrypted_json)
 
         if "get" in params:
@@ -612,7 +815,7 @@ class MobileServer():
                         }
                         result.append(unread_message_dict)
 
-            encrypted_data = encrypt_data(mobile_id, self.mobile_storage, self.units, json.dumps(result))
+            encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(result))
             return jsonify({"data": encrypted_data}), 200
 
         elif "clean" in params:
@@ -650,28 +853,26 @@ class MobileServer():
     
 
     async def handle_balance(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage, self.units)
+        valid, response = verify_signature(self.devices, self.guard, self.units)
         if not valid:
             return response
         self.update_device_status()
         mobile_id = request.headers.get('Authorization')
 
         encrypted_data = request.args.get("data")
-        decrypted_json = decrypt_data(mobile_id, self.mobile_storage, self.units, encrypted_data)
+        decrypted_json = decrypt_data(mobile_id, self.devices, self.units, encrypted_data)
         params = json.loads(decrypted_json)
         if "address" in params:
             address = params.get('address')
             balance,_ = await self.rpc.z_getBalance(address)
             if balance:
                 result = {"balance": balance}
-                encrypted_data = encrypt_data(mobile_id, self.mobile_storage, self.units, json.dumps(result))
+                encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(result))
                 return jsonify({"data": encrypted_data}), 200
     
     
     def handle_balances(self):
-        mobile_ids = self.mobile_storage.get_auth_ids()
-        valid, response = verify_signature(mobile_ids, self.mobile_storage)
+        valid, response = verify_signature(self.devices, self.guard)
         if not valid:
             return response
         self.update_device_status()
@@ -683,10 +884,36 @@ class MobileServer():
             'transparent': tbalance,
             'shielded': zbalance
         }
-        encrypted_data = encrypt_data(mobile_id, self.mobile_storage, self.units, json.dumps(data))
+        encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(data))
         return jsonify({"data": encrypted_data}), 200
         
 
+    async def handle_operations(self):
+        valid, response = verify_signature(self.devices, self.guard, self.units)
+        if not valid:
+            return response
+        self.update_device_status()
+        mobile_id = request.headers.get('Authorization')
+
+        encrypted_data = request.args.get("data")
+        decrypted_json = decrypt_data(mobile_id, self.devices, self.units, encrypted_data)
+        params = json.loads(decrypted_json)
+
+        operation = self.main.operations.get(params.get("id"))
+        if not operation or operation["kind"] != "mobile":
+            return jsonify({"error": "Operation not found"}), 404
+        if (operation["data"] or {}).get("mobile_id") != mobile_id:
+            return jsonify({"error": "Operation not found"}), 404
+        result = {
+            "id": operation["id"],
+            "status": operation["status"],
+            "txid": operation["txid"],
+            "error": operation["error"]
+        }
+        encrypted_data = encrypt_data(mobile_id, self.devices, self.units, json.dumps(result))
+        return jsonify({"data": encrypted_data}), 200
+
+
     async def make_tx(self, from_address, address, amount, txfee, memo = None, id=None, option = None, data = None, mobile_id = None):
         if memo and id:
             operation,_ = await self.rpc.SendMemo(from_address, address, amount, txfee, memo)
@@ -697,61 +924,74 @@ class MobileServer():
         transaction_status, _= await self.rpc.z_getOperationStatus(operation)
         if isinstance(transaction_status, list) and transaction_status:
             status = transaction_status[0].get('status')
-            if status not in ["executing", "success"]:
+            if status not in ["queued", "executing", "success"]:
                 return jsonify({"error": f"Operation could not start. Status: {status}"}), 500
-            await asyncio.sleep(1)
-            while True:
-                transaction_result, _= await self.rpc.z_getOperationResult(operation)
-                if isinstance(transaction_result, list) and transaction_result:
-                    status = transaction_result[0].get('status')
-                    result = transaction_result[0].get('result', {})
-                    txid = result.get('txid')
-                    if status == "failed":
-                        return jsonify({"error": "Transaction failed"}), 500
-                    elif status == "success":
-                        if not option:
-                            category = "send"
-                            if from_address.startswith('z'):
-                                tx_type = "shielded"
-                                blocks = self.main.home_page.current_blocks
-                            elif from_address.startswith("t"):
-                                tx_type = "transparent"
-                                blocks = 0
-                            amount = float(amount)
-                            self.store_transaction(tx_type, category, from_address, txid, -amount, blocks, txfee)
-                            self.broker.push("update_transactions")
-
-                            return jsonify({"result": "success"}), 200
-                        else:
-                            if option == "request":
-                                self.messages_storage.tx(txid)
-                                self.messages_storage.add_request(id, address)
-
-                                return jsonify({"result": "success"}), 200
-
-                            elif option == "accept":
-                                category = data[0]
-                                contact_id = data[1]
-                                username = data[2]
-                                address = data[3]
-                                self.messages_storage.tx(txid)
-                                self.messages_storage.delete_pending(address)
-                                self.messages_storage.add_contact(category, id, contact_id, username, address)
-                                self.broker.push("update_contacts")
-
-                                return jsonify({"result": "success"}), 200
-
-                            elif option == "message":
-                                author = data[0]
-                                message = data[1]
-                                timestamp = data[2]
-                                self.messages_storage.message(id, author, message, amount, timestamp)
-                                self.broker.push("update_messages")
-
-                                return jsonify({"result": "success", "timestamp": timestamp}), 200
-                                
-                await asyncio.sleep(3)
-        
+        self.main.operations.track(
+            operation, "mobile",
+            {
+                "from_address": from_address,
+                "address": address,
+                "amount": amount,
+                "txfee": txfee,
+                "id": id,
+                "option": option,
+                "data": data,
+                "mobile_id": mobile_id
+            }
+        )
+        response = {"result": "pending", "operation": operation}
+        if option == "message":
+            response["timestamp"] = data[2]
+        return jsonify(response), 202
+
+
+    def complete_tx(self, result):
+        operation = result["id"]
+        status = result["status"]
+        if status == "success":
+            params = result["data"]
+            txid = result["txid"]
+            from_address = params["from_address"]
+            address = params["address"]
+            amount = params["amount"]
+            id = params["id"]
+            option = params["option"]
+            data = params["data"]
+            if not option:
+                category = "send"
+                if from_address.startswith('z'):
+                    tx_type = "shielded"
+                    blocks = self.main.home_page.current_blocks
+                elif from_address.startswith("t"):
+                    tx_type = "transparent"
+                    blocks = 0
+                amount = float(amount)
+                self.store_transaction(tx_type, category, from_address, txid, -amount, blocks, params["txfee"])
+                self.broker.push("update_transactions")
+
+            elif option == "request":
+                self.messages_storage.tx(txid)
+                self.messages_storage.add_request(id, address)
+
+            elif option == "accept":
+                category = data[0]
+                contact_id = data[1]
+                username = data[2]
+                address = data[3]
+                self.messages_storage.tx(txid)
+                self.messages_storage.delete_pending(address)
+                self.messages_storage.add_contact(category, id, contact_id, username, address)
+                self.broker.push("update_contacts")
+
+            elif option == "message":
+                author = data[0]
+                message = data[1]
+                timestamp = data[2]
+                self.messages_storage.message(id, author, message, amount, timestamp)
+                self.broker.push("update_messages")
+
+        self.broker.push(f"operation:{operation}:{status}")
+
 
     def store_transaction(self, tx_type, category, from_address, txid, amount, blocks, txfee):
         timesent = int(datetime.now(timezone.utc).timestamp())
@@ -790,25 +1030,41 @@ class MobileServer():
     def update_device_status(self):
         mobile_id = request.headers.get('Authorization')
         timestamp = int(datetime.now(timezone.utc).timestamp())
-        self.mobile_storage.update_device_connected(mobile_id, timestamp)
+        if timestamp - self.last_seen.get(mobile_id, 0) < self.last_seen_interval:
+            return
+        self.last_seen[mobile_id] = timestamp
+        self.mobile_storage.db.submit(self.mobile_storage.update_device_connected, mobile_id, timestamp)
         
     
-    def start(self):
-        event = Event()
-        self.server_thread = ServerThread(self.app, self.flask, self.host, self.port, event)
-        self.server_thread.start()
-        if event.wait(timeout=5):
-            self.app.console.server_log(f"📱: Server started and listening to {self.host}:{self.port}")
-            self.server_status = True
-            return True
-        else:
-            self.app.console.error_log("Server failed to start within the timeout period.")
+    async def start(self):
+        self.broker.open()
+        self.runner = web.AppRunner(self.create_web_app(), access_log=None)
+        try:
+            await self.runner.setup()
+            site = web.TCPSite(self.runner, self.host, self.port)
+            await site.start()
+        except OSError as e:
+            await self.runner.cleanup()
+            self.runner = None
+            self.app.console.error_log(f"Server failed to start: {e}")
             return None
+        self.app.console.server_log(f"📱: Server started and listening to {self.host}:{self.port}")
+        self.server_status = True
+        return True
 
-    def stop(self):
+    async def stop(self):
+        self.last_seen.clear()
+        self.guard.clear()
         self.read_messages.clear()
         self.unread_messages.clear()
         self.processed_timestamps.clear()
+        stats = self.broker.stats()
+        self.broker.close()
+        self.app.console.server_log(
+            f"📱: Events pushed {stats['pushed']}, delivered {stats['delivered']}, coalesced {stats['coalesced']}, max depth {stats['max_depth']}"
+        )
         self.app.console.warning_log("📱: Shutdown server")
         self.server_status = None
-        self.server_thread.shutdown()
\ No newline at end of file
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
\ No newline at end of file
@@ -1,5 +1,9 @@
 
+import os
 import json
+import time
+import atexit
+import threading
 
 from toga import App
 from ..framework import Os
@@ -19,142 +23,141 @@ class Settings():
         if not Os.File.Exists(self.settings_path):
             with open(self.settings_path, 'w') as file:
                 json.dump({}, file)
-                
-        Os.FileStream(
-            self.settings_path,
-            Os.FileMode.OpenOrCreate,
-            Os.FileAccess.ReadWrite,
-            Os.FileShare.ReadWrite
-        )
         
         self.miningoptions_path = Os.Path.Combine(str(self.app_config), 'mining.json')
         if not Os.File.Exists(self.miningoptions_path):
             with open(self.miningoptions_path, 'w') as file:
                 json.dump({}, file)
 
+        self.lock = threading.RLock()
+        self.delay = 0.5
+        self.interval = 1
+        self.timer = None
+        self.dirty = False
+        self.checked = 0
+        self.mtime = None
+        self.settings = {}
+        self.load_settings()
+
+        atexit.register(self.flush)
+
+
+    def load_settings(self):
+        with self.lock:
+            try:
+                mtime = os.stat(self.settings_path).st_mtime_ns
+                with open(self.settings_path, 'r') as f:
+                    settings = json.load(f)
+            except (OSError, ValueError):
+                return
+            if isinstance(settings, dict):
+                self.settings = settings
+                self.mtime = mtime
+
+
+    def check_settings(self):
+        now = time.monotonic()
+        if now - self.checked < self.interval:
+            return
+        self.checked = now
+        try:
+            mtime = os.stat(self.settings_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime != self.mtime and not self.dirty:
+            self.load_settings()
+
+
+    def get(self, setting_key, default = None):
+        with self.lock:
+            self.check_settings()
+            return self.settings.get(setting_key, default)
+
 
     def update_settings(self, setting_key, setting_value):
-        with open(self.settings_path, 'r') as f:
-                settings = json.load(f)
-        settings[setting_key] = setting_value
-        with open(self.settings_path, 'w') as f:
-            json.dump(settings, f, indent=4)
+        with self.lock:
+            self.settings[setting_key] = setting_value
+            self.dirty = True
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.delay, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+
+    def flush(self):
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+            if not self.dirty:
+                return
+            temp_path = f"{self.settings_path}.tmp"
+            try:
+                with open(temp_path, 'w') as f:
+                    json.dump(self.settings, f, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.settings_path)
+                self.mtime = os.stat(self.settings_path).st_mtime_ns
+                self.dirty = False
+            except OSError as e:
+                print(f"Error saving settings: {e}")
 
 
     def hidden_balances(self):
-         with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'hidden_balances' not in settings:
-                return False
-            else:
-                return settings['hidden_balances']
+        return self.get('hidden_balances', False)
 
 
     def notification_txs(self):
-         with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'notifications_txs' not in settings:
-                return True
-            else:
-                return settings['notifications_txs']
-            
+        return self.get('notifications_txs', True)
+
     def notification_messages(self):
-         with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'notifications_messages' not in settings:
-                return True
-            else:
-                return settings['notifications_messages']
-            
+        return self.get('notifications_messages', True)
+
     
     def startup(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'startup' not in settings:
-                return False
-            else:
-                return settings['startup']
-            
+        return self.get('startup', False)
+
 
     def price(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'btcz_price' not in settings:
-                return None
-            else:
-                return settings['btcz_price']
-            
+        return self.get('btcz_price', None)
+
 
     def currency(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'currency' not in settings:
-                return "usd"
-            else:
-                return settings['currency']
-            
+        return self.get('currency', "usd")
+
     def opacity(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'opacity' not in settings:
-                return None
-            else:
-                return settings['opacity']
-            
+        return self.get('opacity', None)
+
             
     def symbol(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'symbol' not in settings:
-                return "$"
-            else:
-                return settings['symbol']
-            
+        return self.get('symbol', "$")
+
             
     def minimize_to_tray(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'minimize' not in settings:
-                return False
-            else:
-                return settings['minimize']
-            
+        return self.get('minimize', False)
+
 
     def tor_network(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'tor_network' not in settings:
-                return None
-            else:
-                return settings['tor_network']
-            
+        return self.get('tor_network', None)
+
 
     def mobile_service(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'mobile_service' not in settings:
-                return None
-            else:
-                return settings['mobile_service']
-            
+        return self.get('mobile_service', None)
+
 
     def only_onion(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'only_onion' not in settings:
-                return None
-            else:
-                return settings['only_onion']
-            
+        return self.get('only_onion', None)
+
 
     def console(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'console' not in settings:
-                return None
-            else:
-                return settings['console']
-            
+        return self.get('console', None)
+
+
+    def download_limit(self):
+        return self.get('download_limit', 0)
+
 
     def save_mining_options(self, miner, address, pool_server, pool_region, ssl, worker):
         options = {
@@ -185,9 +188,4 @@ class Settings():
     
 
     def language(self):
-        with open(self.settings_path, 'r') as f:
-            settings = json.load(f)
-            if 'lang' not in settings:
-                return None
-            else:
-                return settings['lang']
\ No newline at end of file
+        return self.get('lang', None)
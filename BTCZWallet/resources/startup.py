@@ -402,7 +402,7 @@ class BTCZSetup(Box):
         self.status_label.text = self.tr.text("checkbinary_files")
         self.progress_bar._impl.native.Style = ProgressStyle.MARQUEE
         await asyncio.sleep(1)
-        missing_files = self.utils.get_binary_files()
+        missing_files = await self.app.loop.run_in_executor(None, self.utils.get_binary_files)
         if missing_files:
             self.status_label.text = self.tr.text("download_binary")
             self.progress_bar._impl.native.Style = ProgressStyle.BLOCKS
@@ -420,7 +420,7 @@ class BTCZSetup(Box):
         self.status_label.text = self.tr.text("checkparams_files")
         self.progress_bar._impl.native.Style = ProgressStyle.MARQUEE
         await asyncio.sleep(1)
-        missing_files, zk_params_path = self.utils.get_zk_params()
+        missing_files, zk_params_path = await self.app.loop.run_in_executor(None, self.utils.get_zk_params)
         if missing_files:
             self.status_label.text = self.tr.text("download_params")
             self.progress_bar._impl.native.Style = ProgressStyle.BLOCKS
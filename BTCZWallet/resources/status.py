@@ -33,6 +33,9 @@ class AppStatusBar(Box):
         self.font = font
 
         self.latest_blocks = None
+        self.latest_sync = "0.00"
+        self.latest_mediantime = ""
+        self.wallet_txcount = None
 
         self.style.height = self.tr.size("appstatusbar")
 
@@ -187,42 +190,52 @@ class AppStatusBar(Box):
 
     
     def run_statusbar_tasks(self):
-        self.app.loop.create_task(self.update_blockchaininfo())
-        self.app.loop.create_task(self.update_networkhash())
-        self.app.loop.create_task(self.update_connections_count())
+        self.app.console.event_log(f"✔: Blockchain info")
+        self.main.scheduler.subscribe(
+            [("getblockchaininfo", [])], 5, self.update_blockchaininfo
+        )
+        self.app.console.event_log(f"✔: Network Hash")
+        self.main.scheduler.subscribe(
+            [("getnetworksolps", [])], 5, self.update_networkhash
+        )
+        self.app.console.event_log(f"✔: Peer count")
+        self.main.scheduler.subscribe(
+            [("getconnectioncount", [])], 5, self.update_connections_count
+        )
+        self.app.console.event_log(f"✔: Wallet notifications")
+        self.main.scheduler.subscribe(
+            [("getwalletinfo", [])], 5, self.update_walletinfo
+        )
         self.app.loop.create_task(self.update_deprecationinfo())
 
 
-    async def update_blockchaininfo(self):
-        self.app.console.event_log(f"✔: Blockchain info")
-        while True:
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-            blockchaininfo,_ = await self.rpc.getBlockchainInfo()
-            if blockchaininfo is not None:
-                self.node_status = True
-                blocks = blockchaininfo.get('blocks')
-                self.main.home_page.current_blocks = blocks
-                self.main.mobile_server.current_blocks = blocks
-                sync = blockchaininfo.get('verificationprogress')
-                sync_percentage = float(sync) * 100
-                sync_str = f"{sync_percentage:.2f}"
-                mediantime = blockchaininfo.get('mediantime')
-                mediantime_date = datetime.fromtimestamp(mediantime).strftime('%Y-%m-%d %H:%M:%S')
-                status_icon = "images/on.png"
-                if self.latest_blocks and blocks > self.latest_blocks:
-                    self.main.mobile_server.broker.push("update_info")
-                    self.app.console.info_log(f"🧊: New Block {blocks}")
-                self.latest_blocks = blocks
-            else:
-                self.node_status = None
-                status_icon = "images/off.png"
+    async def update_blockchaininfo(self, results):
+        blockchaininfo,_ = results[0]
+        if blockchaininfo is not None:
+            self.node_status = True
+            blocks = blockchaininfo.get('blocks')
+            self.main.home_page.current_blocks = blocks
+            self.main.mobile_server.current_blocks = blocks
+            sync = blockchaininfo.get('verificationprogress')
+            sync_percentage = float(sync) * 100
+            self.latest_sync = f"{sync_percentage:.2f}"
+            mediantime = blockchaininfo.get('mediantime')
+            self.latest_mediantime = datetime.fromtimestamp(mediantime).strftime('%Y-%m-%d %H:%M:%S')
+            status_icon = "images/on.png"
+            if self.latest_blocks and blocks > self.latest_blocks:
+                self.main.scheduler.notify("block")
+                self.main.mobile_server.broker.push("update_info")
+                self.app.console.info_log(f"🧊: New Block {blocks}")
+            self.latest_blocks = blocks
+        else:
+            self.node_status = None
+            status_icon = "images/off.png"
 
-            bitcoinz_size = int(self.utils.get_bitcoinz_size())
+        bitcoinz_size = int(self.utils.get_bitcoinz_size())
 
-            await self.update_statusbar(status_icon, blocks, sync_str, mediantime_date, bitcoinz_size)
-            await asyncio.sleep(5)
+        await self.update_statusbar(
+            status_icon, self.latest_blocks or 0, self.latest_sync, self.latest_mediantime, bitcoinz_size
+        )
 
 
     async def update_statusbar(self, status_icon, blocks, sync, mediantime, bitcoinz_size):
@@ -245,42 +258,40 @@ class AppStatusBar(Box):
             restart = self.utils.restart_app()
             if restart:
                 self.main.notify.hide()
+                self.main.scheduler.stop()
+                await self.rpc.close()
                 self.app.exit()
                 return
 
 
-    async def update_networkhash(self):
-        self.app.console.event_log(f"✔: Network Hash")
-        while True:
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-            networksol,_ = await self.rpc.getNetworkSolps()
-            if networksol is not None:
-                if self.rtl:
-                    netsol = self.units.arabic_digits(str(networksol))
-                    netsol_text = f"{netsol} سول/ث"
-                else:
-                    netsol_text = f"{networksol} Sol/s"
-                self.network_value.text = netsol_text
-            await asyncio.sleep(5)
+    def update_networkhash(self, results):
+        networksol,_ = results[0]
+        if networksol is not None:
+            if self.rtl:
+                netsol = self.units.arabic_digits(str(networksol))
+                netsol_text = f"{netsol} سول/ث"
+            else:
+                netsol_text = f"{networksol} Sol/s"
+            self.network_value.text = netsol_text
 
     
-    async def update_connections_count(self):
-        self.app.console.event_log(f"✔: Peer count")
-        while True:
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-            connection_count,_ = await self.rpc.getConnectionCount()
-            if connection_count is not None:
-                if self.rtl:
-                    connection_count = self.units.arabic_digits(str(connection_count))
-                else:
-                    connection_count = str(connection_count)
-                self.connections_value.text = connection_count
+    def update_connections_count(self, results):
+        connection_count,_ = results[0]
+        if connection_count is not None:
+            if self.rtl:
+                connection_count = self.units.arabic_digits(str(connection_count))
+            else:
+                connection_count = str(connection_count)
+            self.connections_value.text = connection_count
+
 
-            await asyncio.sleep(5)
+    def update_walletinfo(self, results):
+        walletinfo,_ = results[0]
+        if walletinfo is not None:
+            txcount = walletinfo.get('txcount')
+            if self.wallet_txcount is not None and txcount != self.wallet_txcount:
+                self.main.scheduler.notify("wallet")
+            self.wallet_txcount = txcount
 
 
     async def update_deprecationinfo(self):
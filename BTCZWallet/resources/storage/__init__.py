@@ -1,4 +1,5 @@
 from .s_mobile import StorageMobile
 from .s_txs import StorageTxs
 from .s_messages import StorageMessages
-from .s_addresses import StorageAddresses
\ No newline at end of file
+from .s_addresses import StorageAddresses
+from .engine import StorageEngine, AsyncStorage
\ No newline at end of file
@@ -0,0 +1,315 @@
+
+import asyncio
+import queue
+import re
+import sqlite3
+import threading
+from concurrent.futures import Future, InvalidStateError
+from contextlib import contextmanager
+
+
+
+WRITE_STATEMENT = re.compile(
+    r"^\s*(INSERT|UPDATE|DELETE|REPLACE)(?:\s+OR\s+\w+)?(?:\s+INTO|\s+FROM)?\s+(\w+)",
+    re.IGNORECASE
+)
+
+
+
+class StorageEngine:
+    engines = {}
+    engines_lock = threading.Lock()
+    listeners = []
+    listeners_lock = threading.Lock()
+
+    def __init__(self, path):
+        super().__init__()
+
+        self.path = path
+        self.lock = threading.RLock()
+        self.ready = None
+        self.depth = 0
+        self.changes = []
+        self.requests = queue.SimpleQueue()
+        self.worker = None
+        self.worker_lock = threading.Lock()
+        self.batch_size = 64
+
+        self.conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -8000")
+        self.conn.execute("PRAGMA busy_timeout = 10000")
+
+
+    @classmethod
+    def open(cls, path):
+        with cls.engines_lock:
+            engine = cls.engines.get(path)
+            if engine is None:
+                engine = cls(path)
+                cls.engines[path] = engine
+            return engine
+
+
+    @classmethod
+    def close_all(cls):
+        with cls.engines_lock:
+            for engine in cls.engines.values():
+                engine.stop()
+                engine.close()
+            cls.engines.clear()
+
+
+    @classmethod
+    def subscribe(cls, tables, callback):
+        listener = (set(tables) if tables else None, callback)
+        with cls.listeners_lock:
+            cls.listeners.append(listener)
+        return listener
+
+
+    @classmethod
+    def unsubscribe(cls, listener):
+        with cls.listeners_lock:
+            if listener in cls.listeners:
+                cls.listeners.remove(listener)
+
+
+    @classmethod
+    def publish(cls, changes):
+        with cls.listeners_lock:
+            listeners = list(cls.listeners)
+        for table, operation, keys in changes:
+            for tables, callback in listeners:
+                if tables is None or table in tables:
+                    try:
+                        callback(table, operation, keys)
+                    except Exception as e:
+                        print(f"Storage listener error: {e}")
+
+
+    def record(self, query, rowcount, keys):
+        if not rowcount or not self.ready:
+            return
+        match = WRITE_STATEMENT.match(query)
+        if match:
+            operation = match.group(1).lower()
+            if operation == "replace":
+                operation = "insert"
+            self.changes.append((match.group(2), operation, tuple(keys) if keys is not None else None))
+
+
+    def flush(self):
+        changes = list(dict.fromkeys(self.changes))
+        self.changes = []
+        return changes
+
+
+    def submit(self, func, *args, **kwargs):
+        future = Future()
+        with self.worker_lock:
+            if self.worker is None or not self.worker.is_alive():
+                self.worker = threading.Thread(target=self.run_worker, daemon=True)
+                self.worker.start()
+        self.requests.put((future, func, args, kwargs))
+        return future
+
+
+    def stop(self):
+        with self.worker_lock:
+            worker = self.worker
+            self.worker = None
+        if worker:
+            self.requests.put(None)
+            worker.join(5)
+
+
+    def run_worker(self):
+        while True:
+            request = self.requests.get()
+            if request is None:
+                return
+            batch = [request]
+            while len(batch) < self.batch_size:
+                try:
+                    request = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    self.run_batch(batch)
+                    return
+                batch.append(request)
+            self.run_batch(batch)
+
+
+    def run_batch(self, batch):
+        changes = []
+        outcomes = []
+        error = None
+        with self.lock:
+            if len(batch) == 1 or not self.ready:
+                for future, func, args, kwargs in batch:
+                    self.run_request(future, func, args, kwargs)
+                return
+            self.depth += 1
+            try:
+                if not self.conn.in_transaction:
+                    self.conn.execute("BEGIN")
+                for future, func, args, kwargs in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    recorded = len(self.changes)
+                    self.conn.execute("SAVEPOINT request")
+                    try:
+                        result = func(*args, **kwargs)
+                    except BaseException as e:
+                        self.conn.execute("ROLLBACK TO request")
+                        del self.changes[recorded:]
+                        outcomes.append((future, None, e))
+                    else:
+                        outcomes.append((future, result, None))
+                    self.conn.execute("RELEASE request")
+            except Exception as e:
+                error = e
+            finally:
+                self.depth -= 1
+            if not self.depth:
+                if error is None:
+                    try:
+                        self.conn.commit()
+                        changes = self.flush()
+                    except sqlite3.Error as e:
+                        error = e
+                if error is not None:
+                    try:
+                        self.conn.rollback()
+                    except sqlite3.Error:
+                        pass
+                    self.changes = []
+        if error is not None:
+            for future, func, args, kwargs in batch:
+                try:
+                    future.set_exception(error)
+                except InvalidStateError:
+                    pass
+            return
+        for future, result, exception in outcomes:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        self.publish(changes)
+
+
+    def run_request(self, future, func, args, kwargs):
+        if not future.set_running_or_notify_cancel():
+            return True
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            return False
+        future.set_result(result)
+        return True
+
+
+    def setup(self, create_tables):
+        with self.lock:
+            if not self.ready:
+                create_tables()
+                self.ready = True
+
+
+    @contextmanager
+    def transaction(self):
+        changes = []
+        with self.lock:
+            self.depth += 1
+            try:
+                yield self
+            except Exception:
+                self.depth -= 1
+                if not self.depth:
+                    self.conn.rollback()
+                    self.changes = []
+                raise
+            self.depth -= 1
+            if not self.depth:
+                self.conn.commit()
+                changes = self.flush()
+        self.publish(changes)
+
+
+    def execute(self, query, params = (), keys = None):
+        changes = []
+        with self.lock:
+            cursor = self.conn.execute(query, params)
+            self.record(query, cursor.rowcount, keys)
+            if not self.depth:
+                self.conn.commit()
+                changes = self.flush()
+        self.publish(changes)
+        return cursor.rowcount
+
+
+    def executemany(self, query, rows, keys = None):
+        changes = []
+        with self.lock:
+            cursor = self.conn.executemany(query, rows)
+            self.record(query, cursor.rowcount, keys)
+            if not self.depth:
+                self.conn.commit()
+                changes = self.flush()
+        self.publish(changes)
+        return cursor.rowcount
+
+
+    def fetchone(self, query, params = ()):
+        with self.lock:
+            return self.conn.execute(query, params).fetchone()
+
+
+    def fetchall(self, query, params = ()):
+        with self.lock:
+            return self.conn.execute(query, params).fetchall()
+
+
+    def fetchcolumn(self, query, params = ()):
+        with self.lock:
+            return [row[0] for row in self.conn.execute(query, params).fetchall()]
+
+
+    def add_column(self, table_name, column_name, column_type):
+        with self.lock:
+            columns = [row[1] for row in self.conn.execute(f"PRAGMA table_info({table_name})")]
+            if column_name not in columns:
+                self.conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
+                self.conn.commit()
+
+
+    def close(self):
+        with self.lock:
+            try:
+                self.conn.execute("PRAGMA optimize")
+                self.conn.close()
+            except sqlite3.Error:
+                pass
+
+
+
+class AsyncStorage:
+    def __init__(self, storage):
+        super().__init__()
+
+        self.storage = storage
+
+
+    def __getattr__(self, name):
+        method = getattr(self.storage, name)
+        if not callable(method):
+            return method
+        async def call(*args, **kwargs):
+            return await asyncio.wrap_future(self.storage.db.submit(method, *args, **kwargs))
+        return call
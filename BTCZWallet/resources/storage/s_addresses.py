@@ -1,9 +1,10 @@
-
 import sqlite3
 
 from toga import App
 from ...framework import Os
 
+from .engine import StorageEngine, AsyncStorage
+
 
 
 
@@ -14,18 +15,19 @@ class StorageAddresses:
         self.app = app
         self.app_data = self.app.paths.data
         self.data = Os.Path.Combine(str(self.app_data), 'addresses.dat')
-        Os.FileStream(
-            self.data,
-            Os.FileMode.OpenOrCreate,
-            Os.FileAccess.ReadWrite,
-            Os.FileShare.ReadWrite
-        )
+        self.db = StorageEngine.open(self.data)
+        self.db.setup(self.create_tables)
+        self.aio = AsyncStorage(self)
+
+
+    def create_tables(self):
+        self.create_addresses_table()
+        self.create_addresses_indexes()
+        self.create_address_book_table()
+
 
-    
     def create_addresses_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS addresses (
                 type TEXT,
@@ -35,14 +37,26 @@ class StorageAddresses:
             )
             '''
         )
-        conn.commit()
-        conn.close()
+
+
+    def create_addresses_indexes(self):
+        if not self.db.fetchone(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'addresses_address'"
+        ):
+            self.db.execute(
+                '''
+                DELETE FROM addresses WHERE rowid NOT IN (
+                    SELECT MIN(rowid) FROM addresses GROUP BY address
+                )
+                '''
+            )
+        self.db.execute(
+            'CREATE UNIQUE INDEX IF NOT EXISTS addresses_address ON addresses (address)'
+        )
 
 
     def create_address_book_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS address_book (
                 name TEXT,
@@ -50,132 +64,103 @@ class StorageAddresses:
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
 
     def insert_address(self, address_type, change, address, balance):
-        self.create_addresses_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
-            INSERT INTO addresses (type, change, address, balance)
+            INSERT OR IGNORE INTO addresses (type, change, address, balance)
             VALUES (?, ?, ?, ?)
-            ''', 
+            ''',
             (address_type, change, address, balance)
         )
-        conn.commit()
-        conn.close()
+
+
+    def upsert_addresses(self, addresses):
+        self.db.executemany(
+            '''
+            INSERT INTO addresses (type, change, address, balance)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (address) DO UPDATE SET balance = excluded.balance
+            WHERE balance IS NOT excluded.balance
+            ''',
+            addresses,
+            keys=[data[2] for data in addresses]
+        )
 
 
     def insert_book(self, name, address):
-        self.create_address_book_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO address_book (name, address)
             VALUES (?, ?)
-            ''', 
+            ''',
             (name, address)
         )
-        conn.commit()
-        conn.close()
 
 
     def get_addresses(self, full = None ,address_type = None):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if address_type:
-                cursor.execute(
+                return self.db.fetchall(
                     'SELECT * FROM addresses WHERE type = ?',
                     (address_type,)
                 )
-                addresses = cursor.fetchall()
             elif full:
-                cursor.execute('SELECT * FROM addresses')
-                addresses = cursor.fetchall()
-            else:
-                cursor.execute('SELECT address FROM addresses')
-                addresses = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            return addresses
+                return self.db.fetchall('SELECT * FROM addresses')
+            return self.db.fetchcolumn('SELECT address FROM addresses')
         except sqlite3.OperationalError:
             return []
-        
+
 
     def get_address_balance(self, address):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            data = self.db.fetchone(
                 'SELECT balance FROM addresses WHERE address = ?',
                 (address,)
             )
-            data = cursor.fetchone()
-            conn.close()
             if data:
                 return data[0]
             return None
         except sqlite3.OperationalError:
             return None
-        
+
 
     def get_address_book(self, option=None, name = None):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if name:
-                cursor.execute(
+                return self.db.fetchone(
                     'SELECT address FROM address_book WHERE name = ?',
                     (name,)
                 )
-                address = cursor.fetchone()
-                conn.close()
-                return address
-            
+
             if option == "address":
-                cursor.execute('SELECT address FROM address_book')
-                addresses = [row[0] for row in cursor.fetchall()]
+                return self.db.fetchcolumn('SELECT address FROM address_book')
             elif option == "name":
-                cursor.execute('SELECT name FROM address_book')
-                addresses = [row[0] for row in cursor.fetchall()]
-            else:
-                cursor.execute('SELECT * FROM address_book')
-                addresses = cursor.fetchall()
-            conn.close()
-            return addresses
+                return self.db.fetchcolumn('SELECT name FROM address_book')
+            return self.db.fetchall('SELECT * FROM address_book')
         except sqlite3.OperationalError:
             return []
 
 
     def update_balance(self, address, balance):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             UPDATE addresses
             SET balance = ?
             WHERE address = ?
-            ''', (balance, address)
+            ''', (balance, address),
+            keys=(address,)
         )
-        conn.commit()
-        conn.close()
 
-    
+
     def delete_address_book(self, address):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            self.db.execute(
                 '''
                 DELETE FROM address_book WHERE address = ?
-                ''', 
+                ''',
                 (address,)
             )
-            conn.commit()
-            conn.close()
         except sqlite3.OperationalError as e:
-            print(f"Error deleting item: {e}")
\ No newline at end of file
+            print(f"Error deleting item: {e}")
@@ -4,6 +4,8 @@ import sqlite3
 from toga import App
 from ...framework import Os
 
+from .engine import StorageEngine, AsyncStorage
+
 
 
 class StorageMessages:
@@ -13,12 +15,29 @@ class StorageMessages:
         self.app = app
         self.app_data = self.app.paths.data
         self.data = Os.Path.Combine(str(self.app_data), 'messages.dat')
-        Os.FileStream(
-            self.data,
-            Os.FileMode.OpenOrCreate,
-            Os.FileAccess.ReadWrite,
-            Os.FileShare.ReadWrite
-        )
+        self.db = StorageEngine.open(self.data)
+        self.db.setup(self.create_tables)
+        self.aio = AsyncStorage(self)
+
+
+    def create_tables(self):
+        self.create_identity_table()
+        self.create_contacts_table()
+        self.create_pending_table()
+        self.create_messages_table()
+        self.create_unread_messages_table()
+        self.create_txs_table()
+        self.create_key_table()
+        self.create_requests_table()
+        self.create_banned_table()
+        self.create_market_table()
+        self.db.add_column('messages', 'edited', 'INTEGER')
+        self.db.add_column('messages', 'replied', 'INTEGER')
+        self.db.add_column('unread_messages', 'edited', 'INTEGER')
+        self.db.add_column('unread_messages', 'replied', 'INTEGER')
+        self.db.add_column('banned', 'username', 'TEXT')
+        self.migrate_unread_messages_table()
+        self.create_messages_indexes()
 
 
     def is_exists(self):
@@ -26,583 +45,502 @@ class StorageMessages:
             return None
         return self.data
 
-    
+
     def identity(self, category, username, address):
-        self.create_identity_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO identity (category, username, address)
             VALUES (?, ?, ?)
-            ''', 
+            ''',
             (category, username, address)
         )
-        conn.commit()
-        conn.close()
 
 
     def get_identity(self, option = None):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if option == "category":
-                cursor.execute(
+                return self.db.fetchone(
                     "SELECT category FROM identity"
                 )
-                result = cursor.fetchone()
             elif option == "username":
-                cursor.execute(
+                return self.db.fetchone(
                     "SELECT username FROM identity"
                 )
-                result = cursor.fetchone()
             elif option == "address":
-                cursor.execute(
+                return self.db.fetchone(
                     "SELECT address FROM identity"
                 )
-                result = cursor.fetchone()
             elif option is None:
-                cursor.execute(
+                return self.db.fetchone(
                     "SELECT category, username, address FROM identity"
                 )
-                result = cursor.fetchone()
-            conn.close()
-            return result
         except sqlite3.OperationalError:
             return None
-    
+
 
     def add_contact(self, category, id, contact_id, username, address):
-        self.create_contacts_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO contacts (category, id, contact_id, username, address)
             VALUES (?, ?, ?, ?, ?)
             ''',
             (category, id, contact_id, username, address)
         )
-        conn.commit()
-        conn.close()
 
 
     def add_pending(self, category, id, username, address):
-        self.create_pending_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO pending (category, id, username, address)
             VALUES (?, ?, ?, ?)
             ''',
             (category, id, username, address)
         )
-        conn.commit()
-        conn.close()
 
     def add_request(self, id, address):
-        self.create_requests_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO requests (id, address)
             VALUES (?, ?)
             ''',
             (id, address)
         )
-        conn.commit()
-        conn.close()
 
     def key(self, prv_key):
-        self.create_key_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO key (prv_key)
             VALUES (?)
-            ''', 
+            ''',
             (prv_key,)
         )
-        conn.commit()
-        conn.close()
 
     def message(self, id, author, message, amount, timestamp, edited=None, replied = None):
-        self.create_messages_table()
-        self.add_column('messages', 'edited', 'INTEGER')
-        self.add_column('messages', 'replied', 'INTEGER')
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO messages (id, author, message, amount, timestamp, edited, replied)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', 
-            (id, author, message, amount, timestamp, edited, replied)
+            ''',
+            (id, author, message, amount, timestamp, edited, replied),
+            keys=(id,)
         )
-        conn.commit()
-        conn.close()
 
 
     def unread_message(self, id, author, message, amount, timestamp, edited=None, replied = None):
-        self.create_unread_messages_table()
-        self.add_column('unread_messages', 'edited', 'INTEGER')
-        self.add_column('unread_messages', 'replied', 'INTEGER')
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO unread_messages (id, author, message, amount, timestamp, edited, replied)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', 
-            (id, author, message, amount, timestamp, edited, replied)
+            ''',
+            (id, author, message, amount, timestamp, edited, replied),
+            keys=(id,)
         )
-        conn.commit()
-        conn.close()
 
 
     def ban(self, address, username):
-        self.create_banned_table()
-        self.add_column('banned', 'username', 'TEXT')
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO banned (address, username)
             VALUES (?, ?)
-            ''', 
+            ''',
             (address, username)
         )
-        conn.commit()
-        conn.close()
 
-    
+
     def tx(self, txid):
-        self.create_txs_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
-            INSERT INTO txs (txid)
+            INSERT OR IGNORE INTO txs (txid)
             VALUES (?)
-            ''', 
+            ''',
             (txid,)
         )
-        conn.commit()
-        conn.close()
+
+
+    def insert_txs(self, txids):
+        self.db.executemany(
+            '''
+            INSERT OR IGNORE INTO txs (txid)
+            VALUES (?)
+            ''',
+            [(txid,) for txid in txids]
+        )
+
+
+    def transaction(self):
+        return self.db.transaction()
 
 
     def insert_market(self, contact_id, hostname, secret):
-        self.create_market_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO market (contact_id, hostname, secret_key)
             VALUES (?, ?, ?)
-            ''', 
+            ''',
             (contact_id, hostname, secret)
         )
-        conn.commit()
-        conn.close()
 
 
     def get_hostname(self, contact_id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            return self.db.fetchone(
                 'SELECT hostname, secret_key FROM market WHERE contact_id = ?',
                 (contact_id,)
             )
-            data = cursor.fetchone()
-            conn.close()
-            return data
         except sqlite3.OperationalError:
             return None
 
 
     def get_txs(self):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute('SELECT txid FROM txs')
-            txs = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            return txs
+            return self.db.fetchcolumn('SELECT txid FROM txs')
         except sqlite3.OperationalError:
             return []
 
 
+    def get_existing_txs(self, txids):
+        existing = set()
+        txids = list(txids)
+        try:
+            for index in range(0, len(txids), 500):
+                chunk = txids[index:index + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                existing.update(
+                    self.db.fetchcolumn(
+                        f'SELECT txid FROM txs WHERE txid IN ({placeholders})',
+                        chunk
+                    )
+                )
+        except sqlite3.OperationalError:
+            pass
+        return existing
+
+
     def get_contacts(self, option = None):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if option == "address":
-                cursor.execute('SELECT address FROM contacts')
-                contacts = [row[0] for row in cursor.fetchall()]
+                return self.db.fetchcolumn('SELECT address FROM contacts')
             elif option == "contact_id":
-                cursor.execute('SELECT contact_id FROM contacts')
-                contacts = [row[0] for row in cursor.fetchall()]
+                return self.db.fetchcolumn('SELECT contact_id FROM contacts')
             elif option is None:
-                cursor.execute('SELECT * FROM contacts')
-                contacts = cursor.fetchall()
-            conn.close()
-            return contacts
+                return self.db.fetchall('SELECT * FROM contacts')
         except sqlite3.OperationalError:
             return []
-        
+
 
     def get_contact(self, contact_id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            return self.db.fetchone(
                 'SELECT * FROM contacts WHERE contact_id = ?',
                 (contact_id,)
             )
-            contact = cursor.fetchone()
-            conn.close()
-            return contact
         except sqlite3.OperationalError:
             return None
-        
+
 
     def get_contact_username(self, contact_id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            return self.db.fetchone(
                 'SELECT username FROM contacts WHERE contact_id = ?',
                 (contact_id,)
             )
-            contact = cursor.fetchone()
-            conn.close()
-            return contact
         except sqlite3.OperationalError:
             return None
-        
+
 
     def get_contact_address(self, contact_id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            return self.db.fetchone(
                 'SELECT address FROM contacts WHERE contact_id = ?',
                 (contact_id,)
             )
-            contact = cursor.fetchone()
-            conn.close()
-            return contact
         except sqlite3.OperationalError:
             return None
-        
-    
+
+
     def get_id_contact(self, contact_id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            return self.db.fetchone(
                 'SELECT id FROM contacts WHERE contact_id = ?',
                 (contact_id,)
             )
-            id = cursor.fetchone()
-            conn.close()
-            return id
         except sqlite3.OperationalError:
             return None
-        
+
 
     def get_ids_contacts(self):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute('SELECT id FROM contacts')
-            data = cursor.fetchall()
-            conn.close()
-            return [row[0] for row in data]
+            return self.db.fetchcolumn('SELECT id FROM contacts')
         except sqlite3.OperationalError:
             return []
-        
+
 
     def get_pending(self, option = None):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if option == "address":
-                cursor.execute("SELECT address FROM pending")
-                contacts = [row[0] for row in cursor.fetchall()]
+                return self.db.fetchcolumn("SELECT address FROM pending")
             elif option is None:
-                cursor.execute('SELECT * FROM pending')
-                contacts = cursor.fetchall()
-            conn.close()
-            return contacts
+                return self.db.fetchall('SELECT * FROM pending')
         except sqlite3.OperationalError:
             return []
-        
+
 
     def get_pending_single(self, pending_id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            return self.db.fetchone(
                 'SELECT * FROM pending WHERE id = ?',
                 (pending_id,)
             )
-            data = cursor.fetchone()
-            conn.close()
-            return data
         except sqlite3.OperationalError:
             return None
-        
+
 
     def get_requests(self):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute('SELECT address FROM requests')
-            txs = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            return txs
+            return self.db.fetchcolumn('SELECT address FROM requests')
         except sqlite3.OperationalError:
             return []
-        
-        
+
+
     def get_request(self, address):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            return self.db.fetchone(
                 'SELECT id FROM requests WHERE address = ?',
                 (address,)
             )
-            request = cursor.fetchone()
-            conn.close()
-            return request
         except sqlite3.OperationalError:
             return None
-        
-    
+
+
     def get_messages(self, contact_id = None):
         try:
-            self.add_column('messages', 'edited', 'INTEGER')
-            self.add_column('messages', 'replied', 'INTEGER')
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if contact_id:
-                cursor.execute(
+                return self.db.fetchall(
                     'SELECT author, message, amount, timestamp, edited, replied FROM messages WHERE id = ?',
                     (contact_id,)
                 )
-            else:
-                cursor.execute('SELECT * FROM messages')
-            messages = cursor.fetchall()
-            conn.close()
-            return messages
+            return self.db.fetchall('SELECT * FROM messages')
         except sqlite3.OperationalError:
             return []
-        
+
 
     def get_message(self, contact_id = None, timestamp=None):
         try:
-            self.add_column('messages', 'edited', 'INTEGER')
-            self.add_column('messages', 'replied', 'INTEGER')
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if not contact_id:
-                cursor.execute(
+                return self.db.fetchone(
                     'SELECT author, message FROM messages WHERE timestamp = ?',
                     (timestamp,)
                 )
-            else:
-                cursor.execute(
-                    'SELECT timestamp FROM messages WHERE id = ? AND timestamp = ?',
-                    (contact_id, timestamp)
-                )
-            data = cursor.fetchone()
-            conn.close()
-            return data
+            return self.db.fetchone(
+                'SELECT timestamp FROM messages WHERE id = ? AND timestamp = ?',
+                (contact_id, timestamp)
+            )
         except sqlite3.OperationalError:
             return None
-        
+
+
+    def get_messages_since(self, contact_id, cursor, unread = None):
+        table = "unread_messages" if unread else "messages"
+        try:
+            return self.db.fetchall(
+                f'''
+                SELECT m.author, m.message, m.amount, m.timestamp, m.edited, m.replied,
+                    r.author, r.message, m.rowid
+                FROM {table} m
+                LEFT JOIN messages r ON r.rowid = (
+                    SELECT rowid FROM messages WHERE id = m.id AND timestamp = m.replied LIMIT 1
+                )
+                WHERE m.rowid > ? AND +m.id = ?
+                ORDER BY m.rowid
+                ''', (cursor or 0, contact_id)
+            )
+        except sqlite3.OperationalError:
+            return []
+
+
+    def get_messages_page(self, contact_id, limit, before = None):
+        try:
+            if before:
+                timestamp, rowid = before
+                return self.db.fetchall(
+                    '''
+                    SELECT m.author, m.message, m.amount, m.timestamp, m.edited, m.replied,
+                        r.author, r.message, m.rowid
+                    FROM messages m
+                    LEFT JOIN messages r ON r.rowid = (
+                        SELECT rowid FROM messages WHERE id = m.id AND timestamp = m.replied LIMIT 1
+                    )
+                    WHERE m.id = ? AND (m.timestamp, m.rowid) < (?, ?)
+                    ORDER BY m.timestamp DESC, m.rowid DESC
+                    LIMIT ?
+                    ''', (contact_id, timestamp, rowid, limit)
+                )
+            return self.db.fetchall(
+                '''
+                SELECT m.author, m.message, m.amount, m.timestamp, m.edited, m.replied,
+                    r.author, r.message, m.rowid
+                FROM messages m
+                LEFT JOIN messages r ON r.rowid = (
+                    SELECT rowid FROM messages WHERE id = m.id AND timestamp = m.replied LIMIT 1
+                )
+                WHERE m.id = ?
+                ORDER BY m.timestamp DESC, m.rowid DESC
+                LIMIT ?
+                ''', (contact_id, limit)
+            )
+        except sqlite3.OperationalError:
+            return []
+
+
+    def get_messages_cursor(self, unread = None):
+        table = "unread_messages" if unread else "messages"
+        try:
+            data = self.db.fetchone(f'SELECT MAX(rowid) FROM {table}')
+            if data and data[0]:
+                return data[0]
+            return 0
+        except sqlite3.OperationalError:
+            return 0
+
 
     def update_message(self, contact_id, message, timestamp, edit_timestamp):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             UPDATE messages
             SET message = ?, edited = ?
             WHERE id = ? AND timestamp = ?
-            ''', (message, edit_timestamp, contact_id, timestamp)
+            ''', (message, edit_timestamp, contact_id, timestamp),
+            keys=(contact_id,)
         )
-        conn.commit()
-        conn.close()
-        
+
 
     def get_unread_messages(self, contact_id=None):
         try:
-            self.add_column('unread_messages', 'edited', 'INTEGER')
-            self.add_column('unread_messages', 'replied', 'INTEGER')
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if contact_id:
-                cursor.execute(
+                return self.db.fetchall(
                     'SELECT author, message, amount, timestamp, edited, replied FROM unread_messages WHERE id = ?',
                     (contact_id,)
                 )
-            else:
-                cursor.execute('SELECT * FROM unread_messages')
-            messages = cursor.fetchall()
-            conn.close()
-            return messages
+            return self.db.fetchall('SELECT * FROM unread_messages')
         except sqlite3.OperationalError:
             return []
-        
+
+
+    def get_unread_count(self, contact_id=None):
+        try:
+            if contact_id:
+                data = self.db.fetchone(
+                    'SELECT COUNT(*) FROM unread_messages WHERE id = ?',
+                    (contact_id,)
+                )
+            else:
+                data = self.db.fetchone('SELECT COUNT(*) FROM unread_messages')
+            return data[0] if data else 0
+        except sqlite3.OperationalError:
+            return 0
+
 
     def get_unread_message(self, contact_id=None, timestamp=None):
         try:
-            self.add_column('unread_messages', 'edited', 'INTEGER')
-            self.add_column('unread_messages', 'replied', 'INTEGER')
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if not contact_id:
-                cursor.execute(
+                return self.db.fetchone(
                     'SELECT author, message FROM unread_messages WHERE timestamp = ?',
                     (timestamp,)
                 )
-            else:
-                cursor.execute(
-                    'SELECT timestamp FROM unread_messages WHERE id = ? AND timestamp = ?',
-                    (contact_id, timestamp)
-                )
-            data = cursor.fetchone()
-            conn.close()
-            return data
+            return self.db.fetchone(
+                'SELECT timestamp FROM unread_messages WHERE id = ? AND timestamp = ?',
+                (contact_id, timestamp)
+            )
         except sqlite3.OperationalError:
             return None
-        
+
 
     def update_unread_message(self, contact_id, message, timestamp, edit_timestamp):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             UPDATE unread_messages
             SET message = ?, edited = ?
             WHERE id = ? AND timestamp = ?
-            ''', (message, edit_timestamp, contact_id, timestamp)
+            ''', (message, edit_timestamp, contact_id, timestamp),
+            keys=(contact_id,)
         )
-        conn.commit()
-        conn.close()
-        
+
 
     def get_banned(self, option=None):
         try:
-            self.add_column('banned', 'username', 'TEXT')
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if option:
-                cursor.execute('SELECT address FROM banned')
-                data = [row[0] for row in cursor.fetchall()]
-            else:
-                cursor.execute('SELECT * FROM banned')
-                data = cursor.fetchall()
-            conn.close()
-            return data
+                return self.db.fetchcolumn('SELECT address FROM banned')
+            return self.db.fetchall('SELECT * FROM banned')
         except sqlite3.OperationalError:
             return []
-        
+
 
     def delete_pending(self, address):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            self.db.execute(
                 '''
                 DELETE FROM pending WHERE address = ?
-                ''', 
+                ''',
                 (address,)
             )
-            conn.commit()
-            conn.close()
         except sqlite3.OperationalError as e:
             print(f"Error deleting pending contact: {e}")
 
 
     def delete_contact(self, address):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            self.db.execute(
                 '''
                 DELETE FROM contacts WHERE address = ?
-                ''', 
+                ''',
                 (address,)
             )
-            conn.commit()
-            conn.close()
         except sqlite3.OperationalError as e:
             print(f"Error deleting contact: {e}")
-        
+
 
     def delete_request(self, address):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            self.db.execute(
                 '''
                 DELETE FROM requests WHERE address = ?
-                ''', 
+                ''',
                 (address,)
             )
-            conn.commit()
-            conn.close()
         except sqlite3.OperationalError as e:
             print(f"Error deleting request: {e}")
 
 
     def delete_unread(self, contact_id=None):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if contact_id:
-                cursor.execute(
+                self.db.execute(
                     '''
                     DELETE FROM unread_messages WHERE id = ?
-                    ''', 
-                    (contact_id,)
+                    ''',
+                    (contact_id,),
+                    keys=(contact_id,)
                 )
             else:
-                cursor.execute('DELETE FROM unread_messages')
-            conn.commit()
-            conn.close()
+                self.db.execute('DELETE FROM unread_messages')
         except sqlite3.OperationalError as e:
             print(f"Error deleting request: {e}")
 
 
     def delete_ban(self, address):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            self.db.execute(
                 '''
                 DELETE FROM banned WHERE address = ?
-                ''', 
+                ''',
                 (address,)
             )
-            conn.commit()
-            conn.close()
         except sqlite3.OperationalError as e:
             print(f"Error deleting banned contact: {e}")
 
 
     def create_identity_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS identity (
                 category TEXT,
@@ -611,28 +549,20 @@ class StorageMessages:
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
 
     def edit_username(self, old_username, new_username):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             UPDATE identity
             SET username = ?
             WHERE username = ?
             ''', (new_username, old_username)
         )
-        conn.commit()
-        conn.close()
 
 
     def create_contacts_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS contacts (
                 category TEXT,
@@ -643,39 +573,28 @@ class StorageMessages:
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
     def update_contact_username(self, username, contact_id):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             UPDATE contacts
             SET username = ?
             WHERE contact_id = ?
-            ''', (username, contact_id)
+            ''', (username, contact_id),
+            keys=(contact_id,)
         )
-        conn.commit()
-        conn.close()
 
     def update_market(self, contact_id, hostname, secret):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             UPDATE market
             SET hostname = ?, secret_key = ?
             WHERE contact_id = ?
             ''', (hostname, secret, contact_id)
         )
-        conn.commit()
-        conn.close()
 
     def create_pending_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS pending (
                 category TEXT,
@@ -685,13 +604,9 @@ class StorageMessages:
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
     def create_messages_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS messages (
                 id TEXT,
@@ -704,13 +619,9 @@ class StorageMessages:
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
     def create_unread_messages_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS unread_messages (
                 id TEXT,
@@ -719,43 +630,73 @@ class StorageMessages:
                 amount REAL,
                 timestamp INTEGER,
                 edited INTEGER,
-                replied INTEGER
+                replied INTEGER,
+                seq INTEGER PRIMARY KEY AUTOINCREMENT
             )
             '''
         )
-        conn.commit()
-        conn.close()
+
+
+    def migrate_unread_messages_table(self):
+        columns = [row[1] for row in self.db.fetchall('PRAGMA table_info(unread_messages)')]
+        if "seq" in columns:
+            return
+        with self.db.transaction():
+            self.db.execute('ALTER TABLE unread_messages RENAME TO unread_messages_old')
+            self.create_unread_messages_table()
+            self.db.execute(
+                '''
+                INSERT INTO unread_messages (id, author, message, amount, timestamp, edited, replied)
+                SELECT id, author, message, amount, timestamp, edited, replied
+                FROM unread_messages_old ORDER BY rowid
+                '''
+            )
+            self.db.execute('DROP TABLE unread_messages_old')
+
+
+    def create_messages_indexes(self):
+        self.db.execute(
+            'CREATE INDEX IF NOT EXISTS messages_contact ON messages (id, timestamp)'
+        )
+        self.db.execute(
+            'CREATE INDEX IF NOT EXISTS unread_messages_contact ON unread_messages (id, timestamp)'
+        )
 
     def create_txs_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS txs (
-                txid TEXT
+                txid TEXT PRIMARY KEY
             )
             '''
         )
-        conn.commit()
-        conn.close()
+        columns = self.db.fetchall('PRAGMA table_info(txs)')
+        if not any(column[1] == "txid" and column[5] for column in columns):
+            with self.db.transaction():
+                self.db.execute('ALTER TABLE txs RENAME TO txs_old')
+                self.db.execute(
+                    '''
+                    CREATE TABLE txs (
+                        txid TEXT PRIMARY KEY
+                    )
+                    '''
+                )
+                self.db.execute(
+                    'INSERT OR IGNORE INTO txs (txid) SELECT txid FROM txs_old WHERE txid IS NOT NULL'
+                )
+                self.db.execute('DROP TABLE txs_old')
 
     def create_key_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS key (
                 prv_key TEXT
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
     def create_requests_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS requests (
                 id TEXT,
@@ -763,13 +704,9 @@ class StorageMessages:
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
     def create_banned_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS banned (
                 address TEXT,
@@ -777,14 +714,10 @@ class StorageMessages:
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
 
     def create_market_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS market (
                 contact_id TEXT,
@@ -793,19 +726,3 @@ class StorageMessages:
             )
             '''
         )
-        conn.commit()
-        conn.close()
-
-
-    def add_column(self, table_name, column_name, column_type):
-
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(f"PRAGMA table_info({table_name})")
-        columns = [row[1] for row in cursor.fetchall()]
-
-        if column_name not in columns:
-            cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
-            conn.commit()
-
-        conn.close()
\ No newline at end of file
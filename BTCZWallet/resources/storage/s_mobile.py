@@ -3,44 +3,47 @@ import sqlite3
 from toga import App
 from ...framework import Os
 
+from .engine import StorageEngine, AsyncStorage
+
 
 
 class StorageMobile:
+    devices_revision = 0
+
     def __init__(self, app:App):
         super().__init__()
 
         self.app = app
         self.app_data = self.app.paths.data
         self.data = Os.Path.Combine(str(self.app_data), 'mobile.dat')
-        Os.FileStream(
-            self.data,
-            Os.FileMode.OpenOrCreate,
-            Os.FileAccess.ReadWrite,
-            Os.FileShare.ReadWrite
-        )
+        self.db = StorageEngine.open(self.data)
+        self.db.setup(self.create_tables)
+        self.aio = AsyncStorage(self)
+
+
+    def create_tables(self):
+        self.create_mobile_devices_table()
+        self.create_secret_keys_table()
+        self.create_mining_table()
+        self.db.add_column('mobile_devices', 'status', 'TEXT')
+
 
-    
     def create_mobile_devices_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS mobile_devices (
                 id TEXT,
                 name TEXT,
                 taddress TEXT,
                 zaddress TEXT,
+                status TEXT,
                 timestamp INTEGER
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
     def create_secret_keys_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS secret_keys (
                 id TEXT,
@@ -48,14 +51,10 @@ class StorageMobile:
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
-    
+
     def create_mining_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS mining (
                 miner TEXT,
@@ -72,202 +71,173 @@ class StorageMobile:
             )
             '''
         )
-        conn.commit()
-        conn.close()
 
-    
+
     def insert_device(self, id, name, taddress, zaddress):
-        self.create_mobile_devices_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
-            INSERT INTO mobile_devices (id, name, taddress, zaddress, timestamp)
-            VALUES (?, ?, ?, ?, ?)
-            ''', 
+            INSERT INTO mobile_devices (id, name, taddress, zaddress, status, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ''',
             (id, name, taddress, zaddress, None, None)
         )
-        conn.commit()
-        conn.close()
+        StorageMobile.devices_revision += 1
+
 
-    
     def insert_secret(self, device_id, secret):
-        self.create_secret_keys_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO secret_keys (id, secret_key)
             VALUES (?, ?)
-            ''', 
+            ''',
             (device_id, secret)
         )
-        conn.commit()
-        conn.close()
+        StorageMobile.devices_revision += 1
 
 
     def insert_mining_stats(self, miner, address, pool, region, worker, shares, balance, immature, paid, solutions, reward):
-        self.create_mining_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             INSERT INTO mining (miner, address, pool, region, worker, shares, balance, immature, paid, solutions, reward)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', 
+            ''',
             (miner, address, pool, region, worker, shares, balance, immature, paid, solutions, reward)
         )
-        conn.commit()
-        conn.close()
 
 
     def get_secret(self, device_id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            return self.db.fetchone(
                 'SELECT secret_key FROM secret_keys WHERE id = ?',
                 (device_id,)
             )
-            data = cursor.fetchone()
-            conn.close()
-            return data
         except sqlite3.OperationalError:
             return None
-        
+
 
     def get_mining_stats(self):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM mining')
-            data = cursor.fetchone()
-            conn.close()
-            return data
+            return self.db.fetchone('SELECT * FROM mining')
         except sqlite3.OperationalError:
             return None
-        
+
 
     def update_mining_stats(self, miner, address, pool, region, worker, shares, balance, immature, paid, solutions, reward):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             UPDATE mining
             SET miner = ?, address = ?, pool = ?, region = ?, worker = ?,
                 shares = ?, balance = ?, immature = ?, paid = ?, solutions = ?, reward = ?
             ''', (miner, address, pool, region, worker, shares, balance, immature, paid, solutions, reward)
         )
-        conn.commit()
-        conn.close()
 
 
     def delete_device(self, device_id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            self.db.execute(
                 '''
                 DELETE FROM mobile_devices WHERE id = ?
-                ''', 
+                ''',
                 (device_id,)
             )
-            conn.commit()
-            conn.close()
+            StorageMobile.devices_revision += 1
         except sqlite3.OperationalError as e:
             print(f"Error deleting item: {e}")
 
-    
+
     def delete_secret(self, device_id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            self.db.execute(
                 '''
                 DELETE FROM secret_keys WHERE id = ?
-                ''', 
+                ''',
                 (device_id,)
             )
-            conn.commit()
-            conn.close()
+            StorageMobile.devices_revision += 1
         except sqlite3.OperationalError as e:
             print(f"Error deleting item: {e}")
 
 
     def update_device_addresses(self, id, taddress, zaddress):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             UPDATE mobile_devices
             SET taddress = ?, zaddress = ?
             WHERE id = ?
             ''', (taddress, zaddress, id)
         )
-        conn.commit()
-        conn.close()
 
 
     def update_device_connected(self, id, timestamp):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
+            '''
+            UPDATE mobile_devices
+            SET status = ?, timestamp = ?
+            WHERE id = ?
+            ''', ("on", timestamp, id)
+        )
+
+
+    def update_device_status(self, id, status):
+        self.db.execute(
             '''
             UPDATE mobile_devices
-            SET timestamp = ?
+            SET status = ?
             WHERE id = ?
-            ''', (timestamp, id)
+            ''', (status, id)
         )
-        conn.commit()
-        conn.close()
+
+
+    def update_devices_offline(self, timestamp):
+        self.db.execute(
+            '''
+            UPDATE mobile_devices
+            SET status = 'off'
+            WHERE status = 'on' AND timestamp < ?
+            ''', (timestamp,)
+        )
+
+
+    def get_device_secrets(self):
+        try:
+            return self.db.fetchall(
+                '''
+                SELECT d.id, s.secret_key FROM mobile_devices d
+                JOIN secret_keys s ON s.id = d.id
+                '''
+            )
+        except sqlite3.OperationalError:
+            return []
 
 
     def get_auth_ids(self):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute('SELECT id FROM mobile_devices')
-            data = cursor.fetchall()
-            conn.close()
-            return [row[0] for row in data]
+            return self.db.fetchcolumn('SELECT id FROM mobile_devices')
         except sqlite3.OperationalError:
             return []
-        
+
 
     def get_devices(self):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM mobile_devices')
-            data = cursor.fetchall()
-            conn.close()
-            return data
+            return self.db.fetchall(
+                'SELECT id, name, taddress, zaddress, status, timestamp FROM mobile_devices'
+            )
         except sqlite3.OperationalError:
             return []
-        
+
 
     def get_device_addresses(self, id):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
+            return self.db.fetchone(
                 'SELECT taddress, zaddress FROM mobile_devices WHERE id = ?',
                 (id,)
             )
-            data = cursor.fetchone()
-            conn.close()
-            return data
         except sqlite3.OperationalError:
             return None
-        
+
 
     def get_addresses_list(self, address_type):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(f'SELECT {address_type} FROM mobile_devices')
-            data = cursor.fetchall()
-            conn.close()
-            return [row[0] for row in data]
+            return self.db.fetchcolumn(f'SELECT {address_type} FROM mobile_devices')
         except sqlite3.OperationalError:
-            return []
\ No newline at end of file
+            return []
@@ -1,9 +1,10 @@
-
 import sqlite3
 
 from toga import App
 from ...framework import Os
 
+from .engine import StorageEngine, AsyncStorage
+
 
 
 class StorageTxs:
@@ -13,18 +14,22 @@ class StorageTxs:
         self.app = app
         self.app_data = self.app.paths.data
         self.data = Os.Path.Combine(str(self.app_data), 'transactions.dat')
-        Os.FileStream(
-            self.data,
-            Os.FileMode.OpenOrCreate,
-            Os.FileAccess.ReadWrite,
-            Os.FileShare.ReadWrite
-        )
+        self.db = StorageEngine.open(self.data)
+        self.db.setup(self.create_tables)
+        self.aio = AsyncStorage(self)
+
+
+    def create_tables(self):
+        self.create_transactions_table()
+        self.create_transactions_revision()
+        self.create_transactions_indexes()
+        self.create_sync_table()
+        self.create_headers_table()
+        self.create_operations_table()
+
 
-    
     def create_transactions_table(self):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             CREATE TABLE IF NOT EXISTS transactions (
                 type TEXT,
@@ -34,99 +39,346 @@ class StorageTxs:
                 amount REAL,
                 blocks INTEGER,
                 fee INTEGER,
+                timestamp INTEGER,
+                revision INTEGER
+            )
+            '''
+        )
+
+
+    def create_transactions_revision(self):
+        columns = [column[1] for column in self.db.fetchall('PRAGMA table_info(transactions)')]
+        if "revision" not in columns:
+            self.db.execute('ALTER TABLE transactions ADD COLUMN revision INTEGER')
+            self.db.execute('UPDATE transactions SET revision = rowid')
+
+
+    def create_sync_table(self):
+        self.db.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS sync (
+                name TEXT PRIMARY KEY,
+                value TEXT
+            )
+            '''
+        )
+
+
+    def create_headers_table(self):
+        self.db.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS headers (
+                hash TEXT PRIMARY KEY,
+                height INTEGER,
+                time INTEGER
+            )
+            '''
+        )
+        self.db.execute(
+            'CREATE INDEX IF NOT EXISTS headers_height ON headers (height)'
+        )
+
+
+    def create_operations_table(self):
+        self.db.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS operations (
+                opid TEXT PRIMARY KEY,
+                kind TEXT,
+                data TEXT,
+                status TEXT,
+                txid TEXT,
+                error TEXT,
                 timestamp INTEGER
             )
             '''
         )
-        conn.commit()
-        conn.close()
+
+
+    def create_transactions_indexes(self):
+        if not self.db.fetchone(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'transactions_key'"
+        ):
+            self.db.execute(
+                '''
+                DELETE FROM transactions WHERE rowid NOT IN (
+                    SELECT MIN(rowid) FROM transactions GROUP BY txid, address, category
+                )
+                '''
+            )
+        self.db.execute(
+            'CREATE UNIQUE INDEX IF NOT EXISTS transactions_key ON transactions (txid, address, category)'
+        )
+        self.db.execute(
+            'CREATE INDEX IF NOT EXISTS transactions_timestamp ON transactions (timestamp)'
+        )
+        self.db.execute(
+            'CREATE INDEX IF NOT EXISTS transactions_address ON transactions (address)'
+        )
+        self.db.execute(
+            'CREATE INDEX IF NOT EXISTS transactions_blocks ON transactions (blocks)'
+        )
+        self.db.execute(
+            'CREATE INDEX IF NOT EXISTS transactions_type ON transactions (type, txid)'
+        )
+        self.db.execute(
+            'CREATE INDEX IF NOT EXISTS transactions_revision ON transactions (revision)'
+        )
 
 
     def insert_transaction(self, tx_type, category, address, txid, amount, blocks, fee, timestamp):
-        self.create_transactions_table()
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
-            INSERT INTO transactions (type, category, address, txid, amount, blocks, fee, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', 
+            INSERT OR IGNORE INTO transactions (type, category, address, txid, amount, blocks, fee, timestamp, revision)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(revision), 0) + 1 FROM transactions))
+            ''',
             (tx_type, category, address, txid, amount, blocks, fee, timestamp)
         )
-        conn.commit()
-        conn.close()
+
+
+    def insert_transactions(self, transactions):
+        self.db.executemany(
+            '''
+            INSERT OR IGNORE INTO transactions (type, category, address, txid, amount, blocks, fee, timestamp, revision)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(revision), 0) + 1 FROM transactions))
+            ''',
+            transactions
+        )
 
 
     def get_transaction(self, txid):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
-                'SELECT * FROM transactions WHERE txid = ?',
+            return self.db.fetchone(
+                '''
+                SELECT type, category, address, txid, amount, blocks, fee, timestamp
+                FROM transactions WHERE txid = ?
+                ''',
                 (txid,)
             )
-            transaction = cursor.fetchone()
-            conn.close()
-            return transaction
         except sqlite3.OperationalError:
             return []
 
 
     def get_transactions(self, option = None, tx_type = None):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
             if option:
-                cursor.execute(
+                return self.db.fetchcolumn(
                     'SELECT txid FROM transactions WHERE type = ?',
                     (tx_type,)
                 )
-                transactions = [row[0] for row in cursor.fetchall()]
-            else:
-                cursor.execute('SELECT * FROM transactions')
-                transactions = cursor.fetchall()
-            conn.close()
-            return transactions
+            return self.db.fetchall(
+                'SELECT type, category, address, txid, amount, blocks, fee, timestamp FROM transactions'
+            )
         except sqlite3.OperationalError:
             return []
-        
 
-    def get_mobile_transactions(self, address):
+
+    def get_existing_transactions(self, txids, tx_type):
+        existing = set()
+        txids = list(txids)
+        try:
+            for index in range(0, len(txids), 500):
+                chunk = txids[index:index + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                existing.update(
+                    self.db.fetchcolumn(
+                        f'SELECT txid FROM transactions WHERE type = ? AND txid IN ({placeholders})',
+                        (tx_type, *chunk)
+                    )
+                )
+        except sqlite3.OperationalError:
+            pass
+        return existing
+
+
+    def get_transactions_page(self, limit, before = None):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute(
-                'SELECT * FROM transactions WHERE address = ?',
-                (address,)
+            if before:
+                timestamp, rowid = before
+                return self.db.fetchall(
+                    '''
+                    SELECT type, category, address, txid, amount, blocks, fee, timestamp, rowid FROM transactions
+                    WHERE (timestamp, rowid) < (?, ?)
+                    ORDER BY timestamp DESC, rowid DESC
+                    LIMIT ?
+                    ''', (timestamp, rowid, limit)
+                )
+            return self.db.fetchall(
+                '''
+                SELECT type, category, address, txid, amount, blocks, fee, timestamp, rowid FROM transactions
+                ORDER BY timestamp DESC, rowid DESC
+                LIMIT ?
+                ''', (limit,)
             )
-            transactions = cursor.fetchall()
-            conn.close()
-            return transactions
         except sqlite3.OperationalError:
             return []
-        
+
+
+    def get_mobile_transactions(self, addresses, limit = -1, since = None):
+        addresses = [address for address in addresses if address]
+        if not addresses:
+            return []
+        placeholders = ", ".join("?" for _ in addresses)
+        revision, rowid = since or (0, 0)
+        try:
+            return self.db.fetchall(
+                f'''
+                SELECT type, category, address, txid, amount, blocks, fee, timestamp, revision, rowid
+                FROM transactions
+                WHERE address IN ({placeholders}) AND (revision, rowid) > (?, ?)
+                ORDER BY revision, rowid
+                LIMIT ?
+                ''', (*addresses, revision, rowid, limit)
+            )
+        except sqlite3.OperationalError:
+            return []
+
+
+    def get_transactions_revision(self):
+        try:
+            data = self.db.fetchone('SELECT MAX(revision) FROM transactions')
+            if data and data[0]:
+                return data[0]
+            return 0
+        except sqlite3.OperationalError:
+            return 0
+
 
     def get_unconfirmed_transactions(self):
         try:
-            conn = sqlite3.connect(self.data)
-            cursor = conn.cursor()
-            cursor.execute('SELECT txid FROM transactions WHERE blocks = 0')
-            transactions = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            return transactions
+            return self.db.fetchcolumn('SELECT txid FROM transactions WHERE blocks = 0')
         except sqlite3.OperationalError:
             return []
-        
+
 
     def update_transaction(self, txid, blocks):
-        conn = sqlite3.connect(self.data)
-        cursor = conn.cursor()
-        cursor.execute(
+        self.db.execute(
             '''
             UPDATE transactions
-            SET blocks = ?
-            WHERE txid = ?
-            ''', (blocks, txid)
+            SET blocks = ?, revision = (SELECT COALESCE(MAX(revision), 0) + 1 FROM transactions)
+            WHERE txid = ? AND blocks IS NOT ?
+            ''', (blocks, txid, blocks)
+        )
+
+
+    def update_transactions(self, transactions):
+        self.db.executemany(
+            '''
+            UPDATE transactions
+            SET blocks = ?1, revision = (SELECT COALESCE(MAX(revision), 0) + 1 FROM transactions)
+            WHERE txid = ?2 AND blocks IS NOT ?1
+            ''', transactions
+        )
+
+
+    def rollback_transactions(self, height):
+        self.db.execute(
+            '''
+            UPDATE transactions
+            SET blocks = 0, revision = (SELECT COALESCE(MAX(revision), 0) + 1 FROM transactions)
+            WHERE blocks > ?
+            ''', (height,)
+        )
+
+
+    def get_sync_cursor(self, name):
+        try:
+            data = self.db.fetchone(
+                'SELECT value FROM sync WHERE name = ?',
+                (name,)
+            )
+            if data:
+                return data[0]
+            return None
+        except sqlite3.OperationalError:
+            return None
+
+
+    def update_sync_cursor(self, name, value):
+        self.db.execute(
+            '''
+            INSERT OR REPLACE INTO sync (name, value)
+            VALUES (?, ?)
+            ''', (name, value)
+        )
+
+
+    def insert_headers(self, headers):
+        self.db.executemany(
+            '''
+            INSERT OR REPLACE INTO headers (hash, height, time)
+            VALUES (?, ?, ?)
+            ''',
+            headers
+        )
+
+
+    def get_headers(self, blocks):
+        hashes = [block for block in blocks if isinstance(block, str)]
+        heights = [block for block in blocks if isinstance(block, int)]
+        headers = []
+        try:
+            for column, values in (("hash", hashes), ("height", heights)):
+                for index in range(0, len(values), 500):
+                    chunk = values[index:index + 500]
+                    placeholders = ", ".join("?" for _ in chunk)
+                    headers.extend(
+                        self.db.fetchall(
+                            f'SELECT hash, height, time FROM headers WHERE {column} IN ({placeholders})',
+                            chunk
+                        )
+                    )
+        except sqlite3.OperationalError:
+            pass
+        return headers
+
+
+    def insert_operation(self, opid, kind, data, timestamp):
+        self.db.execute(
+            '''
+            INSERT OR REPLACE INTO operations (opid, kind, data, status, txid, error, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''',
+            (opid, kind, data, "executing", None, None, timestamp)
+        )
+
+
+    def update_operation(self, opid, status, txid, error):
+        self.db.execute(
+            '''
+            UPDATE operations
+            SET status = ?, txid = ?, error = ?
+            WHERE opid = ?
+            ''', (status, txid, error, opid)
+        )
+
+
+    def get_operation(self, opid):
+        try:
+            return self.db.fetchone(
+                'SELECT opid, kind, data, status, txid, error, timestamp FROM operations WHERE opid = ?',
+                (opid,)
+            )
+        except sqlite3.OperationalError:
+            return None
+
+
+    def get_pending_operations(self):
+        try:
+            return self.db.fetchall(
+                '''
+                SELECT opid, kind, data, status, txid, error, timestamp FROM operations
+                WHERE status = 'executing'
+                '''
+            )
+        except sqlite3.OperationalError:
+            return []
+
+
+    def delete_operations(self, timestamp):
+        self.db.execute(
+            '''
+            DELETE FROM operations
+            WHERE status != 'executing' AND timestamp < ?
+            ''', (timestamp,)
         )
-        conn.commit()
-        conn.close()
\ No newline at end of file
@@ -8,6 +8,8 @@ from toga.style.pack import Pack
 from toga.constants import ROW, TOP, CENTER, COLUMN
 from toga.colors import rgb, RED, GRAY
 
+from .storage import StorageEngine
+
 
 class AppToolBar(Box):
     def __init__(self, app:App, main:Window, settings, utils, rpc, tr, font):
@@ -1100,8 +1102,12 @@ class AppToolBar(Box):
                 self.main.notify.hide()
                 self.main.notify.dispose()
                 if self.main.mobile_server.server_status:
+                    await self.main.mobile_server.stop()
                     self.main.notifymobile.hide()
                     self.main.notifymobile.dispose()
+                self.main.scheduler.stop()
+                await self.rpc.close()
+                StorageEngine.close_all()
                 self.app.exit()
 
         if self.main.mining_page.mining_status:
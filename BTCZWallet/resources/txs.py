@@ -1,6 +1,5 @@
 
 import asyncio
-import operator
 from datetime import datetime
 import webbrowser
 
@@ -285,96 +284,90 @@ class Txid(Window):
                 self.fee_value
             )
 
-        asyncio.create_task(self.update_transaction_info())
+        self.updating_txid = self.main.scheduler.subscribe([], 5, self.update_transaction_info)
 
 
     async def update_transaction_info(self):
-        if not self.updating_txid:
-            self.updating_txid = True
-            while True:
-                if not self.updating_txid:
-                    return
-                if self.address.startswith("z"):
-                    transaction_info = self.storagetxs.get_transaction(self.txid)
-                    tx_type, category, address, txid, amount_val, blocks, fee_val, timestamp = transaction_info
-
-                    amount = self.units.format_balance(amount_val)
-                    fee = self.units.format_balance(fee_val) if category == "send" else "NaN"
+        if self.address.startswith("z"):
+            transaction_info = self.storagetxs.get_transaction(self.txid)
+            tx_type, category, address, txid, amount_val, blocks, fee_val, timestamp = transaction_info
 
-                    if self.rtl:
-                        amount = self.units.arabic_digits(amount)
-                        if category == "send":
-                            fee = self.units.arabic_digits(fee)
-                            category = self.tr.text("category_send")
-                        else:
-                            category = self.tr.text("category_receive")
+            amount = self.units.format_balance(amount_val)
+            fee = self.units.format_balance(fee_val) if category == "send" else "NaN"
 
-                    if self.settings.hidden_balances():
-                        amount = "*.********"
+            if self.rtl:
+                amount = self.units.arabic_digits(amount)
+                if category == "send":
+                    fee = self.units.arabic_digits(fee)
+                    category = self.tr.text("category_send")
+                else:
+                    category = self.tr.text("category_receive")
 
-                    confirmations = 0
-                    if blocks > 0:
-                        if tx_type == "shielded":
-                            confirmations = self.main.home_page.current_blocks - blocks
-                        else:
-                            confirmations = (self.main.home_page.current_blocks - blocks) + 1
-                    if confirmations <= 0:
-                        color = RED
-                    elif 1 <= confirmations < 6:
-                        color = ORANGE
-                    else:
-                        color = GREEN
+            if self.settings.hidden_balances():
+                amount = "*.********"
 
-                    formatted_timereceived = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-                    if self.rtl:
-                        formatted_timereceived = self.units.arabic_digits(formatted_timereceived)
-                        confirmations = self.units.arabic_digits(str(confirmations))
+            confirmations = 0
+            if blocks > 0:
+                if tx_type == "shielded":
+                    confirmations = self.main.home_page.current_blocks - blocks
                 else:
-                    transaction_info,_ = await self.rpc.getTransaction(self.txid)
-                    details = transaction_info.get('details', [])
-                    if details:
-                        category = details[0]['category']
-                    else:
-                        category = "unknown"
+                    confirmations = (self.main.home_page.current_blocks - blocks) + 1
+            if confirmations <= 0:
+                color = RED
+            elif 1 <= confirmations < 6:
+                color = ORANGE
+            else:
+                color = GREEN
 
-                    if category == "send":
-                        fee = self.units.format_balance(float(transaction_info.get('fee', 0)))
-                        if self.rtl:
-                            category = self.tr.text("category_send")
-                            fee = self.units.arabic_digits(fee)
-                    else:
-                        category = self.tr.text("category_receive")
-                        fee = "NaN"
+            formatted_timereceived = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+            if self.rtl:
+                formatted_timereceived = self.units.arabic_digits(formatted_timereceived)
+                confirmations = self.units.arabic_digits(str(confirmations))
+        else:
+            transaction_info,_ = await self.main.scheduler.call("gettransaction", [self.txid], 5)
+            details = transaction_info.get('details', [])
+            if details:
+                category = details[0]['category']
+            else:
+                category = "unknown"
 
-                    amount = self.units.format_balance(float(transaction_info.get('amount', 0)))
-                    if self.rtl:
-                        amount = self.units.arabic_digits(amount)
-                    if self.settings.hidden_balances():
-                        amount = "*.********"
+            if category == "send":
+                fee = self.units.format_balance(float(transaction_info.get('fee', 0)))
+                if self.rtl:
+                    category = self.tr.text("category_send")
+                    fee = self.units.arabic_digits(fee)
+            else:
+                category = self.tr.text("category_receive")
+                fee = "NaN"
 
-                    confirmations = transaction_info.get('confirmations', 0)
-                    if confirmations <= 0:
-                        color = RED
-                    elif 1 <= confirmations < 6:
-                        color = ORANGE
-                    else:
-                        color = GREEN
+            amount = self.units.format_balance(float(transaction_info.get('amount', 0)))
+            if self.rtl:
+                amount = self.units.arabic_digits(amount)
+            if self.settings.hidden_balances():
+                amount = "*.********"
+
+            confirmations = transaction_info.get('confirmations', 0)
+            if confirmations <= 0:
+                color = RED
+            elif 1 <= confirmations < 6:
+                color = ORANGE
+            else:
+                color = GREEN
+
+            timereceived = transaction_info.get('timereceived', 0)
+            formatted_timereceived = datetime.fromtimestamp(timereceived).strftime("%Y-%m-%d %H:%M:%S")
+            if self.rtl:
+                confirmations = self.units.arabic_digits(str(confirmations))
+                formatted_timereceived = self.units.arabic_digits(formatted_timereceived)
+            
+
+        self.confirmations_value.style.color = color
+        self.confirmations_value.text = confirmations
+        self.category_value.text = category
+        self.time_value.text = formatted_timereceived
+        self.amount_value.text = amount
+        self.fee_value.text = fee
 
-                    timereceived = transaction_info.get('timereceived', 0)
-                    formatted_timereceived = datetime.fromtimestamp(timereceived).strftime("%Y-%m-%d %H:%M:%S")
-                    if self.rtl:
-                        confirmations = self.units.arabic_digits(str(confirmations))
-                        formatted_timereceived = self.units.arabic_digits(formatted_timereceived)
-                    
-
-                self.confirmations_value.style.color = color
-                self.confirmations_value.text = confirmations
-                self.category_value.text = category
-                self.time_value.text = formatted_timereceived
-                self.amount_value.text = amount
-                self.fee_value.text = fee
-                
-                await asyncio.sleep(5)
 
     def close_button_mouse_enter(self, sender, event):
         self.close_button.style.color = BLACK
@@ -385,6 +378,7 @@ class Txid(Window):
         self.close_button.style.background_color = rgb(30,33,36)
 
     def close_transaction_info(self, button):
+        self.main.scheduler.unsubscribe(self.updating_txid)
         self.updating_txid = None
         self.close()
         self.app.current_window = self.main
@@ -424,8 +418,9 @@ class Transactions(Box):
         self.txid_toggle = None
 
         self.transactions_count = 50
-        self.transactions_from = 0
-        self.transactions_ids = []
+        self.transactions_cursor = None
+        self.transactions_ids = set()
+        self.conflicted_transactions = set()
         self.transactions_data = []
 
         self.rtl = None
@@ -519,19 +514,32 @@ class Transactions(Box):
 
 
     async def run_tasks(self):
-        self.app.loop.create_task(self.gather_transparent_transactions())
+        self.app.console.event_log(f"✔: Transparent transactions")
+        self.main.scheduler.subscribe(
+            [], 60, self.gather_transparent_transactions, ("block", "wallet")
+        )
         await asyncio.sleep(0.5)
-        self.app.loop.create_task(self.update_unconfirmed_transactions())
+        self.app.console.event_log(f"✔: Unconfirmed transactions")
+        self.main.scheduler.subscribe([], 60, self.update_unconfirmed_transactions, ("block",))
         await asyncio.sleep(0.5)
-        self.app.loop.create_task(self.gather_shielded_transactions())
+        self.app.console.event_log(f"✔: Shielded transactions")
+        self.main.scheduler.subscribe(
+            [("z_listaddresses", [])], 60, self.gather_shielded_transactions, ("block", "wallet")
+        )
         await asyncio.sleep(1)
-        self.app.loop.create_task(self.update_transactions_table())
+        sorted_transactions = self.get_transactions(self.transactions_count)
+        for data in sorted_transactions:
+            txid = data[3]
+            self.transactions_ids.add(txid)
+        self.app.console.event_log(f"✔: Transactions list")
+        self.main.scheduler.subscribe([], None, self.update_transactions_table, ("table:transactions",))
 
 
     def insert_widgets(self):
         if not self.transactions_toggle:
-            sorted_transactions = self.get_transactions(self.transactions_count, self.transactions_from)
+            sorted_transactions = self.get_transactions(self.transactions_count)
             if sorted_transactions:
+                self.transactions_cursor = self.get_cursor(sorted_transactions)
                 self._impl.native.Controls.Add(self.transactions_table)
                 self.create_rows(sorted_transactions)
             else:
@@ -539,17 +547,13 @@ class Transactions(Box):
             self.transactions_toggle = True
 
 
-    def get_transactions(self, limit, offset):
-        transactions_list = self.storagetxs.get_transactions()
-        if not transactions_list:
-            return []
-        sorted_transactions = sorted(
-            transactions_list,
-            key=operator.itemgetter(7),
-            reverse=True
-        )
-        transactions = sorted_transactions[offset:offset + limit]
-        return transactions
+    def get_transactions(self, limit, before = None):
+        return self.storagetxs.get_transactions_page(limit, before)
+
+
+    def get_cursor(self, transactions):
+        last_transaction = transactions[-1]
+        return last_transaction[7], last_transaction[8]
 
     
     def no_transactions_found(self):
@@ -602,10 +606,11 @@ class Transactions(Box):
 
     def reload_transactions(self):
         if self.transactions_toggle:
-            self.transactions_from = 0
+            self.transactions_cursor = None
             self.no_more_transactions = None
-            sorted_transactions = self.get_transactions(self.transactions_count, self.transactions_from)
+            sorted_transactions = self.get_transactions(self.transactions_count)
             if sorted_transactions:
+                self.transactions_cursor = self.get_cursor(sorted_transactions)
                 if self.no_transaction_toggle:
                     self.remove(self.no_transaction)
                     self._impl.native.Controls.Add(self.transactions_table)
@@ -614,122 +619,146 @@ class Transactions(Box):
                 self.create_rows(sorted_transactions)
 
 
+    async def get_sync_block(self):
+        blockhash = await self.storagetxs.aio.get_sync_cursor("lastblock")
+        if not blockhash:
+            return None
+        block,_ = await self.main.scheduler.call("getblockheader", [blockhash, True])
+        fork = block
+        while fork and fork.get("confirmations", 0) < 0:
+            fork,_ = await self.main.scheduler.call("getblockheader", [fork.get("previousblockhash"), True])
+        if not fork:
+            return None
+        if fork is not block:
+            height = fork.get("height")
+            await self.storagetxs.aio.rollback_transactions(height)
+            self.app.console.info_log(f"🔀: Chain reorganized, rolled back to block {height}")
+        return fork.get("hash")
+
+
     async def gather_transparent_transactions(self):
-        self.app.console.event_log(f"✔: Transparent transactions")
         tx_type = "transparent"
-        while True:
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-            new_mobile_tx = False
-            new_transactions = await self.get_transaparent_transactions(9999, 0)
-            if new_transactions:
-                stored_transactions = self.storagetxs.get_transactions(True, "transparent")
-                for data in new_transactions:
-                    txid = data["txid"]
-                    address = data.get("address", "Shielded")
-                    category = data["category"]
-                    amount = data["amount"]
-                    timereceived = data["timereceived"]
-                    fee = 0
-                    if "fee" in data:
-                        fee = data["fee"]
-                    if txid not in stored_transactions:
-                        mobile_addresses = self.storage_mobile.get_addresses_list("taddress")
-                        if address in mobile_addresses:
-                            new_mobile_tx = True
-                        if "blockhash" not in data:
-                            blocks = 0
-                            self.storagetxs.insert_transaction(tx_type, category, address, txid, amount, blocks, fee, timereceived)
-                        else:
-                            blockhash = data["blockhash"]
-                            asyncio.create_task((self.get_block_height(blockhash, tx_type, category, address, txid, amount, fee, timereceived)))
-
-                if new_mobile_tx:
-                    self.main.mobile_server.broker.push("update_transactions")
-                        
-            await asyncio.sleep(10)
-            
+        new_mobile_tx = False
+        blockhash = await self.get_sync_block()
+        params = [blockhash] if blockhash else []
+        result,_ = await self.main.scheduler.call("listsinceblock", params)
+        if not result:
+            return
+        new_transactions = result.get("transactions")
+        if new_transactions:
+            stored_transactions = await self.storagetxs.aio.get_existing_transactions(
+                [data["txid"] for data in new_transactions], tx_type
+            )
+            new_transactions = [data for data in new_transactions if data["txid"] not in stored_transactions]
+        if new_transactions:
+            blocks_info = await self.main.headers.get_headers(
+                data["blockhash"] for data in new_transactions if "blockhash" in data
+            )
+            mobile_addresses = await self.storage_mobile.aio.get_addresses_list("taddress")
+            transactions = []
+            for data in new_transactions:
+                txid = data["txid"]
+                address = data.get("address", "Shielded")
+                category = data["category"]
+                amount = data["amount"]
+                timereceived = data["timereceived"]
+                fee = 0
+                if "fee" in data:
+                    fee = data["fee"]
+                if address in mobile_addresses:
+                    new_mobile_tx = True
+                blocks = 0
+                block = blocks_info.get(data.get("blockhash"))
+                if block:
+                    blocks = block.get("height")
+                transactions.append((tx_type, category, address, txid, amount, blocks, fee, timereceived))
+
+            await self.storagetxs.aio.insert_transactions(transactions)
+            if new_mobile_tx:
+                self.main.mobile_server.broker.push("update_transactions")
+
+        lastblock = result.get("lastblock")
+        if lastblock:
+            await self.storagetxs.aio.update_sync_cursor("lastblock", lastblock)
 
 
     async def update_unconfirmed_transactions(self):
-        self.app.console.event_log(f"✔: Unconfirmed transactions")
-        while True:
-            unconfirmed_transactions = self.storagetxs.get_unconfirmed_transactions()
-            if unconfirmed_transactions:
-                for txid in unconfirmed_transactions:
-                    result,_ = await self.rpc.getTransaction(txid)
-                    if "blockhash" in result:
-                        blockhash = result["blockhash"]
-                        result,_ = await self.rpc.getBlock(blockhash)
-                        if result:
-                            height = result.get("height")
-                            self.storagetxs.update_transaction(txid, height)
-
-            await asyncio.sleep(10)
-
-
+        unconfirmed_transactions = [
+            txid for txid in dict.fromkeys(await self.storagetxs.aio.get_unconfirmed_transactions())
+            if txid not in self.conflicted_transactions
+        ]
+        confirmed_transactions = {}
+        for index in range(0, len(unconfirmed_transactions), 100):
+            chunk = unconfirmed_transactions[index:index + 100]
+            results = await self.main.scheduler.fetch(
+                [("gettransaction", [txid]) for txid in chunk]
+            )
+            for txid, (result, error) in zip(chunk, results):
+                if result is None:
+                    if error and "non-wallet" in error:
+                        self.conflicted_transactions.add(txid)
+                elif result.get("confirmations", 0) < 0:
+                    self.conflicted_transactions.add(txid)
+                elif "blockhash" in result:
+                    confirmed_transactions[txid] = result["blockhash"]
+        if not confirmed_transactions:
+            return
+
+        headers = await self.main.headers.get_headers(confirmed_transactions.values())
+        transactions = [
+            (headers[blockhash]["height"], txid)
+            for txid, blockhash in confirmed_transactions.items() if blockhash in headers
+        ]
+        if transactions:
+            await self.storagetxs.aio.update_transactions(transactions)
+            self.main.mobile_server.broker.push("update_transactions")
 
-    async def get_block_height(self, blockhash, tx_type, category, address, txid, amount, fee, timereceived):
-        result,_ = await self.rpc.getBlock(blockhash)
-        if result:
-            height = result.get("height")
-            self.storagetxs.insert_transaction(tx_type, category, address, txid, amount, height, fee, timereceived)
 
+    async def gather_shielded_transactions(self, results):
+        tx_type = "shielded"
+        new_mobile_tx = False
+        addresses_data,_ = results[0]
+        new_transactions = await self.get_shielded_transactions(addresses_data)
+        if new_transactions:
+            txids = [data['txid'] for tx_list in new_transactions for data in tx_list]
+            stored_transactions = await self.storagetxs.aio.get_existing_transactions(txids, tx_type)
+            current_blocks = self.main.home_page.current_blocks
+            if current_blocks is None:
+                return
+            unspent = []
+            for tx_list in new_transactions:
+                for data in tx_list:
+                    if data['txid'] in stored_transactions:
+                        continue
+                    confirmations = data["confirmations"]
+                    if confirmations > 0:
+                        blocks = current_blocks - confirmations
+                    else:
+                        blocks = current_blocks
+                    unspent.append((blocks, data))
+            if not unspent:
+                return
+            blocks_info = await self.main.headers.get_headers(blocks for blocks, _ in unspent)
+            mobile_addresses = await self.storage_mobile.aio.get_addresses_list("zaddress")
+            transactions = []
+            for blocks, data in unspent:
+                block = blocks_info.get(blocks)
+                if not block:
+                    continue
+                address = data["address"]
+                if address in mobile_addresses:
+                    new_mobile_tx = True
+                transactions.append(
+                    (tx_type, "receive", address, data['txid'], data["amount"], blocks, None, block.get("time"))
+                )
 
-    async def get_transaparent_transactions(self, count, tx_from):
-        transactions,_ = await self.rpc.listTransactions(
-            count, tx_from
-        )
-        if transactions:
-            return transactions
-        return None
+            await self.storagetxs.aio.insert_transactions(transactions)
+            if new_mobile_tx:
+                self.main.mobile_server.broker.push("update_transactions")
 
 
-    async def gather_shielded_transactions(self):
-        self.app.console.event_log(f"✔: Shielded transactions")
-        tx_type = "shielded"
-        while True:
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-            new_mobile_tx = False
-            new_transactions = await self.get_shielded_transactions()
-            if new_transactions:
-                stored_transactions = self.storagetxs.get_transactions(True, "shielded")
-                for tx_list in new_transactions:
-                    for data in tx_list:
-                        txid = data['txid']
-                        confirmations = data["confirmations"]
-                        address = data["address"]
-                        category = "receive"
-                        amount = data["amount"]
-                        if confirmations > 0:
-                            blocks = self.main.home_page.current_blocks - confirmations
-                        elif confirmations == 0:
-                            blocks = self.main.home_page.current_blocks
-                        if txid not in stored_transactions:
-                            mobile_addresses = self.storage_mobile.get_addresses_list("zaddress")
-                            if address in mobile_addresses:
-                                new_mobile_tx = True
-                            asyncio.create_task(self.get_block_timestamp(blocks, tx_type, category, address, txid, amount))
-
-                if new_mobile_tx:
-                    self.main.mobile_server.broker.push("update_transactions")
-                            
-            await asyncio.sleep(10)
-
-
-    async def get_block_timestamp(self, height, tx_type, category, address, txid, amount):
-        result,_ = await self.rpc.getBlock(height)
-        if result:
-            timereceived = result.get("time")
-            self.storagetxs.insert_transaction(tx_type, category, address, txid, amount, height, None, timereceived)
-
-
-    async def get_shielded_transactions(self):
+    async def get_shielded_transactions(self, addresses_data):
         transactions_data = []
-        addresses_data,_ = await self.rpc.z_listAddresses()
         if addresses_data:
             message_address = self.storagemsgs.get_identity("address")
             if message_address:
@@ -738,8 +767,10 @@ class Transactions(Box):
                 address_items = {address_info for address_info in addresses_data}
         else:
             address_items = []
-        for address in address_items:
-            listunspent,_ = await self.rpc.z_listUnspent(address, 0)
+        results = await self.main.scheduler.fetch(
+            [("z_listunspent", [0, 9999999, True, [address]]) for address in address_items]
+        )
+        for listunspent,_ in results:
             if listunspent:
                 transactions_data.append(listunspent)
 
@@ -748,58 +779,49 @@ class Transactions(Box):
     
 
     async def update_transactions_table(self):
-        sorted_transactions = self.get_transactions(self.transactions_count, self.transactions_from)
-        for data in sorted_transactions:
-            txid = data[3]
-            self.transactions_ids.append(txid)
-        self.app.console.event_log(f"✔: Transactions list")
-        while True:
-            sorted_transactions = self.get_transactions(50, 0)
-            if sorted_transactions:
-                for data in sorted_transactions:
-                    txid = data[3]
-                    if txid not in self.transactions_ids:
-                        data = self.storagetxs.get_transaction(txid)
-                        tx_type = data[0]
-                        category = data[1]
-                        if category == "send":
-                            if tx_type == "shielded":
-                                icon = "images/tx_send_shielded.png"
-                            else:
-                                icon = "images/tx_send_transparent.png"
-                            notify_categoty = self.tr.text("notify_send")
-                        elif category == "receive":
-                            if tx_type == "shielded":
-                                icon = "images/tx_receive_shielded.png"
-                            else:
-                                icon = "images/tx_receive_transparent.png"
-                            notify_categoty = self.tr.text("notify_receive")
-
-                        address = data[2]
-                        amount = data[4]
-                        if self.settings.hidden_balances():
-                            amount = "*.********"
-                        timereceived = data[7]
-                        formatted_timereceived = datetime.fromtimestamp(timereceived).strftime("%Y-%m-%d %H:%M:%S")
-                        if self.rtl:
-                            amount = self.units.arabic_digits(str(amount))
-                            formatted_timereceived = self.units.arabic_digits(formatted_timereceived)
-                        row = {
-                            self.tr.text("column_category"): icon,
-                            self.tr.text("column_address"): address,
-                            self.tr.text("column_amount"): amount,
-                            self.tr.text("column_time"): formatted_timereceived,
-                            'TxID': txid,
-                        }
-                        self.transactions_ids.append(txid)
-                        self.add_transaction(0, row)
-                        if self.settings.notification_txs():
-                            self.notify.send_note(
-                                title=f"{notify_categoty} : {amount} BTCZ",
-                                text=f"TxID : {txid}"
-                            )
-
-            await asyncio.sleep(6)
+        sorted_transactions = await self.storagetxs.aio.get_transactions_page(50)
+        if sorted_transactions:
+            for data in sorted_transactions:
+                txid = data[3]
+                if txid not in self.transactions_ids:
+                    tx_type = data[0]
+                    category = data[1]
+                    if category == "send":
+                        if tx_type == "shielded":
+                            icon = "images/tx_send_shielded.png"
+                        else:
+                            icon = "images/tx_send_transparent.png"
+                        notify_categoty = self.tr.text("notify_send")
+                    elif category == "receive":
+                        if tx_type == "shielded":
+                            icon = "images/tx_receive_shielded.png"
+                        else:
+                            icon = "images/tx_receive_transparent.png"
+                        notify_categoty = self.tr.text("notify_receive")
+
+                    address = data[2]
+                    amount = data[4]
+                    if self.settings.hidden_balances():
+                        amount = "*.********"
+                    timereceived = data[7]
+                    formatted_timereceived = datetime.fromtimestamp(timereceived).strftime("%Y-%m-%d %H:%M:%S")
+                    if self.rtl:
+                        amount = self.units.arabic_digits(str(amount))
+                        formatted_timereceived = self.units.arabic_digits(formatted_timereceived)
+                    row = {
+                        self.tr.text("column_category"): icon,
+                        self.tr.text("column_address"): address,
+                        self.tr.text("column_amount"): amount,
+                        self.tr.text("column_time"): formatted_timereceived,
+                        'TxID': txid,
+                    }
+                    self.transactions_ids.add(txid)
+                    self.add_transaction(0, row)
+                    if self.settings.notification_txs():
+                        self.notify.send_note(
+                            title=f"{notify_categoty} : {amount} BTCZ",
+                            text=f"TxID : {txid}"
+                        )
 
 
     def show_transaction_info(self, txid, address):
@@ -867,7 +889,6 @@ class Transactions(Box):
             threshold = 5  
             if last_visible_row >= total_rows - 1 - threshold:
                 self.scroll_toggle = True
-                self.transactions_from += 50
                 self.app.loop.create_task(self.get_transactions_archive())
         except Exception as e:
             print(f"Error: {e}")
@@ -876,10 +897,11 @@ class Transactions(Box):
 
     async def get_transactions_archive(self):
         try:
-            sorted_transactions = self.get_transactions(self.transactions_count, self.transactions_from)
+            sorted_transactions = await self.storagetxs.aio.get_transactions_page(self.transactions_count, self.transactions_cursor)
             if not sorted_transactions:
                 self.no_more_transactions = True
                 return
+            self.transactions_cursor = self.get_cursor(sorted_transactions)
             for data in sorted_transactions:
                 tx_type = data[0]
                 category = data[1]
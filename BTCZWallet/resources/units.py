@@ -4,6 +4,7 @@ import secrets
 from decimal import Decimal
 from datetime import datetime, timedelta, timezone
 import base64
+import zlib
 
 from nacl.secret import SecretBox
 from nacl import utils
@@ -36,17 +37,28 @@ class Units():
         return base64.urlsafe_b64decode(secret_b64)[:32]
     
     
+    def get_secret_box(self, secret_b64: str):
+        return SecretBox(self.get_secret_key_bytes(secret_b64))
+
+
     def encrypt_data(self, secret_b64, data: str) -> str:
-        key = self.get_secret_key_bytes(secret_b64)
-        box = SecretBox(key)
-        nonce = utils.random(SecretBox.NONCE_SIZE)
-        encrypted = box.encrypt(data.encode(), nonce)
-        return base64.urlsafe_b64encode(encrypted).decode()
+        return self.box_encrypt(self.get_secret_box(secret_b64), data)
     
 
     def decrypt_data(self, secret_b64, data: str) -> str:
-        key = self.get_secret_key_bytes(secret_b64)
-        box = SecretBox(key)
+        return self.box_decrypt(self.get_secret_box(secret_b64), data)
+
+
+    def box_encrypt(self, box, data: str, compress = False) -> str:
+        nonce = utils.random(SecretBox.NONCE_SIZE)
+        data = data.encode()
+        if compress:
+            data = zlib.compress(data, 6)
+        encrypted = box.encrypt(data, nonce)
+        return base64.urlsafe_b64encode(encrypted).decode()
+
+
+    def box_decrypt(self, box, data: str) -> str:
         encrypted = base64.urlsafe_b64decode(data)
         return box.decrypt(encrypted).decode()
     
@@ -25,9 +25,38 @@ from ..framework import (
     Os, Sys, ProgressStyle, Forms, run_async, Win32, Drawing
 )
 
+from .downloader import Downloader
+from .manifest import VerificationManifest
+
 
 COINGECKO_API = "https://api.coingecko.com/api/v3/coins/bitcoinz/market_chart"
 
+BINARY_FILES = [
+    'bitcoinzd.exe',
+    'bitcoinz-cli.exe',
+    'bitcoinz-tx.exe'
+]
+
+ZK_PARAMS_FILES = [
+    'sprout-proving.key',
+    'sprout-verifying.key',
+    'sapling-spend.params',
+    'sapling-output.params',
+    'sprout-groth16.params'
+]
+
+ZK_PARAMS_CHECKSUMS = {
+    'sapling-spend.params': (
+        47958396, "8e48ffd23abb3a5fd9c5589204f32d9c31285a04b78096ba40a79b75677efc13"
+    ),
+    'sapling-output.params': (
+        3592860, "2f0ebbcbb9bb0bcffe95a397e7eba89c29eb4dde6191c339db88570e3f3fb0e4"
+    ),
+    'sprout-groth16.params': (
+        725523612, "b685d700c60328498fbde589c8c7c484c722b788b265b72af448a5bf0ee55b50"
+    )
+}
+
 
 class Utils():
     def __init__(self, app:App, settings = None, units=None, tr=None):
@@ -57,6 +86,8 @@ class Utils():
         if not Os.Directory.Exists(str(self.app_logs)):
             Os.Directory.CreateDirectory(str(self.app_logs))
 
+        self.manifest = VerificationManifest(self.app)
+
 
     def get_pools_data(self):
         try:
@@ -521,15 +552,10 @@ class Utils():
         return total_size_gb
 
     def get_binary_files(self):
-        required_files = [
-            'bitcoinzd.exe',
-            'bitcoinz-cli.exe',
-            'bitcoinz-tx.exe'
-        ]
         missing_files = []
-        for file in required_files:
+        for file in BINARY_FILES:
             file_path = Os.Path.Combine(str(self.app_data), file)
-            if not Os.File.Exists(file_path):
+            if not Os.File.Exists(file_path) or not self.manifest.verify(file_path):
                 missing_files.append(file)
         return missing_files
     
@@ -551,19 +577,26 @@ class Utils():
         zk_params_path = self.get_zk_path()
         if not Os.Directory.Exists(zk_params_path):
             Os.Directory.CreateDirectory(zk_params_path)
-        required_files = [
-            'sprout-proving.key',
-            'sprout-verifying.key',
-            'sapling-spend.params',
-            'sapling-output.params',
-            'sprout-groth16.params'
-        ]
         missing_files = []
-        for file in required_files:
+        for file in ZK_PARAMS_FILES:
             file_path = Os.Path.Combine(zk_params_path, file)
-            if not Os.File.Exists(file_path):
+            expected = ZK_PARAMS_CHECKSUMS.get(file)
+            if not Os.File.Exists(file_path) or not self.manifest.verify(file_path, expected=expected):
                 missing_files.append(file)
         return missing_files, zk_params_path
+
+
+    async def verify_files(self):
+        zk_params_path = self.get_zk_path()
+        files = [(file, Os.Path.Combine(str(self.app_data), file)) for file in BINARY_FILES]
+        files += [(file, Os.Path.Combine(zk_params_path, file)) for file in ZK_PARAMS_FILES]
+        results = await asyncio.gather(*[
+            self.app.loop.run_in_executor(
+                None, self.manifest.verify, file_path, True, ZK_PARAMS_CHECKSUMS.get(file)
+            )
+            for file, file_path in files
+        ])
+        return [(file, valid) for (file, _), valid in zip(files, results)]
     
 
     def get_miner_path(self, miner):
@@ -590,6 +623,37 @@ class Utils():
         return None, url, zip_file
     
 
+    def get_downloader(self, tor_enabled = None):
+        connector = None
+        if tor_enabled:
+            torrc = self.read_torrc()
+            socks_port = torrc.get("SocksPort")
+            connector = lambda: ProxyConnector.from_url(f'socks5://127.0.0.1:{socks_port}')
+        rate_limit = 0
+        if self.settings:
+            rate_limit = int(self.settings.download_limit() or 0) * 1024
+        return Downloader(
+            self.app,
+            connector=connector,
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+            rate_limit=rate_limit,
+            manifest=self.manifest
+        )
+
+
+    def download_progress(self, label, progress_bar, text, index = 0, count = 1):
+        def update(downloaded, total):
+            if not total:
+                return
+            progress = int(((index + downloaded / total) / count) * 100)
+            if label:
+                label._impl.native.Invoke(Forms.MethodInvoker(lambda:self.update_status_label(label, text, progress)))
+                progress_bar.value = progress
+            else:
+                progress_bar._impl.native.Invoke(Forms.MethodInvoker(lambda:self.update_progress_bar(progress_bar, progress)))
+        return update
+
+
     async def fetch_tor_files(self, label, progress_bar):
         file_name = "tor-expert-bundle-windows-x86_64-15.0.3.tar.gz"
         url = "https://archive.torproject.org/tor-package-archive/torbrowser/15.0.3/"
@@ -597,57 +661,42 @@ class Utils():
         destination = Os.Path.Combine(str(self.app_data), file_name)
         text = self.tr.text("download_tor")
         try:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url + file_name, timeout=None, ssl=ssl_context) as response:
-                    if response.status == 200:
-                        total_size = int(response.headers.get('content-length', 0))
-                        self.app.console.info_log(f"File size : {self.units.format_bytes(total_size)}")
-                        chunk_size = 512
-                        downloaded_size = 0
-                        self.file_handle = open(destination, 'wb')
-                        async for chunk in response.content.iter_chunked(chunk_size):
-                            if not chunk:
-                                break
-                            self.file_handle.write(chunk)
-                            downloaded_size += len(chunk)
-                            progress = int(downloaded_size / total_size * 100)
-                            label._impl.native.Invoke(Forms.MethodInvoker(lambda:self.update_status_label(label, text, progress)))
-                            progress_bar.value = progress
-                        self.file_handle.close()
-                        self.file_handle = None
-                        await session.close()
-                        self.app.console.info_log(f"Download complete")
-                        with tarfile.open(destination, "r:gz") as tar:
-                            tar.extractall(path=self.app_data)
-
-                        tor_dir = Os.Path.Combine(str(self.app_data), "tor")
-                        tor_exe = Os.Path.Combine(tor_dir, "tor.exe")
-                        dest_tor_exe = Os.Path.Combine(str(self.app_data), "tor.exe")
-                        if Os.File.Exists(dest_tor_exe):
-                            Os.File.Delete(dest_tor_exe)
-                        Os.File.Move(tor_exe, dest_tor_exe)
-
-                        data_dir = Os.Path.Combine(str(self.app_data), "data")
-
-                        geoip_file = Os.Path.Combine(data_dir, "geoip")
-                        dest_geoip = Os.Path.Combine(str(self.app_data), "geoip")
-                        if Os.File.Exists(dest_geoip):
-                            Os.File.Delete(dest_geoip)
-                        Os.File.Move(geoip_file, dest_geoip)
-
-                        geoip6_file = Os.Path.Combine(data_dir, "geoip6")
-                        dest_geoip6 = Os.Path.Combine(str(self.app_data), "geoip6")
-                        if Os.File.Exists(dest_geoip6):
-                            Os.File.Delete(dest_geoip6)
-                        Os.File.Move(geoip6_file, dest_geoip6)
-
-                        docs_dir = Os.Path.Combine(str(self.app_data), "docs")
-                        for path in [tor_dir, data_dir, docs_dir]:
-                            if Os.Directory.Exists(path):
-                                Os.Directory.Delete(path, True)
-                        if Os.File.Exists(destination):
-                            Os.File.Delete(destination)
+            if not Os.File.Exists(destination) or not self.manifest.verify(destination):
+                await self.get_downloader().download(
+                    url + file_name, destination, self.download_progress(label, progress_bar, text)
+                )
+            self.app.console.info_log(f"Download complete")
+            with tarfile.open(destination, "r:gz") as tar:
+                tar.extractall(path=self.app_data)
+
+            tor_dir = Os.Path.Combine(str(self.app_data), "tor")
+            tor_exe = Os.Path.Combine(tor_dir, "tor.exe")
+            dest_tor_exe = Os.Path.Combine(str(self.app_data), "tor.exe")
+            if Os.File.Exists(dest_tor_exe):
+                Os.File.Delete(dest_tor_exe)
+            Os.File.Move(tor_exe, dest_tor_exe)
+
+            data_dir = Os.Path.Combine(str(self.app_data), "data")
+
+            geoip_file = Os.Path.Combine(data_dir, "geoip")
+            dest_geoip = Os.Path.Combine(str(self.app_data), "geoip")
+            if Os.File.Exists(dest_geoip):
+                Os.File.Delete(dest_geoip)
+            Os.File.Move(geoip_file, dest_geoip)
+
+            geoip6_file = Os.Path.Combine(data_dir, "geoip6")
+            dest_geoip6 = Os.Path.Combine(str(self.app_data), "geoip6")
+            if Os.File.Exists(dest_geoip6):
+                Os.File.Delete(dest_geoip6)
+            Os.File.Move(geoip6_file, dest_geoip6)
+
+            docs_dir = Os.Path.Combine(str(self.app_data), "docs")
+            for path in [tor_dir, data_dir, docs_dir]:
+                if Os.Directory.Exists(path):
+                    Os.Directory.Delete(path, True)
+            if Os.File.Exists(destination):
+                Os.File.Delete(destination)
+            self.manifest.forget(destination)
         except RuntimeError as e:
             self.app.console.error_log(f"RuntimeError caught: {e}")
         except aiohttp.ClientError as e:
@@ -663,46 +712,29 @@ class Utils():
         self.app.console.info_log(f"Downloading BitcoinZ... {url + file_name}")
         text = self.tr.text("download_binary")
         destination = Os.Path.Combine(str(self.app_data), file_name)
-        if tor_enabled:
-            torrc = self.read_torrc()
-            socks_port = torrc.get("SocksPort")
-            connector = ProxyConnector.from_url(f'socks5://127.0.0.1:{socks_port}')
-        else:
-            connector = None
         try:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(url + file_name, timeout=None, ssl=ssl_context) as response:
-                    if response.status == 200:
-                        total_size = int(response.headers.get('content-length', 0))
-                        self.app.console.info_log(f"File size : {self.units.format_bytes(total_size)}")
-                        chunk_size = 512
-                        downloaded_size = 0
-                        self.file_handle = open(destination, 'wb')
-                        async for chunk in response.content.iter_chunked(chunk_size):
-                            if not chunk:
-                                break
-                            self.file_handle.write(chunk)
-                            downloaded_size += len(chunk)
-                            progress = int(downloaded_size / total_size * 100)
-                            label._impl.native.Invoke(Forms.MethodInvoker(lambda:self.update_status_label(label, text, progress)))
-                            progress_bar.value = progress
-                        self.file_handle.close()
-                        self.file_handle = None
-                        await session.close()
-                        self.app.console.info_log(f"Download complete")
-                        with zipfile.ZipFile(destination, 'r') as zip_ref:
-                            zip_ref.extractall(self.app_data)
-                        extracted_folder = Os.Path.Combine(str(self.app_data), "bitcoinz-e90047d4ae65")
-                        bin_folder = Os.Path.Combine(extracted_folder, "bin")
-                        for exe_file in ["bitcoinzd.exe", "bitcoinz-cli.exe", "bitcoinz-tx.exe"]:
-                            src = Os.Path.Combine(bin_folder, exe_file)
-                            dest = Os.Path.Combine(str(self.app_data), exe_file)
-                            if Os.File.Exists(src):
-                                if not Os.File.Exists(dest):
-                                    Os.File.Move(src, dest)
-                        Os.Directory.Delete(extracted_folder, True)
-                        Os.File.Delete(destination)
+            if not Os.File.Exists(destination) or not self.manifest.verify(destination):
+                await self.get_downloader(tor_enabled).download(
+                    url + file_name, destination, self.download_progress(label, progress_bar, text)
+                )
+            self.app.console.info_log(f"Download complete")
+            with zipfile.ZipFile(destination, 'r') as zip_ref:
+                zip_ref.extractall(self.app_data)
+            extracted_folder = Os.Path.Combine(str(self.app_data), "bitcoinz-e90047d4ae65")
+            bin_folder = Os.Path.Combine(extracted_folder, "bin")
+            for exe_file in BINARY_FILES:
+                src = Os.Path.Combine(bin_folder, exe_file)
+                dest = Os.Path.Combine(str(self.app_data), exe_file)
+                if Os.File.Exists(src):
+                    if Os.File.Exists(dest):
+                        if self.manifest.verify(dest):
+                            continue
+                        Os.File.Delete(dest)
+                    Os.File.Move(src, dest)
+                    self.manifest.record(dest, self.manifest.hash_file(dest))
+            Os.Directory.Delete(extracted_folder, True)
+            Os.File.Delete(destination)
+            self.manifest.forget(destination)
         except ProxyConnectionError:
             self.app.console.error_log("Proxy connection failed")
         except RuntimeError as e:
@@ -718,39 +750,17 @@ class Utils():
         self.app.console.info_log(f"Downloading Zk params... {base_url}")
         total_files = len(missing_files)
         text = self.tr.text("download_params")
-        if tor_enabled:
-            torrc = self.read_torrc()
-            socks_port = torrc.get("SocksPort")
-            connector = ProxyConnector.from_url(f'socks5://127.0.0.1:{socks_port}')
-        else:
-            connector = None
         try:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            async with aiohttp.ClientSession(connector=connector) as session:
-                for idx, file_name in enumerate(missing_files):
-                    url = base_url + file_name
-                    file_path = Os.Path.Combine(zk_params_path, file_name)
-                    self.current_download_file = file_path
-                    async with session.get(url, timeout=None, ssl=ssl_context) as response:
-                        if response.status == 200:
-                            total_size = int(response.headers.get('content-length', 0))
-                            self.app.console.info_log(f"File name : {file_name} | File size : {self.units.format_bytes(total_size)}")
-                            chunk_size = 512
-                            downloaded_size = 0
-                            self.file_handle = open(file_path, 'wb')
-                            async for chunk in response.content.iter_chunked(chunk_size):
-                                if not chunk:
-                                    break
-                                self.file_handle.write(chunk)
-                                downloaded_size += len(chunk)
-                                overall_progress = int(((idx + downloaded_size / total_size) / total_files) * 100)
-                                label._impl.native.Invoke(Forms.MethodInvoker(lambda:self.update_status_label(label, text, overall_progress)))
-                                progress_bar.value = overall_progress
-                            self.file_handle.close()
-                            self.file_handle = None
-                    self.current_download_file = None
-                await session.close()
-                self.app.console.info_log(f"Download complete")
+            downloader = self.get_downloader(tor_enabled)
+            for idx, file_name in enumerate(missing_files):
+                file_path = Os.Path.Combine(zk_params_path, file_name)
+                self.app.console.info_log(f"File name : {file_name}")
+                await downloader.download(
+                    base_url + file_name, file_path,
+                    self.download_progress(label, progress_bar, text, idx, total_files),
+                    ZK_PARAMS_CHECKSUMS.get(file_name)
+                )
+            self.app.console.info_log(f"Download complete")
         except ProxyConnectionError:
             self.app.console.error_log("Proxy connection failed")
         except RuntimeError as e:
@@ -773,41 +783,23 @@ class Utils():
         total_files = len(bootstrap_files)
         bitcoinz_path = self.get_bitcoinz_path()
         text = self.tr.text("download_bootstrap")
-        if tor_enabled:
-            torrc = self.read_torrc()
-            socks_port = torrc.get("SocksPort")
-            connector = ProxyConnector.from_url(f'socks5://127.0.0.1:{socks_port}')
-        else:
-            connector = None
         try:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            async with aiohttp.ClientSession(connector=connector) as session:
-                for idx, file_name in enumerate(bootstrap_files):
-                    file_path = Os.Path.Combine(bitcoinz_path, file_name)
-                    if Os.File.Exists(file_path):
+            downloader = self.get_downloader(tor_enabled)
+            for idx, file_name in enumerate(bootstrap_files):
+                file_path = Os.Path.Combine(bitcoinz_path, file_name)
+                if Os.File.Exists(file_path):
+                    size = await downloader.remote_size(base_url + file_name)
+                    valid = await self.app.loop.run_in_executor(
+                        None, self.manifest.verify, file_path, None, None, size
+                    )
+                    if valid:
                         continue
-                    url = base_url + file_name
-                    self.current_download_file = file_path
-                    async with session.get(url, timeout=None, ssl=ssl_context) as response:
-                        if response.status == 200:
-                            total_size = int(response.headers.get('content-length', 0))
-                            self.app.console.info_log(f"File name : {file_name} | File size : {self.units.format_bytes(total_size)}")
-                            chunk_size = 512
-                            downloaded_size = 0
-                            self.file_handle = open(file_path, 'wb')
-                            async for chunk in response.content.iter_chunked(chunk_size):
-                                if not chunk:
-                                    break
-                                self.file_handle.write(chunk)
-                                downloaded_size += len(chunk)
-                                overall_progress = int(((idx + downloaded_size / total_size) / total_files) * 100)
-                                label._impl.native.Invoke(Forms.MethodInvoker(lambda:self.update_status_label(label, text, overall_progress)))
-                                progress_bar.value = overall_progress
-                            self.file_handle.close()
-                            self.file_handle = None
-                    self.current_download_file = None
-                await session.close()
-                self.app.console.info_log(f"Download complete")
+                self.app.console.info_log(f"File name : {file_name}")
+                await downloader.download(
+                    base_url + file_name, file_path,
+                    self.download_progress(label, progress_bar, text, idx, total_files)
+                )
+            self.app.console.info_log(f"Download complete")
         except ProxyConnectionError:
             self.app.console.error_log("Proxy connection failed")
         except RuntimeError as e:
@@ -822,64 +814,43 @@ class Utils():
         self.app.console.info_log(f"Downloading {miner_folder}... {url}")
         destination = Os.Path.Combine(str(self.app_data), file_name)
         miner_dir = Os.Path.Combine(str(self.app_data), miner_folder)
-        if tor_enabled:
-            torrc = self.read_torrc()
-            socks_port = torrc.get("SocksPort")
-            connector = ProxyConnector.from_url(f'socks5://127.0.0.1:{socks_port}')
-        else:
-            connector = None
         try:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            async with aiohttp.ClientSession(connector=connector) as session:
-                async with session.get(url + file_name, timeout=None, ssl=ssl_context) as response:
-                    if response.status == 200:
-                        total_size = int(response.headers.get('content-length', 0))
-                        self.app.console.info_log(f"File size : {self.units.format_bytes(total_size)}")
-                        chunk_size = 512
-                        downloaded_size = 0
-                        self.file_handle = open(destination, 'wb')
-                        async for chunk in response.content.iter_chunked(chunk_size):
-                            if not chunk:
-                                break
-                            self.file_handle.write(chunk)
-                            downloaded_size += len(chunk)
-                            progress = int(downloaded_size / total_size * 100)
-                            progress_bar._impl.native.Invoke(Forms.MethodInvoker(lambda:self.update_progress_bar(progress_bar, progress)))
-                        self.file_handle.close()
-                        self.file_handle = None
-                        await session.close()
-                        self.app.console.info_log(f"Download complete")
-                        if miner_folder == "MiniZ":
-                            miner_name = "miniZ.exe"
-                        elif miner_folder =="Gminer":
-                            miner_name = "miner.exe"
-                        elif miner_folder == "lolMiner":
-                            miner_name = "lolMiner.exe"
-
-                        with zipfile.ZipFile(destination, 'r') as zip_ref:
-                            zip_ref.extractall(miner_dir)
-
-                        if miner_folder == "lolMiner":
-                            subdirs = [d for d in Os.Directory.GetDirectories(miner_dir)]
-                            if len(subdirs) == 1:
-                                subdir = subdirs[0]
-                                for file in Os.Directory.GetFiles(subdir):
-                                    dest_path = Os.Path.Combine(miner_dir, Os.Path.GetFileName(file))
-                                    Os.File.Move(file, dest_path)
-                                Os.Directory.Delete(subdir, True)
-
-                        for file in Os.Directory.GetFiles(miner_dir):
-                            file_name = Os.Path.GetFileName(file)
-                            if file_name != miner_name:
-                                if Os.File.Exists(file):
-                                    Os.File.Delete(file)
-
-                        if Os.File.Exists(destination):
-                            Os.File.Delete(destination)
-                            miner_selection.enabled = True
-                            setup_miner_box.remove(
-                                progress_bar
-                            )
+            await self.get_downloader(tor_enabled).download(
+                url + file_name, destination, self.download_progress(None, progress_bar, None)
+            )
+            self.app.console.info_log(f"Download complete")
+            if miner_folder == "MiniZ":
+                miner_name = "miniZ.exe"
+            elif miner_folder =="Gminer":
+                miner_name = "miner.exe"
+            elif miner_folder == "lolMiner":
+                miner_name = "lolMiner.exe"
+
+            with zipfile.ZipFile(destination, 'r') as zip_ref:
+                zip_ref.extractall(miner_dir)
+
+            if miner_folder == "lolMiner":
+                subdirs = [d for d in Os.Directory.GetDirectories(miner_dir)]
+                if len(subdirs) == 1:
+                    subdir = subdirs[0]
+                    for file in Os.Directory.GetFiles(subdir):
+                        dest_path = Os.Path.Combine(miner_dir, Os.Path.GetFileName(file))
+                        Os.File.Move(file, dest_path)
+                    Os.Directory.Delete(subdir, True)
+
+            for file in Os.Directory.GetFiles(miner_dir):
+                file_name = Os.Path.GetFileName(file)
+                if file_name != miner_name:
+                    if Os.File.Exists(file):
+                        Os.File.Delete(file)
+
+            if Os.File.Exists(destination):
+                Os.File.Delete(destination)
+                self.manifest.forget(destination)
+                miner_selection.enabled = True
+                setup_miner_box.remove(
+                    progress_bar
+                )
         except ProxyConnectionError:
             self.app.console.error_log("Proxy connection failed")
         except RuntimeError as e:
@@ -908,6 +879,7 @@ class Utils():
         for file_path in file_paths:
             if Os.File.Exists(file_path):
                 Os.File.Delete(file_path)
+            self.manifest.forget(file_path)
         self.extract_progress_status = True
         try:
             with py7zr.SevenZipFile(combined_file, mode='r') as archive:
@@ -1073,6 +1045,8 @@ timeout /t 5 /nobreak > NUL
 start "" "{excutable_file}"
 del "%~f0"
 """
+        if self.settings:
+            self.settings.flush()
         batch_path = Os.Path.Combine(str(self.app.paths.cache), 'restart_app.bat')
         with open(batch_path, "w") as file:
             file.write(batch_script)
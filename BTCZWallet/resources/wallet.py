@@ -135,9 +135,31 @@ class Wallet(Box):
         )
 
         self.app.loop.create_task(self.get_node_version())
-        self.app.loop.create_task(self.update_total_balances())
-        self.app.loop.create_task(self.update_transparent_addresses())
-        self.app.loop.create_task(self.update_shielded_addresses())
+        self.app.console.event_log(f"✔: Total balances")
+        self.main.scheduler.subscribe(
+            [
+                ("z_gettotalbalance", []),
+                ("getunconfirmedbalance", [])
+            ],
+            60, self.update_total_balances, ("block", "wallet", "balances_visibility")
+        )
+        self.app.console.event_log("✔: Sync transparent addresses")
+        self.main.scheduler.subscribe(
+            [
+                ("listaddresses", []),
+                ("listaddressgroupings", []),
+                ("listunspent", [])
+            ],
+            60, self.update_transparent_addresses, ("block", "wallet")
+        )
+        self.app.console.event_log("✔: Sync shielded addresses")
+        self.main.scheduler.subscribe(
+            [
+                ("z_listaddresses", []),
+                ("z_listunspent", [])
+            ],
+            60, self.update_shielded_addresses, ("block", "wallet")
+        )
 
 
     async def get_node_version(self):
@@ -161,143 +183,89 @@ class Wallet(Box):
         )
 
 
-    async def update_total_balances(self):
-        self.app.console.event_log(f"✔: Total balances")
-        while True:
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-            balances,_ = await self.rpc.z_getTotalBalance()
-            if balances:
-                totalbalance = self.units.format_balance(float(balances.get('total')))
-                transparentbalance = self.units.format_balance(float(balances.get('transparent')))
-                shieldedbalance = self.units.format_balance(float(balances.get('private')))
-                if self.rtl:
-                    totalbalance = self.units.arabic_digits(totalbalance)
-                    transparentbalance = self.units.arabic_digits(transparentbalance)
-                    shieldedbalance = self.units.arabic_digits(shieldedbalance)
-                if self.settings.hidden_balances():
-                    totalbalance = "*.********"
-                    transparentbalance = "*.********"
-                    shieldedbalance = "*.********"
-                js_code = f'setBalances("{totalbalance}", "{transparentbalance}", "{shieldedbalance}");'
-                self.balances_output.control.CoreWebView2.ExecuteScriptAsync(js_code)
-            
-            unconfirmed_balance,_ = await self.rpc.getUnconfirmedBalance()
-            unconfirmed = self.units.format_balance(float(unconfirmed_balance))
-            if float(unconfirmed) > 0:
-                if self.rtl:
-                    unconfirmed = self.units.arabic_digits(unconfirmed)
-                if self.settings.hidden_balances():
-                    unconfirmed = "*.********"
-            else:
-                unconfirmed = 0
-            js_unconfirmed = f'setUnconfirmedBalance("{unconfirmed}");'
-            self.balances_output.control.CoreWebView2.ExecuteScriptAsync(js_unconfirmed)
-            
-            await asyncio.sleep(4)
-
-
-    async def update_transparent_addresses(self):
-        self.app.console.event_log("✔: Sync transparent addresses")
-        address_type = "transparent"
-        while True:
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-            stored_addresses = self.addresses_storage.get_addresses(address_type=address_type)
-            stored_dict = {data[2]: data[3] for data in stored_addresses}
-
-            addresses_data,_ = await self.rpc.ListAddresses()
-            addresses_group,_ = await self.rpc.listAddressgroupPings()
-
-            global_balance_change = False
-
-            for group in addresses_group:
-                for entry in group:
-                    address = entry[0]
-                    balance = entry[1] if len(entry) > 1 else 0.0
-
-                    if address not in addresses_data:
-                        is_change_address = True
-                    else:
-                        is_change_address = None
-                    if address not in stored_dict:
-                        self.addresses_storage.insert_address(address_type, is_change_address, address, balance)
-                    else:
-                        old_balance = stored_dict[address]
-                        if old_balance != balance:
-                            self.addresses_storage.update_balance(address, balance)
-                            global_balance_change = True
-
-            stored_addresses = self.addresses_storage.get_addresses(address_type=address_type)
-            stored_set = {data[2] for data in stored_addresses}
-
-            for address in addresses_data:
-                if address not in stored_set:
-                    option = "insert"
-                else:
-                    option = "update"
-                await self.insert_address(address_type, address, option)
-            
-            if global_balance_change:
-                self.main.receive_page.reload_addresses()
-                self.main.mobile_server.broker.push("update_balances")
-
-            await asyncio.sleep(10)
-
+    def update_total_balances(self, results):
+        (balances,_), (unconfirmed_balance,_) = results
+        if balances:
+            totalbalance = self.units.format_balance(float(balances.get('total')))
+            transparentbalance = self.units.format_balance(float(balances.get('transparent')))
+            shieldedbalance = self.units.format_balance(float(balances.get('private')))
+            if self.rtl:
+                totalbalance = self.units.arabic_digits(totalbalance)
+                transparentbalance = self.units.arabic_digits(transparentbalance)
+                shieldedbalance = self.units.arabic_digits(shieldedbalance)
+            if self.settings.hidden_balances():
+                totalbalance = "*.********"
+                transparentbalance = "*.********"
+                shieldedbalance = "*.********"
+            js_code = f'setBalances("{totalbalance}", "{transparentbalance}", "{shieldedbalance}");'
+            self.balances_output.control.CoreWebView2.ExecuteScriptAsync(js_code)
+        
+        unconfirmed = self.units.format_balance(float(unconfirmed_balance))
+        if float(unconfirmed) > 0:
+            if self.rtl:
+                unconfirmed = self.units.arabic_digits(unconfirmed)
+            if self.settings.hidden_balances():
+                unconfirmed = "*.********"
+        else:
+            unconfirmed = 0
+        js_unconfirmed = f'setUnconfirmedBalance("{unconfirmed}");'
+        self.balances_output.control.CoreWebView2.ExecuteScriptAsync(js_unconfirmed)
 
-    async def update_shielded_addresses(self):
-        self.app.console.event_log("✔: Sync shielded addresses")
-        address_type = "shielded"
 
-        while True:
-            if self.main.import_key_toggle:
-                await asyncio.sleep(1)
-                continue
-
-            stored_addresses = self.addresses_storage.get_addresses(address_type=address_type)
-            stored_dict = {data[2]: data[3] for data in stored_addresses}
-
-            addresses_data, _ = await self.rpc.z_listAddresses()
-
-            global_balance_change = False
-
-            if addresses_data:
-                for address_info in addresses_data:
-                    if isinstance(address_info, dict):
-                        address = address_info.get("address")
-                        balance = address_info.get("balance", 0.0)
-                    else:
-                        address = address_info
-                        balance, _ = await self.rpc.z_getBalance(address)
-                    if address not in stored_dict:
-                        option = "insert"
-                        self.addresses_storage.insert_address(address_type, None, address, balance)
-                    else:
-                        option = "update"
-                        old_balance = stored_dict[address]
-                        if old_balance != balance:
-                            self.addresses_storage.update_balance(address, balance)
-                            global_balance_change = True
-
-                    await self.insert_address(address_type, address, option, balance)
-
-                if global_balance_change:
-                    self.main.receive_page.reload_addresses()
-                    self.main.mobile_server.broker.push("update_balances")
-
-            await asyncio.sleep(20)
-
-
-    async def insert_address(self, address_type, address, option, balance=None):
-        if balance is None:
-            balance, _ = await self.rpc.z_getBalance(address)
-
-        if option == "insert":
-            self.addresses_storage.insert_address(address_type, None, address, balance)
-        elif option == "update":
-            self.addresses_storage.update_balance(address, balance)
+    async def update_transparent_addresses(self, results):
+        (addresses_data,_), (addresses_group,_), (unspent,_) = results
+        if addresses_data is None or unspent is None:
+            return
+        addresses = set(addresses_data)
+        change_addresses = set()
+        for group in addresses_group or []:
+            for entry in group:
+                if entry[0] not in addresses:
+                    change_addresses.add(entry[0])
+        await self.sync_balances("transparent", addresses | change_addresses, change_addresses, unspent)
+
+
+    async def update_shielded_addresses(self, results):
+        (addresses_data,_), (unspent,_) = results
+        if addresses_data is None or unspent is None:
+            return
+        addresses = {
+            address_info.get("address") if isinstance(address_info, dict) else address_info
+            for address_info in addresses_data
+        }
+        await self.sync_balances("shielded", addresses, set(), unspent)
+
+
+    def aggregate_balances(self, unspent):
+        balances = {}
+        for data in unspent:
+            address = data.get("address")
+            if address:
+                balances[address] = balances.get(address, 0) + data.get("amount", 0)
+        return {address: round(balance, 8) for address, balance in balances.items()}
+
+
+    async def sync_balances(self, address_type, addresses, change_addresses, unspent):
+        balances = self.aggregate_balances(unspent)
+        stored_addresses = await self.addresses_storage.aio.get_addresses(address_type=address_type)
+        stored_dict = {data[2]: data[3] for data in stored_addresses}
+
+        global_balance_change = False
+        rows = []
+        for address in addresses:
+            balance = balances.get(address, 0.0)
+            if address not in stored_dict:
+                is_change_address = True if address in change_addresses else None
+                rows.append((address_type, is_change_address, address, balance))
+            elif stored_dict[address] != balance:
+                rows.append((address_type, None, address, balance))
+                global_balance_change = True
+
+        if rows:
+            await self.addresses_storage.aio.upsert_addresses(rows)
+        if global_balance_change:
+            self.main.receive_page.reload_addresses()
+            self.main.mobile_server.broker.push("update_balances")
 
 
 
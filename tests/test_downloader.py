@@ -0,0 +1,156 @@
+import asyncio
+import importlib
+import os
+import sys
+import time
+import types
+
+import pytest
+
+web = pytest.importorskip("aiohttp.web")
+test_utils = pytest.importorskip("aiohttp.test_utils")
+
+
+def load_resource(name):
+    # The resources package __init__ pulls in the Windows UI, so the
+    # modules are loaded through a bare package pointing at the same folder.
+    package = types.ModuleType("btczwallet_resources")
+    package.__path__ = [os.path.join(os.path.dirname(__file__), os.pardir, "BTCZWallet", "resources")]
+    sys.modules.setdefault(package.__name__, package)
+    return importlib.import_module(f"{package.__name__}.{name}")
+
+
+downloader = load_resource("downloader")
+
+
+SIZE = 10 * 1024 * 1024
+
+
+class Console():
+    def info_log(self, message):
+        pass
+
+    def warning_log(self, message):
+        pass
+
+    def error_log(self, message):
+        pass
+
+
+def make_app():
+    return types.SimpleNamespace(console=Console())
+
+
+def make_server(data, ranges = True, cut = None):
+    served = {"ranges": [], "bytes": 0, "cut": cut}
+
+    async def handle(request):
+        if not ranges:
+            return web.Response(body=data)
+        header = request.headers.get("Range")
+        start = request.http_range.start or 0
+        stop = request.http_range.stop if request.http_range.stop is not None else len(data)
+        if header:
+            served["ranges"].append((start, stop))
+            response = web.StreamResponse(
+                status=206,
+                headers={
+                    "Content-Range": f"bytes {start}-{stop - 1}/{len(data)}",
+                    "Content-Length": str(stop - start)
+                }
+            )
+        else:
+            response = web.StreamResponse(headers={"Content-Length": str(len(data))})
+        await response.prepare(request)
+        for offset in range(start, stop, 256 * 1024):
+            if served["cut"] and stop - start > 1 and offset - start >= served["cut"]:
+                served["cut"] = None
+                request.transport.close()
+                return response
+            chunk = data[offset:min(offset + 256 * 1024, stop)]
+            await response.write(chunk)
+            served["bytes"] += len(chunk)
+        return response
+
+    app = web.Application()
+    app.router.add_get("/file", handle)
+    return test_utils.TestServer(app), served
+
+
+async def download(server, tmp_path, **kwargs):
+    destination = str(tmp_path / "file.bin")
+    calls = []
+    started = time.monotonic()
+    await downloader.Downloader(make_app(), **kwargs).download(
+        str(server.make_url("/file")), destination, lambda done, total: calls.append(done)
+    )
+    return destination, calls, time.monotonic() - started
+
+
+def run(data, tmp_path, ranges = True, **kwargs):
+    async def main():
+        server, served = make_server(data, ranges)
+        await server.start_server()
+        try:
+            destination, calls, elapsed = await download(server, tmp_path, **kwargs)
+            return destination, served, calls, elapsed
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+def test_segmented_download(tmp_path):
+    """The file is fetched over several ranged connections."""
+    data = os.urandom(SIZE)
+    destination, served, calls, _ = run(data, tmp_path)
+    with open(destination, "rb") as file:
+        assert file.read() == data
+    assert len([r for r in served["ranges"] if r != (0, 1)]) > 1
+    assert calls[-1] == SIZE
+    assert not os.path.exists(destination + ".part")
+    assert not os.path.exists(destination + ".part.json")
+
+
+def test_resume_from_part(tmp_path):
+    """An interrupted download resumes from the .part and .part.json files."""
+    data = os.urandom(SIZE)
+    destination = str(tmp_path / "file.bin")
+
+    async def main():
+        server, served = make_server(data, cut=3 * 1024 * 1024)
+        await server.start_server()
+        try:
+            with pytest.raises(Exception):
+                await download(server, tmp_path, segments=1, retries=0)
+            assert os.path.exists(destination + ".part")
+            assert os.path.exists(destination + ".part.json")
+            served["bytes"] = 0
+            await download(server, tmp_path, segments=1)
+            return served
+        finally:
+            await server.close()
+
+    served = asyncio.run(main())
+    with open(destination, "rb") as file:
+        assert file.read() == data
+    assert served["bytes"] < SIZE
+    assert served["ranges"][-1][0] > 0
+    assert not os.path.exists(destination + ".part")
+    assert not os.path.exists(destination + ".part.json")
+
+
+def test_server_without_ranges(tmp_path):
+    """Servers that ignore Range requests are read as a single stream."""
+    data = os.urandom(SIZE)
+    destination, _, _, _ = run(data, tmp_path, ranges=False)
+    with open(destination, "rb") as file:
+        assert file.read() == data
+
+
+def test_rate_limit(tmp_path):
+    """The bandwidth cap holds the transfer to the configured rate."""
+    data = os.urandom(3 * 1024 * 1024)
+    destination, _, _, elapsed = run(data, tmp_path, rate_limit=2 * 1024 * 1024)
+    with open(destination, "rb") as file:
+        assert file.read() == data
+    assert elapsed >= 1.2